@@ -0,0 +1,60 @@
+#!/usr/bin/env python3
+"""
+Benchmark str_concat on DataFrame columns.
+
+The column-wise join is compared with the previous implementation, which
+converted a wide frame with astype(str) and joined each row with agg(axis=1).
+Run this script from the project root directory.
+"""
+
+import random
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import numpy as np
+import pandas as pd
+
+import tidystring as ts
+
+from _common import best_of, format_time, print_table
+
+ROWS = 200_000
+
+
+def main():
+    """Time row-wise and column-wise concatenation."""
+    rng = random.Random(0)
+    df = pd.DataFrame(
+        {
+            "region": [rng.choice(["north", "south", "east", "west"]) for _ in range(ROWS)],
+            "store": [f"s{rng.randint(0, 999):03d}" for _ in range(ROWS)],
+            "sku": [rng.randint(10_000, 99_999) for _ in range(ROWS)],
+        }
+    )
+    sparse = df.assign(store=df["store"].where(np.arange(ROWS) % 10 != 0))
+
+    cases = [
+        ("strings", df, ["region", "store"], {}),
+        ("strings + ints", df, ["region", "store", "sku"], {}),
+        ("10% missing, na_rep", sparse, ["region", "store"], {"na_rep": ""}),
+        ("10% missing, skip", sparse, ["region", "store"], {"na_action": "skip"}),
+    ]
+
+    rows = []
+    for name, frame, cols, kwargs in cases:
+        if kwargs:
+            old_frame = frame[cols].fillna("")
+            row_wise = lambda: old_frame.astype(str).agg("_".join, axis=1)  # noqa: E731
+        else:
+            row_wise = lambda: frame[cols].astype(str).agg("_".join, axis=1)  # noqa: E731
+        old = best_of(row_wise, number=1, repeat=1)
+        new = best_of(lambda: ts.str_concat(frame, *cols, **kwargs), number=1, repeat=3)
+        rows.append([name, format_time(old), format_time(new), f"{old / new:6.1f}x"])
+
+    print_table(rows, headers=["columns", "agg(axis=1)", "column-wise", "speedup"])
+
+
+if __name__ == "__main__":
+    main()
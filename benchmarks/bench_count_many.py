@@ -0,0 +1,60 @@
+#!/usr/bin/env python3
+"""
+Benchmark str_count_many against one str_count call per pattern.
+
+Keyword features for a classifier: 300 literal words, alone and with 30
+regexes, counted over a column of short texts.
+Run this script from the project root directory.
+"""
+
+import random
+import string
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import numpy as np
+import pandas as pd
+
+import tidystring as ts
+
+from _common import best_of, format_time, print_table
+
+ROWS = 50_000
+KEYWORDS = 300
+
+
+def main():
+    """Time per-pattern and combined counting."""
+    rng = random.Random(0)
+    vocabulary = ["".join(rng.choices(string.ascii_lowercase, k=rng.randint(4, 9))) for _ in range(2_000)]
+    keywords = list(dict.fromkeys(rng.sample(vocabulary, KEYWORDS)))
+    regexes = [f"\\b{first}[a-z]{{{n}}}\\b" for first in "abcde" for n in range(3, 8)]
+    regexes += ["\\d+", "[A-Z]{2,}", "https?://\\S+", "\\b(\\w)\\w*\\1\\b", "(?i)nasa"]
+    texts = pd.Series(
+        [
+            " ".join(rng.choices(vocabulary, k=rng.randint(5, 20)))
+            + rng.choice(["", " 42", " NASA", " http://x.io"])
+            for _ in range(ROWS)
+        ]
+    )
+
+    def per_pattern(patterns):
+        return np.column_stack([ts.str_count(texts, pattern).to_numpy() for pattern in patterns])
+
+    rows = []
+    for name, patterns in [
+        (f"{len(keywords)} literals", keywords),
+        (f"{len(keywords)} literals + {len(regexes)} regexes", keywords + regexes),
+    ]:
+        assert (ts.str_count_many(texts, patterns, output="array") == per_pattern(patterns)).all(), name
+        old = best_of(lambda: per_pattern(patterns), number=1, repeat=1)
+        new = best_of(lambda: ts.str_count_many(texts, patterns, output="array"), number=1, repeat=3)
+        rows.append([name, format_time(old), format_time(new), f"{old / new:6.1f}x"])
+
+    print_table(rows, headers=["patterns", "str_count loop", "str_count_many", "speedup"])
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,53 @@
+#!/usr/bin/env python3
+"""
+Benchmark dedupe-then-broadcast execution on columns of varying cardinality.
+
+Each row-wise function is timed on a one-million-row object column with the
+given number of unique values, with deduplication forced on, forced off, and
+left to the automatic sample-based decision.
+Run this script from the project root directory.
+"""
+
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import numpy as np
+import pandas as pd
+
+import tidystring as ts
+
+from _common import best_of, format_time, print_table
+
+ROWS = 1_000_000
+CARDINALITIES = [100, 10_000, ROWS]
+
+CASES = [
+    ("str_squish", lambda x, d: ts.str_squish(x, dedupe=d)),
+    ("camel_to_snake", lambda x, d: ts.camel_to_snake(x, dedupe=d)),
+    ("str_locate_all", lambda x, d: ts.str_locate_all(x, "o", dedupe=d)),
+]
+
+
+def make_column(cardinality, seed=0):
+    """Build an object column of ROWS values drawn from cardinality strings."""
+    rng = np.random.default_rng(seed)
+    pool = np.array([f"someHostName  {i}  fooBar" for i in range(cardinality)], dtype=object)
+    return pd.Series(pool[rng.integers(0, cardinality, ROWS)], dtype=object)
+
+
+def main():
+    """Time every case at every cardinality."""
+    rows = []
+    for cardinality in CARDINALITIES:
+        column = make_column(cardinality)
+        for name, call in CASES:
+            times = [best_of(lambda: call(column, d), number=1, repeat=2) for d in (False, True, None)]
+            rows.append([name, cardinality, *map(format_time, times), f"{times[0] / times[1]:6.1f}x"])
+
+    print_table(rows, headers=["function", "uniques", "row-wise", "dedupe", "auto", "speedup"])
+
+
+if __name__ == "__main__":
+    main()
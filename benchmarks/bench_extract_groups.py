@@ -0,0 +1,76 @@
+#!/usr/bin/env python3
+"""
+Benchmark pulling several typed fields out of log lines.
+
+str_extract_groups reads every field from one match per line and converts
+whole columns to their dtypes. It is compared with one str_extract pass per
+field followed by astype, and with pandas' str.extract plus astype.
+Run this script from the project root directory.
+"""
+
+import random
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import pandas as pd
+
+import tidystring as ts
+
+from _common import best_of, format_time, print_table
+
+ROWS = 200_000
+
+FIELDS = {
+    "ip": "(\\d+\\.\\d+\\.\\d+\\.\\d+)",
+    "verb": "\\] \"([A-Z]+)",
+    "path": "\"[A-Z]+ (\\S+)",
+    "status": "\" (\\d{3}) ",
+    "size": " (\\d+)$",
+}
+PATTERN = '(?P<ip>\\d+\\.\\d+\\.\\d+\\.\\d+) - - \\[[^\\]]+\\] "(?P<verb>[A-Z]+) (?P<path>\\S+)[^"]*" (?P<status>\\d{3}) (?P<size>\\d+)$'
+SCHEMA = {"verb": "category", "status": "int", "size": "int"}
+
+
+def per_field(logs):
+    """One str_extract pass per field, then astype."""
+    frame = pd.DataFrame({name: ts.str_extract(logs, pattern) for name, pattern in FIELDS.items()})
+    return frame.astype({"verb": "category", "status": "Int64", "size": "Int64"})
+
+
+def pandas_extract(logs):
+    """pandas str.extract over all groups, then astype."""
+    return logs.str.extract(PATTERN).astype({"verb": "category", "status": "Int64", "size": "Int64"})
+
+
+def main():
+    """Time per-field, pandas and single-pass extraction."""
+    rng = random.Random(0)
+    logs = pd.Series(
+        [
+            f"10.0.{rng.randint(0, 255)}.{rng.randint(0, 255)} - - [10/Oct/2024:13:55:36 +0000] "
+            f'"{rng.choice(["GET", "POST", "PUT"])} /items/{rng.randint(1, 99999)} HTTP/1.1" '
+            f"{rng.choice([200, 201, 404, 500])} {rng.randint(100, 99999)}"
+            for _ in range(ROWS)
+        ]
+    )
+
+    expected = per_field(logs)
+    rows = []
+    baseline = None
+    for name, func in [
+        ("str_extract per field", lambda: per_field(logs)),
+        ("pandas str.extract", lambda: pandas_extract(logs)),
+        ("str_extract_groups", lambda: ts.str_extract_groups(logs, PATTERN, SCHEMA)),
+    ]:
+        assert func().astype(str).equals(expected.astype(str)), name
+        seconds = best_of(func, number=1, repeat=3)
+        baseline = baseline or seconds
+        rows.append([name, format_time(seconds), f"{baseline / seconds:6.1f}x"])
+
+    print_table(rows, headers=["method", "time", "speedup"])
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,58 @@
+#!/usr/bin/env python3
+"""
+Benchmark multi-keyword detection against a re_word_list alternation.
+
+Each row times str_detect with a re_word_list pattern and str_detect_any with
+the same keywords in whole-word mode, on the same lines of text.
+Run this script from the project root directory.
+"""
+
+import random
+import string as _string
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import tidystring as ts
+
+from _common import best_of, format_time, print_table
+
+ROWS = 2_000
+KEYWORD_COUNTS = [10, 100, 1_000, 5_000]
+
+
+def make_words(n, rng):
+    """Generate n distinct random lowercase words."""
+    words = set()
+    while len(words) < n:
+        words.add("".join(rng.choice(_string.ascii_lowercase) for _ in range(rng.randint(4, 9))))
+    return sorted(words)
+
+
+def make_lines(n, vocabulary, rng):
+    """Generate n lines of twelve words each."""
+    return [" ".join(rng.choice(vocabulary) for _ in range(12)) for _ in range(n)]
+
+
+def main():
+    """Time both approaches for growing keyword lists."""
+    rng = random.Random(0)
+    vocabulary = make_words(20_000, rng)
+    lines = make_lines(ROWS, vocabulary, rng)
+    rows = []
+    for count in KEYWORD_COUNTS:
+        keywords = rng.sample(vocabulary, count)
+        pattern = ts.re_word_list(keywords)
+        matcher = ts.KeywordMatcher(keywords, whole_word=True)
+        assert ts.str_detect(lines, pattern) == ts.str_detect_any(lines, matcher)
+
+        regex = best_of(lambda: ts.str_detect(lines, pattern), number=1, repeat=3)
+        automaton = best_of(lambda: ts.str_detect_any(lines, matcher), number=1, repeat=3)
+        rows.append([count, format_time(regex), format_time(automaton), f"{regex / automaton:6.1f}x"])
+
+    print_table(rows, headers=["keywords", "re_word_list", "str_detect_any", "speedup"])
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,70 @@
+#!/usr/bin/env python3
+"""
+Benchmark the list-native backend against pandas and report crossover points.
+
+For each function and list size, the same call is timed with the native
+backend and with pandas forced (native_list_threshold=0). The crossover is the
+smallest measured size at which pandas wins; the report ends with a
+set_config call using the largest size below it as the threshold.
+Run this script from the project root directory.
+"""
+
+import random
+import string
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import tidystring as ts
+
+from _common import best_of, format_time, print_table
+
+SIZES = [10, 100, 1_000, 10_000, 100_000]
+
+CASES = [
+    ("str_detect", lambda x: ts.str_detect(x, "ab")),
+    ("str_replace", lambda x: ts.str_replace(x, "a", "b")),
+    ("str_count", lambda x: ts.str_count(x, "a")),
+    ("str_split", lambda x: ts.str_split(x, " ")),
+    ("str_trim", lambda x: ts.str_trim(x)),
+    ("str_length", lambda x: ts.str_length(x)),
+    ("str_to_lower", lambda x: ts.str_to_lower(x)),
+    ("str_extract", lambda x: ts.str_extract(x, "([A-Z]\\w+)")),
+    ("str_squish", lambda x: ts.str_squish(x)),
+]
+
+
+def random_strings(n, length=40, seed=0):
+    """Generate n random strings of letters and spaces."""
+    rng = random.Random(seed)
+    alphabet = string.ascii_letters + "   "
+    return ["".join(rng.choice(alphabet) for _ in range(length)) for _ in range(n)]
+
+
+def main():
+    """Time every case at every size and print a crossover report."""
+    data = {n: random_strings(n) for n in SIZES}
+    rows, thresholds = [], {}
+    for name, call in CASES:
+        threshold, pandas_won = 0, False
+        for n in SIZES:
+            number = max(1, 20_000 // n)
+            native = best_of(lambda: call(data[n]), number=number, repeat=3)
+            with ts.config_context(native_list_threshold=0):
+                pandas = best_of(lambda: call(data[n]), number=number, repeat=3)
+            if pandas < native:
+                pandas_won = True
+            elif not pandas_won:
+                threshold = n
+            rows.append([name, n, format_time(native), format_time(pandas), f"{pandas / native:6.1f}x"])
+        thresholds[name] = threshold
+
+    print_table(rows, headers=["function", "size", "native", "pandas", "speedup"])
+    print()
+    print("Suggested thresholds (largest size where native still wins):")
+    print(f"ts.set_config(native_list_thresholds={thresholds})")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,74 @@
+#!/usr/bin/env python3
+"""
+Benchmark the literal-pattern fast path against the regex engine.
+
+Each call is timed with a plain or anchored literal pattern (which tidystring
+routes to str operations) and with the same pattern wrapped in a non-capturing
+group, which has identical semantics but forces the regex engine.
+Run this script from the project root directory.
+"""
+
+import random
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import pandas as pd
+
+import tidystring as ts
+
+from _common import best_of, format_time, print_table
+
+ROWS = 100_000
+
+
+def _regex(pattern):
+    """Wrap a pattern so it is no longer recognized as a literal."""
+    if pattern.startswith("^"):
+        return "^(?:" + pattern[1:] + ")"
+    if pattern.endswith("$"):
+        return "(?:" + pattern[:-1] + ")$"
+    return "(?:" + pattern + ")"
+
+
+CASES = [
+    ("str_detect", "error", lambda x, p: ts.str_detect(x, p)),
+    ("str_detect", "^GET", lambda x, p: ts.str_detect(x, p)),
+    ("str_detect", "\\.html$", lambda x, p: ts.str_detect(x, p)),
+    ("str_replace", "error", lambda x, p: ts.str_replace(x, p, "ERR", regex=True)),
+    ("str_remove", ", ", lambda x, p: ts.str_remove(x, p, regex=True)),
+    ("str_count", ", ", lambda x, p: ts.str_count(x, p)),
+    ("str_split", ", ", lambda x, p: ts.str_split(x, p)),
+]
+
+
+def make_lines(n, seed=0):
+    """Generate synthetic log lines."""
+    rng = random.Random(seed)
+    verbs = ["GET", "POST", "PUT"]
+    words = ["alpha", "beta", "error", "gamma", "delta"]
+    return [
+        f"{rng.choice(verbs)} /{rng.choice(words)}/{i}.html, status={rng.choice(words)}, "
+        + ", ".join(rng.choice(words) for _ in range(5))
+        for i in range(n)
+    ]
+
+
+def main():
+    """Time every case for list and Series input."""
+    lines = make_lines(ROWS)
+    inputs = {"list": lines, "series": pd.Series(lines)}
+    rows = []
+    for name, pattern, call in CASES:
+        for kind, data in inputs.items():
+            assert list(call(data, pattern)) == list(call(data, _regex(pattern))), (name, pattern)
+            literal = best_of(lambda: call(data, pattern), number=1, repeat=3)
+            regex = best_of(lambda: call(data, _regex(pattern)), number=1, repeat=3)
+            rows.append([name, repr(pattern), kind, format_time(regex), format_time(literal), f"{regex / literal:5.1f}x"])
+
+    print_table(rows, headers=["function", "pattern", "input", "regex", "literal", "speedup"])
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,57 @@
+#!/usr/bin/env python3
+"""
+Benchmark str_locate with output="span".
+
+Getting the start and end of the first match used to take a str_locate call
+plus a str_locate_all pass for the end position (or a regex extract). The span
+output returns both in one scan as int32 columns.
+Run this script from the project root directory.
+"""
+
+import random
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import pandas as pd
+
+import tidystring as ts
+
+from _common import best_of, format_time, print_table
+
+ROWS = 200_000
+
+
+def two_pass(series, pattern):
+    """Start from str_locate, end from the first pair of str_locate_all."""
+    starts = ts.str_locate(series, pattern)
+    ends = ts.str_locate_all(series, pattern, dedupe=False).map(lambda pairs: pairs[0][1] if pairs else -1)
+    return pd.DataFrame({"start": starts, "end": ends})
+
+
+def main():
+    """Time two-pass and single-scan span lookups."""
+    rng = random.Random(0)
+    logs = pd.Series(
+        [
+            f"{rng.choice(['GET', 'POST'])} /api/v{rng.randint(1, 3)}/items/{rng.randint(1, 99999)} "
+            f"status={rng.choice([200, 404, 500])} took {rng.randint(1, 999)}ms"
+            for _ in range(ROWS)
+        ]
+    )
+
+    rows = []
+    for name, pattern in [("literal 'status='", "status="), ("regex '\\d+ms'", "\\d+ms")]:
+        before = two_pass(logs, pattern)
+        after = ts.str_locate(logs, pattern, output="span")
+        assert before.values.tolist() == after.values.tolist(), name
+        old = best_of(lambda: two_pass(logs, pattern), number=1, repeat=3)
+        new = best_of(lambda: ts.str_locate(logs, pattern, output="span"), number=1, repeat=3)
+        rows.append([name, format_time(old), format_time(new), f"{old / new:6.1f}x"])
+
+    print_table(rows, headers=["pattern", "locate + locate_all", "span", "speedup"])
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,56 @@
+#!/usr/bin/env python3
+"""
+Benchmark str_pad on a Series with scalar and per-element widths.
+
+The scalar case is compared with the previous astype(str) plus Series.apply
+implementation; the per-element case with the DataFrame.apply(axis=1)
+workaround that array-valued widths replace.
+Run this script from the project root directory.
+"""
+
+import random
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import pandas as pd
+
+import tidystring as ts
+from tidystring import kernels
+
+from _common import best_of, format_time, print_table
+
+ROWS = 200_000
+
+
+def main():
+    """Time scalar and per-element padding."""
+    rng = random.Random(0)
+    df = pd.DataFrame(
+        {
+            "value": [str(rng.randint(0, 10 ** rng.randint(1, 8))) for _ in range(ROWS)],
+            "width": [rng.randint(4, 12) for _ in range(ROWS)],
+        }
+    )
+    values = df["value"]
+    kernel = kernels.pad(12, side="left", pad="0")
+    rows = []
+
+    old = best_of(lambda: values.astype(str).apply(kernel), number=1, repeat=3)
+    new = best_of(lambda: ts.str_pad(values, 12, side="left", pad="0"), number=1, repeat=3)
+    rows.append(["scalar width", "Series.apply", format_time(old), format_time(new), f"{old / new:5.1f}x"])
+
+    def row_wise():
+        return df.apply(lambda row: ts.str_pad(row["value"], row["width"], side="left", pad="0"), axis=1)
+
+    assert row_wise().tolist() == ts.str_pad(values, df["width"], side="left", pad="0").tolist()
+    old = best_of(row_wise, number=1, repeat=1)
+    new = best_of(lambda: ts.str_pad(values, df["width"], side="left", pad="0"), number=1, repeat=3)
+    rows.append(["per-row width", "apply(axis=1)", format_time(old), format_time(new), f"{old / new:5.1f}x"])
+
+    print_table(rows, headers=["case", "baseline", "baseline time", "str_pad", "speedup"])
+
+
+if __name__ == "__main__":
+    main()
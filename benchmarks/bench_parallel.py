@@ -0,0 +1,61 @@
+#!/usr/bin/env python3
+"""
+Benchmark process-pool execution of row-wise functions.
+
+Each row-wise function is timed serially and with n_jobs=-1 (all CPUs) on
+unique strings, so deduplication cannot help and all the work is in the kernel.
+Run this script from the project root directory.
+"""
+
+import os
+import random
+import string as _string
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import pandas as pd
+
+import tidystring as ts
+
+from _common import best_of, format_time, print_table
+
+ROWS = 400_000
+
+
+def double(match):
+    """Module-level (picklable) callback for str_search_apply."""
+    return str(int(match) * 2)
+
+
+CASES = [
+    ("str_squish", lambda x, **kw: ts.str_squish(x, **kw)),
+    ("str_wrap", lambda x, **kw: ts.str_wrap(x, 12, **kw)),
+    ("camel_to_snake", lambda x, **kw: ts.camel_to_snake(x, **kw)),
+    ("str_search_apply", lambda x, **kw: ts.str_search_apply(x, "\\d+", double, **kw)),
+]
+
+
+def make_strings(n, seed=0):
+    """Generate n unique strings mixing words, digits and camelCase."""
+    rng = random.Random(seed)
+    letters = _string.ascii_letters
+    return [f"{i}  " + "".join(rng.choice(letters) for _ in range(12)) + f"  {rng.randint(0, 999)} x" for i in range(n)]
+
+
+def main():
+    """Time serial and parallel execution of every case."""
+    series = pd.Series(make_strings(ROWS))
+    rows = []
+    for name, call in CASES:
+        serial = best_of(lambda: call(series, dedupe=False, n_jobs=1), number=1, repeat=3)
+        parallel = best_of(lambda: call(series, dedupe=False, n_jobs=-1), number=1, repeat=3)
+        rows.append([name, format_time(serial), format_time(parallel), f"{serial / parallel:5.1f}x"])
+
+    print(f"{ROWS:,} rows, {os.cpu_count()} CPUs")
+    print_table(rows, headers=["function", "serial", "n_jobs=-1", "speedup"])
+
+
+if __name__ == "__main__":
+    main()
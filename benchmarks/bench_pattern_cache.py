@@ -0,0 +1,58 @@
+#!/usr/bin/env python3
+"""
+Benchmark the compiled-pattern cache when rotating through many patterns.
+
+Python's re module keeps only a small internal cache, so cycling through more
+distinct patterns than it holds recompiles every pattern on every call. The
+tidystring cache is sized by the "pattern_cache_size" option.
+Run this script from the project root directory.
+"""
+
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import tidystring as ts
+
+from _common import best_of, format_time, print_table
+
+SIZES = [100, 1_000, 4_000]
+STRINGS = ["order-1234 shipped to warehouse 56", "invoice 987 pending", "no numbers here"]
+
+
+def make_patterns(n):
+    """Generate n distinct regex patterns."""
+    return [f"(?:id|order)-?{i}\\b|\\b{i}\\d*" for i in range(n)]
+
+
+def rotate(patterns):
+    """Run every pattern once against a short list."""
+    for pattern in patterns:
+        ts.str_detect(STRINGS, pattern)
+
+
+def main():
+    """Time one rotation with a small and a large pattern cache."""
+    rows = []
+    for size in SIZES:
+        patterns = make_patterns(size)
+        timings = {}
+        for cache_size in (64, max(SIZES)):
+            with ts.config_context(pattern_cache_size=cache_size):
+                ts.clear_pattern_cache()
+                rotate(patterns)
+                timings[cache_size] = best_of(lambda: rotate(patterns), number=1, repeat=3)
+                info = ts.pattern_cache_info()
+            hit_rate = info["hits"] / max(info["hits"] + info["misses"], 1)
+            timings[cache_size] = (timings[cache_size], hit_rate)
+        (small, small_rate), (large, large_rate) = timings[64], timings[max(SIZES)]
+        rows.append(
+            [size, format_time(small), f"{small_rate:5.1%}", format_time(large), f"{large_rate:5.1%}", f"{small / large:5.1f}x"]
+        )
+
+    print_table(rows, headers=["patterns", "cache=64", "hit rate", f"cache={max(SIZES)}", "hit rate", "speedup"])
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,68 @@
+#!/usr/bin/env python3
+"""
+Benchmark fused pipelines against chained tidystring calls.
+
+A four-step cleaning chain (trim, lower, replace, squish) is timed as separate
+Series.pipe calls and as a single Pipeline, on unique and on repetitive data.
+Run this script from the project root directory.
+"""
+
+import random
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import pandas as pd
+
+import tidystring as ts
+
+from _common import best_of, format_time, print_table
+
+ROWS = 200_000
+
+PIPELINE = ts.Pipeline().str_trim().str_to_lower().str_replace("-", " ").str_squish()
+
+
+def eager(series):
+    """Run the cleaning steps as separate calls."""
+    return (
+        series.pipe(ts.str_trim)
+        .pipe(ts.str_to_lower)
+        .pipe(ts.str_replace, "-", " ")
+        .pipe(ts.str_squish, dedupe=False)
+    )
+
+
+def make_strings(n, unique, seed=0):
+    """Generate n messy strings drawn from `unique` distinct values."""
+    rng = random.Random(seed)
+    words = ["Alpha", "BETA", "gamma", "Delta-Echo", "foxtrot"]
+    values = [f"  {rng.choice(words)}-{i}   {rng.choice(words)} " for i in range(unique)]
+    return [values[rng.randrange(unique)] for _ in range(n)]
+
+
+def main():
+    """Time eager and fused execution for unique and repetitive input."""
+    rows = []
+    for label, unique in (("unique", ROWS), ("repetitive", 1_000)):
+        series = pd.Series(make_strings(ROWS, unique))
+        assert eager(series).tolist() == PIPELINE(series).tolist()
+        eager_time = best_of(lambda: eager(series), number=1, repeat=3)
+        fused_time = best_of(lambda: PIPELINE(series, dedupe=False), number=1, repeat=3)
+        dedupe_time = best_of(lambda: PIPELINE(series, dedupe=True), number=1, repeat=3)
+        rows.append(
+            [
+                label,
+                format_time(eager_time),
+                format_time(fused_time),
+                format_time(dedupe_time),
+                f"{eager_time / min(fused_time, dedupe_time):5.1f}x",
+            ]
+        )
+
+    print_table(rows, headers=["input", "chained calls", "pipeline", "pipeline+dedupe", "best speedup"])
+
+
+if __name__ == "__main__":
+    main()
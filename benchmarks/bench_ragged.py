@@ -0,0 +1,73 @@
+#!/usr/bin/env python3
+"""
+Benchmark the ragged output of str_locate_all and str_split.
+
+For each call the time and the memory held by the result are compared between
+the default list output and output="ragged".
+Run this script from the project root directory.
+"""
+
+import random
+import sys
+import tracemalloc
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import pandas as pd
+
+import tidystring as ts
+
+from _common import best_of, format_time, print_table
+
+ROWS = 200_000
+
+
+def retained_bytes(func):
+    """Return the memory still allocated by func's result after it returns."""
+    tracemalloc.start()
+    result = func()  # noqa: F841
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return size
+
+
+def main():
+    """Time and measure list and ragged results."""
+    rng = random.Random(0)
+    levels = ["INFO", "WARN", "ERROR"]
+    logs = pd.Series(
+        [
+            f"{rng.choice(levels)} req={rng.randint(1, 10**6)} took {rng.randint(1, 999)}ms "
+            f"from 10.0.{rng.randint(0, 255)}.{rng.randint(0, 255)}"
+            for _ in range(ROWS)
+        ]
+    )
+
+    cases = [
+        ("str_locate_all(\\d+)", lambda output: ts.str_locate_all(logs, "\\d+", dedupe=False, output=output)),
+        ("str_split(' ')", lambda output: ts.str_split(logs, " ", output=output)),
+    ]
+
+    rows = []
+    for name, call in cases:
+        assert call("ragged").tolist() == call("list").tolist(), name
+        list_time = best_of(lambda: call("list"), number=1, repeat=3)
+        ragged_time = best_of(lambda: call("ragged"), number=1, repeat=3)
+        list_mb = retained_bytes(lambda: call("list")) / 1e6
+        ragged_mb = retained_bytes(lambda: call("ragged")) / 1e6
+        rows.append(
+            [
+                name,
+                format_time(list_time),
+                format_time(ragged_time),
+                f"{list_mb:7.1f} MB",
+                f"{ragged_mb:7.1f} MB",
+            ]
+        )
+
+    print_table(rows, headers=["call", "list time", "ragged time", "list memory", "ragged memory"])
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,92 @@
+#!/usr/bin/env python3
+"""
+Benchmark read_lines with byte-level prefiltering against decoding every line.
+
+A 2M-line access log is searched for rare lines (a literal and a regex), and
+a field is extracted from the lines found. "decode all" reads the file into a
+Series and filters it with str_detect; read_lines filters the memory-mapped
+bytes first and decodes only the matching lines. Each run is a fresh process
+so its peak RSS can be measured.
+Run this script from the project root directory.
+"""
+
+import random
+import resource
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import pandas as pd
+
+import tidystring as ts
+
+from _common import format_time, print_table
+
+LINES = 2_000_000
+
+SEARCHES = {
+    "literal": ("timeout", "took (\\d+)ms"),
+    "regex": ("\\s5\\d\\d\\s", "\\s(5\\d\\d)\\s"),
+}
+
+
+def write_log(path):
+    """Write a synthetic access log, in which about 1% of lines time out."""
+    rng = random.Random(0)
+    with open(path, "w") as f:
+        for i in range(LINES):
+            status = rng.choice([200] * 97 + [404, 500, 503])
+            suffix = " timeout" if rng.random() < 0.01 else ""
+            f.write(f"10.0.{i % 256}.{i % 97} GET /api/v1/items/{i} {status} took {rng.randint(1, 999)}ms{suffix}\n")
+
+
+def run(mode, search, path):
+    """Filter and extract in one mode; return (matches, seconds, peak RSS in MB)."""
+    pattern, extract = SEARCHES[search]
+    start = time.perf_counter()
+    if mode == "decode":
+        with open(path) as f:
+            lines = pd.Series(f.read().splitlines())
+        found = ts.str_extract(lines[ts.str_detect(lines, pattern)], extract)
+    else:
+        with ts.read_lines(path) as lines:
+            found = pd.concat(lines.filter(pattern).apply(ts.str_extract, extract))
+    elapsed = time.perf_counter() - start
+    return len(found), elapsed, resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+
+
+def main():
+    """Run each mode and search in a fresh process and compare."""
+    with tempfile.TemporaryDirectory() as tmp:
+        path = Path(tmp) / "access.log"
+        write_log(path)
+
+        rows = []
+        for search in SEARCHES:
+            counts = set()
+            times = {}
+            for mode in ["decode", "read_lines"]:
+                output = subprocess.run(
+                    [sys.executable, __file__, mode, search, str(path)], capture_output=True, text=True, check=True
+                ).stdout.split()
+                counts.add(int(output[0]))
+                times[mode] = float(output[1])
+                label = "decode all" if mode == "decode" else "read_lines + filter"
+                rows.append([search, label, output[0], format_time(float(output[1])), f"{float(output[2]):7.0f} MB"])
+            assert len(counts) == 1, counts
+            rows[-1].append(f"{times['decode'] / times['read_lines']:6.1f}x")
+            rows[-2].append("")
+
+    print(f"{LINES:,} lines")
+    print_table(rows, headers=["search", "mode", "matches", "time", "peak RSS", "speedup"])
+
+
+if __name__ == "__main__":
+    if len(sys.argv) == 4:
+        print(*run(*sys.argv[1:]))
+    else:
+        main()
@@ -0,0 +1,48 @@
+#!/usr/bin/env python3
+"""
+Benchmark str_search_recase with memoized identifier conversions.
+
+Log-like texts reuse a vocabulary of 500 camelCase identifiers. The same
+conversion without the memo is run through str_search_apply.
+Run this script from the project root directory.
+"""
+
+import random
+import string
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import pandas as pd
+
+import tidystring as ts
+from tidystring import kernels
+
+from _common import best_of, format_time, print_table
+
+ROWS = 100_000
+
+
+def main():
+    """Time per-match conversion against memoized conversion."""
+    rng = random.Random(0)
+    lower, upper = string.ascii_lowercase, string.ascii_uppercase
+    identifiers = ["".join(rng.choices(lower, k=4) + [rng.choice(upper)] + rng.choices(lower, k=3)) for _ in range(500)]
+    texts = pd.Series([" ".join(rng.choices(identifiers, k=12)) for _ in range(ROWS)])
+
+    rows = []
+    for case in ["snakecase", "camelcase", "kebabcase", "constantcase"]:
+        func = kernels._RECASE[case]
+        plain = lambda: ts.str_search_apply(texts, "\\w+", func, dedupe=False)
+        memo = lambda: ts.str_search_recase(texts, "\\w+", case, dedupe=False)
+        assert plain().tolist() == memo().tolist(), case
+        old = best_of(plain, number=1, repeat=3)
+        new = best_of(memo, number=1, repeat=3)
+        rows.append([case, format_time(old), format_time(new), f"{old / new:6.1f}x"])
+
+    print_table(rows, headers=["case", "per match", "memoized", "speedup"])
+
+
+if __name__ == "__main__":
+    main()
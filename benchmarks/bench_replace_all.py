@@ -0,0 +1,61 @@
+#!/usr/bin/env python3
+"""
+Benchmark str_replace_all against one str_replace call per pattern.
+
+Mappings of growing size are applied to a Series of text, either with
+successive str_replace calls or with a single str_replace_all call.
+Run this script from the project root directory.
+"""
+
+import random
+import string as _string
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import pandas as pd
+
+import tidystring as ts
+
+from _common import best_of, format_time, print_table
+
+ROWS = 20_000
+MAPPING_SIZES = [10, 50, 200]
+
+
+def make_words(n, rng):
+    """Generate n distinct random lowercase words."""
+    words = set()
+    while len(words) < n:
+        words.add("".join(rng.choice(_string.ascii_lowercase) for _ in range(rng.randint(4, 8))))
+    return sorted(words)
+
+
+def sequential(series, replacements):
+    """Apply each replacement in turn."""
+    for pattern, replacement in replacements.items():
+        series = ts.str_replace(series, pattern, replacement)
+    return series
+
+
+def main():
+    """Time both approaches for growing mappings."""
+    rng = random.Random(0)
+    vocabulary = make_words(2_000, rng)
+    series = pd.Series([" ".join(rng.choice(vocabulary) for _ in range(10)) for _ in range(ROWS)])
+    rows = []
+    for size in MAPPING_SIZES:
+        # Targets are upper-case, so no replacement can feed another
+        replacements = {word: word.upper() for word in rng.sample(vocabulary, size)}
+        assert sequential(series, replacements).tolist() == ts.str_replace_all(series, replacements).tolist()
+
+        seq = best_of(lambda: sequential(series, replacements), number=1, repeat=3)
+        combined = best_of(lambda: ts.str_replace_all(series, replacements, dedupe=False), number=1, repeat=3)
+        rows.append([size, format_time(seq), format_time(combined), f"{seq / combined:5.1f}x"])
+
+    print_table(rows, headers=["patterns", "str_replace x n", "str_replace_all", "speedup"])
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,69 @@
+#!/usr/bin/env python3
+"""
+Benchmark the scalar fast path against the pandas round-trip.
+
+Each tidystring function is timed on a single string, once through the public
+function (native ``str``/``re`` kernel) and once through the legacy route of
+wrapping the string in a one-element Series and unpacking the result.
+Run this script from the project root directory.
+"""
+
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import tidystring as ts
+from tidystring.handlers import _series_intake, _string_intake, _string_output
+
+from _common import best_of, format_time, print_table
+
+TEXT = "  The quick brown fox jumps over the lazy dogWalker  "
+
+
+def _legacy(method, *args, **kwargs):
+    def run():
+        string, str_type = _string_intake(TEXT)
+        return _string_output(getattr(string, method)(*args, **kwargs), str_type)
+
+    return run
+
+
+def _legacy_apply(kernel):
+    def run():
+        string, str_type = _series_intake(TEXT)
+        return _string_output(string.apply(kernel), str_type)
+
+    return run
+
+
+CASES = [
+    ("str_detect", lambda: ts.str_detect(TEXT, "fox"), _legacy("contains", "fox")),
+    ("str_replace", lambda: ts.str_replace(TEXT, "o", "0"), _legacy("replace", "o", "0")),
+    ("str_count", lambda: ts.str_count(TEXT, "o"), _legacy("count", "o")),
+    ("str_split", lambda: ts.str_split(TEXT, " "), _legacy("split", " ")),
+    ("str_trim", lambda: ts.str_trim(TEXT), _legacy("strip")),
+    ("str_length", lambda: ts.str_length(TEXT), _legacy("len")),
+    ("str_sub", lambda: ts.str_sub(TEXT, 2, 8), _legacy("slice", 2, 8)),
+    ("str_to_lower", lambda: ts.str_to_lower(TEXT), _legacy("lower")),
+    ("str_to_upper", lambda: ts.str_to_upper(TEXT), _legacy("upper")),
+    ("str_startswith", lambda: ts.str_startswith(TEXT, "  The"), _legacy("startswith", "  The")),
+    ("str_squish", lambda: ts.str_squish(TEXT), _legacy_apply(ts.kernels.squish())),
+    ("camel_to_snake", lambda: ts.camel_to_snake(TEXT), _legacy_apply(ts.kernels.camel_to_snake())),
+]
+
+
+def main(number=2000):
+    """Time every case and print the per-call speedup."""
+    rows = []
+    for name, native, legacy in CASES:
+        assert native() == legacy(), name
+        native_time = best_of(native, number=number)
+        legacy_time = best_of(legacy, number=number // 10)
+        rows.append([name, format_time(native_time), format_time(legacy_time), f"{legacy_time / native_time:7.1f}x"])
+
+    print_table(rows, headers=["function", "scalar path", "series path", "speedup"])
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,68 @@
+#!/usr/bin/env python3
+"""
+Benchmark str_search_apply in batch mode against one call per match.
+
+Two vectorizable callbacks over 100k short texts: a pandas lookup table for
+2,000 product codes, and a price conversion done with NumPy arithmetic.
+Run this script from the project root directory.
+"""
+
+import random
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import numpy as np
+import pandas as pd
+
+import tidystring as ts
+
+from _common import best_of, format_time, print_table
+
+ROWS = 100_000
+
+
+def main():
+    """Time per-match callbacks against batch callbacks."""
+    rng = random.Random(0)
+    codes = pd.Series({f"SKU{i:04d}": f"product-{i}" for i in range(2_000)})
+    texts = pd.Series(
+        [
+            " ".join(f"SKU{rng.randrange(2_000):04d} at {rng.randint(1, 999)}.{rng.randint(0, 99):02d}"
+                     for _ in range(rng.randint(1, 4)))
+            for _ in range(ROWS)
+        ]
+    )
+
+    def convert(price):
+        return str(np.round(np.float64(price) * 1.08, 2))
+
+    def convert_all(prices):
+        return np.round(prices.to_numpy(float) * 1.08, 2).astype(str)
+
+    cases = [
+        ("lookup table", "SKU\\d{4}", codes.__getitem__, lambda matches: matches.map(codes)),
+        ("price arithmetic", "\\d+\\.\\d{2}", convert, convert_all),
+    ]
+
+    rows = []
+    for name, pattern, per_match, batch in cases:
+        calls = [
+            ("per match", lambda: ts.str_search_apply(texts, pattern, per_match, dedupe=False)),
+            ("per match, memo", lambda: ts.str_search_apply(texts, pattern, per_match, dedupe=False, memo=True)),
+            ("batch", lambda: ts.str_search_apply(texts, pattern, batch, batch=True)),
+            ("batch, memo", lambda: ts.str_search_apply(texts, pattern, batch, batch=True, memo=True)),
+        ]
+        expected = calls[0][1]().tolist()
+        old = best_of(calls[0][1], number=1, repeat=3)
+        for label, call in calls:
+            assert call().tolist() == expected, (name, label)
+            new = best_of(call, number=1, repeat=3)
+            rows.append([name, label, format_time(new), f"{old / new:6.1f}x"])
+
+    print_table(rows, headers=["callback", "mode", "time", "vs per match"])
+
+
+if __name__ == "__main__":
+    main()
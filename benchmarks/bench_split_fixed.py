@@ -0,0 +1,65 @@
+#!/usr/bin/env python3
+"""
+Benchmark splitting a Series into columns.
+
+str_split_fixed is compared with the pattern it replaces,
+pd.DataFrame(str_split(...).tolist()), and with pandas' own
+Series.str.split(expand=True). Peak memory is measured with tracemalloc.
+Run this script from the project root directory.
+"""
+
+import random
+import sys
+import tracemalloc
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import pandas as pd
+
+import tidystring as ts
+
+from _common import best_of, format_time, print_table
+
+ROWS = 500_000
+
+
+def peak_bytes(func):
+    """Return the peak memory allocated while func runs."""
+    tracemalloc.start()
+    func()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return peak
+
+
+def main():
+    """Time and measure each way of splitting into columns."""
+    rng = random.Random(0)
+    keys = pd.Series(
+        [
+            f"{rng.choice(['us', 'eu', 'apac'])}|store{rng.randint(0, 999)}|{rng.randint(0, 99999)}"
+            if rng.random() > 0.05
+            else "unknown"
+            for _ in range(ROWS)
+        ]
+    )
+
+    candidates = [
+        ("DataFrame(str_split().tolist())", lambda: pd.DataFrame(ts.str_split(keys, "\\|").tolist())),
+        ("Series.str.split(expand=True)", lambda: keys.str.split("|", n=2, expand=True)),
+        ("str_split_fixed", lambda: ts.str_split_fixed(keys, "\\|", 3)),
+    ]
+
+    expected = candidates[0][1]().fillna("").values.tolist()
+    rows = []
+    for name, func in candidates:
+        assert func().fillna("").values.tolist() == expected, name
+        seconds = best_of(func, number=1, repeat=3)
+        rows.append([name, format_time(seconds), f"{peak_bytes(func) / 1e6:7.1f} MB"])
+
+    print_table(rows, headers=["method", "time", "peak memory"])
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,84 @@
+#!/usr/bin/env python3
+"""
+Benchmark streaming a log file through a pipeline against loading it whole.
+
+A 2M-line log file is cleaned with a Pipeline and the lines mentioning an
+error are counted. "load" reads every line into a Series first; "stream"
+runs the pipeline over the open file with ts.stream. Each mode runs in its
+own process so its peak RSS can be measured.
+Run this script from the project root directory.
+"""
+
+import random
+import resource
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import pandas as pd
+
+import tidystring as ts
+
+from _common import format_time, print_table
+
+LINES = 2_000_000
+
+PIPELINE = ts.Pipeline().str_trim().str_replace("  ", " ").str_to_lower()
+
+
+def write_log(path):
+    """Write a synthetic log file."""
+    rng = random.Random(0)
+    levels = ["INFO", "INFO", "INFO", "WARN", "ERROR"]
+    with open(path, "w") as f:
+        for i in range(LINES):
+            level = rng.choice(levels)
+            f.write(f"  2024-01-01T00:00:{i % 60:02d}  {level}  request {i} took {rng.randint(1, 999)}ms  \n")
+
+
+def run(mode, path, chunksize):
+    """Clean the log in one mode; return (errors, seconds, peak RSS in MB)."""
+    start = time.perf_counter()
+    with open(path) as f:
+        if mode == "load":
+            cleaned = PIPELINE(pd.Series(f.read().splitlines()))
+            errors = int(ts.str_detect(cleaned, " error ").sum())
+        else:
+            lines = (line.rstrip("\n") for line in f)
+            errors = sum(" error " in line for line in PIPELINE.stream(lines, chunksize=chunksize))
+    elapsed = time.perf_counter() - start
+    return errors, elapsed, resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+
+
+def main():
+    """Run each mode in a fresh process and compare."""
+    with tempfile.TemporaryDirectory() as tmp:
+        path = Path(tmp) / "app.log"
+        write_log(path)
+        size = path.stat().st_size / 2**20
+
+        rows = []
+        results = set()
+        for mode, chunksize in [("load", 0), ("stream", 16_384), ("stream", 65_536), ("stream", 262_144)]:
+            output = subprocess.run(
+                [sys.executable, __file__, mode, str(path), str(chunksize)], capture_output=True, text=True, check=True
+            ).stdout.split()
+            errors, elapsed, rss = int(output[0]), float(output[1]), float(output[2])
+            results.add(errors)
+            label = mode if mode == "load" else f"stream ({chunksize:,})"
+            rows.append([label, format_time(elapsed), f"{LINES / elapsed / 1e6:5.2f} M lines/s", f"{rss:7.0f} MB"])
+        assert len(results) == 1, results
+
+    print(f"{LINES:,} lines, {size:.0f} MB")
+    print_table(rows, headers=["mode", "time", "throughput", "peak RSS"])
+
+
+if __name__ == "__main__":
+    if len(sys.argv) == 4:
+        print(*run(sys.argv[1], sys.argv[2], int(sys.argv[3])))
+    else:
+        main()
@@ -0,0 +1,62 @@
+#!/usr/bin/env python3
+"""
+Benchmark str_sub and str_dup with per-element arguments.
+
+Array-valued start/end/times are compared with the DataFrame.apply(axis=1)
+workaround needed when only scalar arguments were accepted.
+Run this script from the project root directory.
+"""
+
+import random
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import pandas as pd
+
+import tidystring as ts
+
+from _common import best_of, format_time, print_table
+
+ROWS = 200_000
+
+
+def main():
+    """Time row-wise apply against array-valued arguments."""
+    rng = random.Random(0)
+    df = pd.DataFrame({"text": [f"field{rng.randint(0, 999)}=value{i}" for i in range(ROWS)]})
+    df["offset"] = ts.str_locate(df["text"], "=") + 1
+    df["end"] = [rng.choice([-3, -2, -1]) for _ in range(ROWS)]
+    df["times"] = [rng.randint(0, 3) for _ in range(ROWS)]
+
+    cases = [
+        (
+            "str_sub(start)",
+            lambda: df.apply(lambda row: ts.str_sub(row["text"], row["offset"]), axis=1),
+            lambda: ts.str_sub(df["text"], df["offset"]),
+        ),
+        (
+            "str_sub(start, end)",
+            lambda: df.apply(lambda row: row["text"][row["offset"] : row["end"]], axis=1),
+            lambda: ts.str_sub(df["text"], df["offset"], df["end"]),
+        ),
+        (
+            "str_dup(times)",
+            lambda: df.apply(lambda row: ts.str_dup(row["text"], row["times"]), axis=1),
+            lambda: ts.str_dup(df["text"], df["times"]),
+        ),
+    ]
+
+    rows = []
+    for name, row_wise, vectorized in cases:
+        assert row_wise().tolist() == vectorized().tolist(), name
+        old = best_of(row_wise, number=1, repeat=1)
+        new = best_of(vectorized, number=1, repeat=3)
+        rows.append([name, format_time(old), format_time(new), f"{old / new:6.1f}x"])
+
+    print_table(rows, headers=["call", "apply(axis=1)", "array arguments", "speedup"])
+
+
+if __name__ == "__main__":
+    main()
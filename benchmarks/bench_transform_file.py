@@ -0,0 +1,101 @@
+#!/usr/bin/env python3
+"""
+Benchmark transform_file against cleaning a whole CSV file in memory.
+
+A 1M-row CSV with three string columns and two numeric columns is cleaned
+with a pipeline per string column. "in memory" reads the whole file, cleans
+it and writes it back; transform_file does the same in chunks with a
+background writer. Each mode runs in its own process so its peak RSS can be
+measured (the parent process stays small, since children start from its
+peak RSS).
+Run this script from the project root directory.
+"""
+
+import random
+import resource
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import pandas as pd
+
+import tidystring as ts
+
+from _common import format_time, print_table
+
+ROWS = 1_000_000
+
+TRANSFORMS = {
+    "name": ts.Pipeline().str_trim().str_to_title(),
+    "email": ts.Pipeline().str_trim().str_to_lower(),
+    "city": ts.Pipeline().str_replace("-", " ").str_squish(),
+}
+
+
+def write_csv(path, chunk=100_000):
+    """Write a synthetic customer table, in chunks to keep this process small."""
+    rng = random.Random(0)
+    cities = ["new-york", "los  angeles", "san-francisco", "  chicago"]
+    for first in range(0, ROWS, chunk):
+        ids = range(first, min(first + chunk, ROWS))
+        pd.DataFrame(
+            {
+                "id": ids,
+                "name": [f"  customer {rng.randrange(10**6)} " for _ in ids],
+                "email": [f" User{i}@Example.COM" for i in ids],
+                "city": [rng.choice(cities) for _ in ids],
+                "spend": [rng.random() * 1000 for _ in ids],
+            }
+        ).to_csv(path, mode="a", header=first == 0, index=False)
+
+
+def run(mode, src, dst, chunksize):
+    """Clean the file in one mode; return (seconds, peak RSS in MB)."""
+    start = time.perf_counter()
+    if mode == "memory":
+        frame = pd.read_csv(src)
+        for column, func in TRANSFORMS.items():
+            frame[column] = func(frame[column])
+        frame.to_csv(dst, index=False)
+    else:
+        ts.transform_file(src, dst, TRANSFORMS, chunksize=chunksize)
+    elapsed = time.perf_counter() - start
+    return elapsed, resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+
+
+def main():
+    """Run each mode in a fresh process and compare."""
+    with tempfile.TemporaryDirectory() as tmp:
+        src = Path(tmp) / "customers.csv"
+        write_csv(src)
+        size = src.stat().st_size / 2**20
+
+        rows = []
+        outputs = []
+        for mode, chunksize in [("memory", 0), ("chunks", 50_000), ("chunks", 200_000)]:
+            dst = Path(tmp) / f"out_{mode}_{chunksize}.csv"
+            output = subprocess.run(
+                [sys.executable, __file__, mode, str(src), str(dst), str(chunksize)],
+                capture_output=True,
+                text=True,
+                check=True,
+            ).stdout.split()
+            elapsed, rss = float(output[0]), float(output[1])
+            outputs.append(dst.read_bytes())
+            label = "in memory" if mode == "memory" else f"transform_file ({chunksize:,})"
+            rows.append([label, format_time(elapsed), f"{ROWS / elapsed / 1e6:5.2f} M rows/s", f"{rss:7.0f} MB"])
+        assert all(output == outputs[0] for output in outputs)
+
+    print(f"{ROWS:,} rows, {size:.0f} MB")
+    print_table(rows, headers=["mode", "time", "throughput", "peak RSS"])
+
+
+if __name__ == "__main__":
+    if len(sys.argv) == 5:
+        print(*run(sys.argv[1], sys.argv[2], sys.argv[3], int(sys.argv[4])))
+    else:
+        main()
@@ -0,0 +1,54 @@
+#!/usr/bin/env python3
+"""
+Benchmark character translation against per-character regex replacement.
+
+str_dash_to_space now translates all single-character dashes in one pass; it is
+compared with the previous approach of one str_replace call per dash.
+Run this script from the project root directory.
+"""
+
+import random
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import pandas as pd
+
+import tidystring as ts
+
+from _common import best_of, format_time, print_table
+
+ROWS = 100_000
+DASHES = ["-", "_", "/", "."]
+
+
+def make_strings(n, seed=0):
+    """Generate n identifier-like strings with assorted separators."""
+    rng = random.Random(seed)
+    words = ["alpha", "beta", "gamma", "delta", "echo"]
+    return ["".join(rng.choice(words) + rng.choice(DASHES) for _ in range(4)) for _ in range(n)]
+
+
+def per_dash(data):
+    """Replace each dash with a separate str_replace call."""
+    for dash in DASHES:
+        data = ts.str_replace(data, dash, " ")
+    return data
+
+
+def main():
+    """Time both approaches for list and Series input."""
+    strings = make_strings(ROWS)
+    rows = []
+    for kind, data in (("list", strings), ("series", pd.Series(strings))):
+        assert list(per_dash(data)) == list(ts.str_dash_to_space(data, dashes=DASHES))
+        old = best_of(lambda: per_dash(data), number=1, repeat=3)
+        new = best_of(lambda: ts.str_dash_to_space(data, dashes=DASHES), number=1, repeat=3)
+        rows.append([kind, format_time(old), format_time(new), f"{old / new:5.1f}x"])
+
+    print_table(rows, headers=["input", "str_replace x 4", "str_dash_to_space", "speedup"])
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,73 @@
+#!/usr/bin/env python3
+"""
+Benchmark re_word_list with and without trie optimization.
+
+For growing word lists, this reports the time to compile each pattern and the
+time to run str_detect with it over a fixed set of lines.
+Run this script from the project root directory.
+"""
+
+import random
+import re
+import string as _string
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import tidystring as ts
+
+from _common import best_of, format_time, print_table
+
+ROWS = 2_000
+WORD_COUNTS = [100, 1_000, 10_000, 50_000]
+
+
+def make_words(n, rng):
+    """Generate n distinct random lowercase words."""
+    words = set()
+    while len(words) < n:
+        words.add("".join(rng.choice(_string.ascii_lowercase) for _ in range(rng.randint(4, 9))))
+    return sorted(words)
+
+
+def compile_time(pattern):
+    """Time a single uncached compilation of pattern."""
+    re.purge()
+    start = time.perf_counter()
+    re.compile(pattern)
+    return time.perf_counter() - start
+
+
+def main():
+    """Time compilation and matching of naive and trie patterns."""
+    rng = random.Random(0)
+    vocabulary = make_words(100_000, rng)
+    lines = [" ".join(rng.choice(vocabulary) for _ in range(12)) for _ in range(ROWS)]
+    rows = []
+    for count in WORD_COUNTS:
+        words = rng.sample(vocabulary, count)
+        naive = ts.re_word_list(words)
+        trie = ts.re_word_list(words, optimize=True)
+
+        compiled = [re.compile(naive), re.compile(trie)]
+        assert ts.str_detect(lines, compiled[0]) == ts.str_detect(lines, compiled[1])
+        match = [best_of(lambda: ts.str_detect(lines, pattern), number=1, repeat=3) for pattern in compiled]
+
+        rows.append(
+            [
+                count,
+                format_time(compile_time(naive)),
+                format_time(compile_time(trie)),
+                format_time(match[0]),
+                format_time(match[1]),
+                f"{match[0] / match[1]:6.1f}x",
+            ]
+        )
+
+    print_table(rows, headers=["words", "compile naive", "compile trie", "match naive", "match trie", "speedup"])
+
+
+if __name__ == "__main__":
+    main()
@@ -271,6 +271,11 @@ class TestStringExtraction:
         result = ts.str_split("a b c d", " ", 2)
         assert result == ["a", "b", "c d"]
 
+        # Check whitespace splitting with pattern=None
+        assert ts.str_split(" a  b ", None) == ["a", "b"]
+        assert ts.str_split(["a\tb c"], None) == [["a", "b", "c"]]
+        assert ts.str_split(pd.Series(["a  b", "c"]), None).tolist() == [["a", "b"], ["c"]]
+
 class TestStringCaseConversion:
     """Tests for string case conversion functions."""
     
@@ -632,4 +637,1117 @@ class TestUtilityFunctions:
         assert all(result == pd.Series(expected))
         assert isinstance(result, pd.Series)
 
-# Additional test cases can be added for edge cases, error handling, etc.
\ No newline at end of file
+# Additional test cases can be added for edge cases, error handling, etc.
+
+class TestScalarFastPath:
+    """Tests that single strings skip pandas but match the Series path."""
+
+    CASES = [
+        (ts.str_detect, ("o",), {}),
+        (ts.str_detect, ("WORLD",), {"case": False}),
+        (ts.str_detect, ("o.",), {"regex": False}),
+        (ts.str_replace, ("o", "X"), {}),
+        (ts.str_replace, ("o", "X"), {"n": 1}),
+        (ts.str_replace, ("[lo]+", "_"), {"regex": True}),
+        (ts.str_remove, ("l",), {}),
+        (ts.str_extract, ("(w\\w+)",), {}),
+        (ts.str_extract, ("z+",), {}),
+        (ts.str_split, (" ",), {}),
+        (ts.str_split, ("\\s",), {"maxsplit": 1}),
+        (ts.str_trim, (), {}),
+        (ts.str_length, (), {}),
+        (ts.str_sub, (1, -2), {}),
+        (ts.str_count, ("l",), {}),
+        (ts.str_locate, ("w",), {}),
+        (ts.str_locate_all, ("l",), {}),
+        (ts.str_pad, (15,), {"side": "left", "pad": "-"}),
+        (ts.str_dup, (2,), {}),
+        (ts.str_squish, (), {}),
+        (ts.str_wrap, (), {"width": 6}),
+        (ts.str_to_title, (), {}),
+        (ts.str_to_upper, (), {}),
+        (ts.str_to_lower, (), {}),
+        (ts.str_upper_cut, (), {"n": 3}),
+        (ts.str_startswith, (" he",), {}),
+        (ts.str_endswith, ("ld ",), {}),
+        (ts.camel_to_snake, (), {}),
+        (ts.snake_to_camel, (), {}),
+        (ts.str_search_apply, ("\\w+", lambda x: x[::-1]), {}),
+        (ts.str_search_recase, ("\\w+", "title"), {}),
+    ]
+
+    def test_matches_series_path(self):
+        for value in [" hello  worldWide ", "snake_case_text", ""]:
+            for func, args, kwargs in self.CASES:
+                scalar = func(value, *args, **kwargs)
+                series = func(pd.Series([value], dtype=object), *args, **kwargs).iloc[0]
+                if not isinstance(series, (list, str)) and pd.isna(series):
+                    series = None
+                assert scalar == series, f"{func.__name__}{args} differs on {value!r}"
+
+    def test_list_matches_pandas_path(self):
+        values = [" hello  worldWide ", "snake_case_text", ""]
+        for func, args, kwargs in self.CASES:
+            native = func(values, *args, **kwargs)
+            with ts.config_context(native_list_threshold=0):
+                pandas = func(values, *args, **kwargs)
+            pandas = [None if not isinstance(x, (list, str)) and pd.isna(x) else x for x in pandas]
+            assert native == pandas, f"{func.__name__}{args} differs on list input"
+
+    def test_list_threshold_config(self):
+        assert ts.get_config("native_list_threshold") > 0
+        with ts.config_context(native_list_thresholds={"str_to_upper": 1}):
+            assert ts.get_config("native_list_thresholds") == {"str_to_upper": 1}
+            assert ts.str_to_upper(["a", "b"]) == ["A", "B"]
+        assert ts.get_config("native_list_thresholds") == {}
+        # Lists holding non-strings fall back to pandas
+        result = ts.str_length(["ab", None])
+        assert result[0] == 2 and pd.isna(result[1])
+        with pytest.raises(KeyError):
+            ts.set_config(not_an_option=1)
+
+    def test_replace_n_on_series(self):
+        result = ts.str_replace(pd.Series(["hello world"]), "o", "X", n=1)
+        assert result[0] == "hellX world"
+        assert ts.str_dash_to_space("a-b-c", n=1) == "a b-c"
+
+
+class TestCategoricalExecution:
+    """Tests that categorical input is transformed once per category."""
+
+    VALUES = ["fooBar", "foo-bar", None, "fooBar", "Foo_Bar", "baz"]
+
+    def test_string_results_stay_categorical(self):
+        cat = pd.Series(pd.Categorical(self.VALUES), index=list("abcdef"), name="col")
+        obj = pd.Series(self.VALUES, index=list("abcdef"), name="col", dtype=object)
+        for func, args in [
+            (ts.str_replace, ("o", "0")),
+            (ts.str_to_lower, ()),
+            (ts.str_extract, ("(B\\w+)",)),
+            (ts.camel_to_snake, ()),
+        ]:
+            result = func(cat, *args)
+            assert isinstance(result.dtype, pd.CategoricalDtype)
+            expected = func(obj.fillna("__na__"), *args).where(obj.notna())
+            pd.testing.assert_series_equal(
+                result.astype(object), expected.astype(object), check_dtype=False, check_names=False
+            )
+
+    def test_collapsed_categories_are_merged(self):
+        cat = pd.Series(pd.Categorical(["Foo", "foo", "FOO", "bar"]))
+        result = ts.str_to_lower(cat)
+        assert list(result.cat.categories) == ["foo", "bar"]
+        assert result.tolist() == ["foo", "foo", "foo", "bar"]
+
+    def test_numeric_results_map_through_codes(self):
+        cat = pd.Series(pd.Categorical(["ab", "abab", None, "ab"]))
+        assert ts.str_detect(cat, "b").tolist() == [True, True, False, True]
+        assert ts.str_count(cat, "a").tolist()[:2] == [1, 2]
+        lengths = ts.str_length(cat)
+        assert lengths[0] == 2 and lengths[1] == 4 and pd.isna(lengths[2])
+
+    def test_runs_once_per_category(self):
+        calls = []
+
+        def record(x):
+            calls.append(x)
+            return x.upper()
+
+        cat = pd.Series(pd.Categorical(["a b"] * 100 + ["c"] * 100))
+        result = ts.str_search_apply(cat, "\\w", record)
+        assert sorted(calls) == ["a", "b", "c"]
+        assert result.iloc[0] == "A B"
+
+
+class TestDedupeExecution:
+    """Tests for dedupe-then-broadcast execution of row-wise functions."""
+
+    def test_results_match_rowwise(self):
+        series = pd.Series(["fooBar  baz", "a_b", "fooBar  baz", "x y z"] * 50)
+        for func, args in [
+            (ts.str_squish, ()),
+            (ts.camel_to_snake, ()),
+            (ts.snake_to_camel, ()),
+            (ts.str_locate_all, ("a",)),
+            (ts.str_wrap, ()),
+            (ts.str_search_recase, ("\\w+", "upper")),
+        ]:
+            deduped = func(series, *args, dedupe=True)
+            rowwise = func(series, *args, dedupe=False)
+            assert deduped.tolist() == rowwise.tolist(), func.__name__
+
+    def test_missing_values_skipped(self):
+        series = pd.Series(["fooBar  baz", None, np.nan, pd.NA, "a_b"], dtype=object)
+        with ts.config_context(parallel_min_size=0):
+            for kwargs in [{"dedupe": False}, {"dedupe": True}, {"dedupe": False, "n_jobs": 2}]:
+                result = ts.str_squish(series, **kwargs)
+                assert result[[0, 4]].tolist() == ["fooBar baz", "a_b"], kwargs
+                assert result[1:4].isna().all(), kwargs
+
+        categorical = ts.str_locate_all(series.astype("category"), "a", dedupe=False)
+        assert categorical.dtype == object and categorical[4] == [[0, 1]]
+        assert categorical[1:4].isna().all()
+
+    def test_unique_values_computed_once(self):
+        calls = []
+
+        def record(x):
+            calls.append(x)
+            return x
+
+        series = pd.Series(["a", "b", None, "a"] * 100, index=range(400, 0, -1), name="col")
+        result = ts.str_search_apply(series, "\\w", record, dedupe=True)
+        assert sorted(calls) == ["a", "b"]
+        assert result.index.equals(series.index) and result.name == "col"
+        assert pd.isna(result.iloc[2])
+
+    def test_automatic_decision(self):
+        calls = []
+
+        def record(x):
+            calls.append(x)
+            return x
+
+        repetitive = pd.Series(["a", "b"] * 1000)
+        ts.str_search_apply(repetitive, "\\w", record)
+        assert len(calls) == 2
+
+        calls.clear()
+        unique = pd.Series([f"v{i}" for i in range(2000)])
+        ts.str_search_apply(unique, "v", record)
+        assert len(calls) == 2000
+
+        calls.clear()
+        with ts.config_context(dedupe=False):
+            ts.str_search_apply(repetitive, "\\w", record)
+        assert len(calls) == 2000
+
+
+class TestLiteralFastPath:
+    """Tests that regex-free patterns give the same results as the regex engine."""
+
+    PATTERNS = ["o", "lo w", "a.b", "\\.", ", ", "^he", "^He", "ld$", "\\$5$", "^hello world$", "o+", "[lo]"]
+    STRINGS = ["hello world", "hello world\n", "a.b, c$5", "HELLO", ""]
+
+    def test_classify_pattern(self):
+        from tidystring.patterns import classify_pattern
+
+        assert classify_pattern("error") == ("literal", "error")
+        assert classify_pattern("\\.csv$") == ("suffix", ".csv")
+        assert classify_pattern("^GET ") == ("prefix", "GET ")
+        assert classify_pattern("^ok$") == ("exact", "ok")
+        assert classify_pattern("a\\$") == ("literal", "a$")
+        assert classify_pattern("\\d+")[0] == "regex"
+        assert classify_pattern("a|b")[0] == "regex"
+        assert classify_pattern("")[0] == "regex"
+
+    def test_matches_regex_engine(self):
+        import re
+
+        series = pd.Series(self.STRINGS)
+        for pattern in self.PATTERNS:
+            detected = [re.search(pattern, s) is not None for s in self.STRINGS]
+            assert ts.str_detect(self.STRINGS, pattern) == detected, pattern
+            assert ts.str_detect(series, pattern).tolist() == detected, pattern
+
+            counts = [len(re.findall(pattern, s)) for s in self.STRINGS]
+            assert ts.str_count(self.STRINGS, pattern) == counts, pattern
+
+            replaced = [re.sub(pattern, "_", s) for s in self.STRINGS]
+            assert ts.str_replace(self.STRINGS, pattern, "_", regex=True) == replaced, pattern
+            assert ts.str_replace(series, pattern, "_", regex=True).tolist() == replaced, pattern
+            assert ts.str_remove(series, pattern, regex=True).tolist() == [
+                re.sub(pattern, "", s) for s in self.STRINGS
+            ], pattern
+
+            if pattern not in ("^he", "^He", "ld$", "\\$5$", "^hello world$"):
+                split = [re.split(pattern, s) for s in self.STRINGS]
+                assert ts.str_split(self.STRINGS, pattern) == split, pattern
+                assert ts.str_split(series, pattern).tolist() == split, pattern
+
+    def test_replace_with_group_reference_uses_regex(self):
+        assert ts.str_replace("a.b", "\\.", "\\\\", regex=True) == "a\\b"
+        assert ts.str_replace("aaa", "a", "b", n=2, regex=True) == "bba"
+
+
+class TestPatternCache:
+    def test_hits_misses_and_evictions(self):
+        ts.clear_pattern_cache()
+        with ts.config_context(pattern_cache_size=2):
+            ts.compile_pattern("a+")
+            ts.compile_pattern("a+")
+            ts.compile_pattern("b+")
+            ts.compile_pattern("c+")
+            info = ts.pattern_cache_info()
+        assert info["hits"] == 1
+        assert info["misses"] == 3
+        assert info["evictions"] == 1
+        assert info["size"] == 2
+
+        ts.clear_pattern_cache()
+        assert ts.pattern_cache_info()["size"] == 0
+        assert ts.pattern_cache_info()["hits"] == 0
+
+    def test_flags_are_part_of_the_key(self):
+        import re
+
+        assert ts.compile_pattern("x", re.IGNORECASE) is not ts.compile_pattern("x")
+        assert ts.compile_pattern("x", re.IGNORECASE) is ts.compile_pattern("x", re.IGNORECASE)
+
+    def test_compiled_pattern_passthrough(self):
+        import re
+
+        compiled = re.compile("o+")
+        assert ts.compile_pattern(compiled) is compiled
+        with pytest.raises(ValueError):
+            ts.compile_pattern(compiled, re.IGNORECASE)
+
+    def test_compiled_patterns_match_strings(self):
+        import re
+
+        compiled = re.compile("o\\w")
+        for data in (SINGLE_STR, LIST_STR, SERIES_STR):
+            as_list = lambda x: x.tolist() if isinstance(x, pd.Series) else x
+            assert as_list(ts.str_detect(data, compiled)) == as_list(ts.str_detect(data, "o\\w"))
+            assert as_list(ts.str_count(data, compiled)) == as_list(ts.str_count(data, "o\\w"))
+            assert as_list(ts.str_replace(data, compiled, "_")) == as_list(
+                ts.str_replace(data, "o\\w", "_", regex=True)
+            )
+            assert as_list(ts.str_remove(data, compiled)) == as_list(ts.str_remove(data, "o\\w", regex=True))
+            assert as_list(ts.str_split(data, compiled)) == as_list(ts.str_split(data, "o\\w"))
+            assert as_list(ts.str_extract(data, compiled)) == as_list(ts.str_extract(data, "o\\w"))
+
+        assert ts.str_locate(LIST_STR, re.compile("o\\w")) == [7, 4, 7]
+        assert ts.str_locate(SERIES_STR, re.compile("o\\w")).tolist() == [7, 4, 7]
+
+    def test_case_insensitive_series_uses_cache(self):
+        series = pd.Series(["Hello", "HELLO", "bye"])
+        assert ts.str_detect(series, "h\\w+", case=False).tolist() == [True, True, False]
+        assert ts.str_count(series, "l+", flags=2).tolist() == [1, 1, 0]
+
+
+class TestKeywordMatching:
+    KEYWORDS = ["he", "she", "hers", "his"]
+    STRINGS = ["ushers", "this", "hello", "nothing", ""]
+
+    def test_matches_regex_alternation(self):
+        import re
+
+        for whole_word in (False, True):
+            for s in self.STRINGS + ["he said she", "his/hers"]:
+                expected = []
+                for i, keyword in enumerate(self.KEYWORDS):
+                    pattern = re.escape(keyword)
+                    if whole_word:
+                        pattern = f"\\b{pattern}\\b"
+                    if re.search(f"(?={pattern})", s):
+                        expected.append(i)
+                assert ts.str_which_keyword(s, self.KEYWORDS, which="all", whole_word=whole_word) == expected
+                assert ts.str_detect_any(s, self.KEYWORDS, whole_word=whole_word) == bool(expected)
+
+    def test_first_match(self):
+        assert ts.str_which_keyword("ushers", self.KEYWORDS) == 1
+        assert ts.str_which_keyword("nothing", self.KEYWORDS) == -1
+        assert ts.str_which_keyword(LIST_STR, ["test", "world"]) == [1, 0, -1]
+
+    def test_whole_word(self):
+        assert ts.str_detect_any(["cat food", "concatenate", "cat_food"], ["cat"], whole_word=True) == [
+            True,
+            False,
+            False,
+        ]
+        assert ts.str_detect(["cat food", "concatenate"], ts.re_word_list(["cat"])) == [True, False]
+
+    def test_case_insensitive(self):
+        import re
+
+        assert ts.str_detect_any(["HELLO", "bye"], ["hello"], case=False) == [True, False]
+        assert ts.str_detect_any(["HELLO", "bye"], ["hello"]) == [False, False]
+
+        # "İ" lowercases to two characters, which must not shift word boundaries
+        strings = ["\u0130x cat", "x \u0130cat \u0130", "\u0130\u0130 \u0130"]
+        keywords = ["cat", "\u0130", "i"]
+        result = ts.str_which_keyword(strings, keywords, which="all", case=False, whole_word=True)
+        expected = [[i for i, k in enumerate(keywords) if re.search(f"\\b{k}\\b", s, re.IGNORECASE)] for s in strings]
+        assert result == expected == [[0], [1, 2], [1, 2]]
+        assert ts.str_detect_any(["\u0130x cat"], ["cat"], case=False, whole_word=True) == [True]
+
+    def test_series_and_categorical(self):
+        series = pd.Series(["ushers", "this", "nothing"], index=[3, 4, 5], name="text")
+        result = ts.str_detect_any(series, self.KEYWORDS)
+        assert result.tolist() == [True, True, False]
+        assert list(result.index) == [3, 4, 5]
+
+        categorical = series.astype("category")
+        assert ts.str_detect_any(categorical, self.KEYWORDS).tolist() == [True, True, False]
+        assert ts.str_which_keyword(categorical, self.KEYWORDS).tolist() == [1, 3, -1]
+        assert ts.str_which_keyword(series, self.KEYWORDS, which="all").tolist() == [[0, 1, 2], [3], []]
+
+    def test_missing_values(self):
+        series = pd.Series(["ushers", None, np.nan, pd.NA], dtype=object)
+        matcher = ts.KeywordMatcher(self.KEYWORDS)
+        for dedupe in (False, True):
+            for result, expected in [
+                (ts.str_detect_any(series, self.KEYWORDS, dedupe=dedupe), True),
+                (ts.str_detect(series, matcher), True),
+                (ts.str_which_keyword(series, self.KEYWORDS, dedupe=dedupe), 1),
+                (ts.str_which_keyword(series, self.KEYWORDS, which="all", dedupe=dedupe), [0, 1, 2]),
+                (ts.str_which_keyword(series.astype("category"), matcher, which="all", dedupe=dedupe), [0, 1, 2]),
+            ]:
+                assert result[0] == expected and result[1:].isna().all()
+
+    def test_prebuilt_matcher(self):
+        import pickle
+
+        matcher = ts.KeywordMatcher(self.KEYWORDS, whole_word=True)
+        assert ts.str_detect(["he is", "ushers"], matcher) == [True, False]
+        assert ts.str_detect_any(["he is", "ushers"], matcher) == [True, False]
+        assert pickle.loads(pickle.dumps(matcher)).findall("she and he") == [0, 1]
+
+    def test_invalid_arguments(self):
+        with pytest.raises(ValueError):
+            ts.KeywordMatcher(["a", ""])
+        with pytest.raises(ValueError):
+            ts.str_which_keyword("abc", ["a"], which="last")
+
+
+class TestWordListTrie:
+    WORDS = ["cat", "cats", "car", "dog", "do", "a.b", "x-y", "e"]
+
+    def test_default_is_unchanged(self):
+        assert ts.re_word_list(["cat", "dog", "bird"]) == "\\b(cat|dog|bird)\\b"
+
+    def test_optimized_pattern(self):
+        assert ts.re_word_list(["cat", "cats", "car", "dog"], optimize=True) == "\\b((?:ca(?:ts?|r)|dog))\\b"
+        assert ts.re_word_list(["a", "b", "c"], optimize=True) == "\\b([abc])\\b"
+
+    def test_optimized_matches_same_words(self):
+        import re
+
+        naive = re.compile(ts.re_word_list(self.WORDS))
+        trie = re.compile(ts.re_word_list(self.WORDS, optimize=True))
+        for word in self.WORDS:
+            assert trie.fullmatch(word)
+        texts = ["the cats", "a cat", "concat", "a.b c", "x-y!", "do it", "dot", "e", "ee", ""]
+        assert [bool(trie.search(t)) for t in texts] == [bool(naive.search(t)) for t in texts]
+        assert ts.str_extract("my cats", ts.re_word_list(self.WORDS, optimize=True)) == "cats"
+
+
+def _double_digits(match):
+    return str(int(match) * 2)
+
+
+class TestParallelExecution:
+    STRINGS = ["  helloWorld  ", "ab12cd34", "someVariableName", "x  y"] * 20
+
+    def test_matches_serial_results(self):
+        values = self.STRINGS
+        series = pd.Series(values, index=range(100, 100 + len(values)), name="text")
+        calls = [
+            lambda x, **kw: ts.str_squish(x, **kw),
+            lambda x, dedupe=None, **kw: ts.str_pad(x, 20, **kw),
+            lambda x, **kw: ts.camel_to_snake(x, **kw),
+            lambda x, **kw: ts.str_locate_all(x, "o", **kw),
+            lambda x, **kw: ts.str_search_apply(x, "\\d+", _double_digits, **kw),
+            lambda x, **kw: ts.str_search_recase(x, "[a-z]+", "upper", **kw),
+        ]
+        with ts.config_context(parallel_min_size=0):
+            for call in calls:
+                for dedupe in (False, True):
+                    expected = call(series, dedupe=dedupe)
+                    result = call(series, dedupe=dedupe, n_jobs=2)
+                    pd.testing.assert_series_equal(result, expected)
+                assert call(values, n_jobs=2) == call(values)
+
+    def test_min_size_keeps_small_inputs_serial(self):
+        from tidystring.handlers import _parallel_jobs
+
+        with ts.config_context(parallel_min_size=1_000, n_jobs=4):
+            assert _parallel_jobs(999) == 1
+            assert _parallel_jobs(1_000) == 4
+            assert _parallel_jobs(1_000, n_jobs=1) == 1
+        assert _parallel_jobs(10**9) == 1
+
+    def test_unpicklable_callback_runs_serially(self):
+        with ts.config_context(parallel_min_size=0):
+            with pytest.warns(RuntimeWarning):
+                result = ts.str_search_apply(["a1", "b2"], "\\d", lambda m: m * 2, n_jobs=2)
+        assert result == ["a11", "b22"]
+
+
+class TestPipeline:
+    MESSY = ["  Product A - $19.99  ", " PRODUCT B - $25.50 ", "product   c - $15.75", "  Product A - $19.99  "]
+
+    def eager(self, data):
+        data = ts.str_trim(data)
+        data = ts.str_to_lower(data)
+        data = ts.str_replace(data, " - ", ": ")
+        data = ts.str_squish(data)
+        return ts.str_replace(data, "\\$(\\d+)", "USD \\1", regex=True)
+
+    def pipeline(self):
+        return (
+            ts.Pipeline()
+            .str_trim()
+            .str_to_lower()
+            .str_replace(" - ", ": ")
+            .str_squish()
+            .str_replace("\\$(\\d+)", "USD \\1", regex=True)
+        )
+
+    def test_matches_eager_calls(self):
+        pipeline = self.pipeline()
+        series = pd.Series(self.MESSY, index=[5, 6, 7, 8], name="product")
+        assert pipeline(self.MESSY) == self.eager(self.MESSY)
+        assert pipeline(self.MESSY[0]) == self.eager(self.MESSY[0])
+
+        result = series.pipe(pipeline)
+        assert result.tolist() == self.eager(series).tolist()
+        assert list(result.index) == [5, 6, 7, 8]
+        assert result.name == "product"
+        assert series.pipe(pipeline, dedupe=True).tolist() == result.tolist()
+
+        categorical = series.astype("category")
+        assert categorical.pipe(pipeline).astype(str).tolist() == result.tolist()
+
+    def test_chain_and_custom_steps(self):
+        clean = ts.chain(
+            ts.str_trim,
+            ts.str_to_lower,
+            (ts.str_replace, " - ", ": "),
+            (ts.str_pad, 8, {"side": "left"}),
+        )
+        assert clean(["  A - 1 ", "B - 22"]) == ["    a: 1", "   b: 22"]
+        assert len(clean) == 4
+        assert "str_pad" in repr(clean)
+
+        reverse = ts.Pipeline().str_trim().then(lambda s, suffix: s[::-1] + suffix, "!")
+        assert reverse(" abc ") == "cba!"
+        assert ts.Pipeline().str_trim().str_length()(["  ab ", "c"]) == [2, 1]
+
+    def test_missing_values_and_immutability(self):
+        base = ts.Pipeline().str_trim()
+        upper = base.str_to_upper()
+        assert len(base) == 1 and len(upper) == 2
+        result = upper(pd.Series([" a ", None, " b"]))
+        assert result[0] == "A" and pd.isna(result[1]) and result[2] == "B"
+
+    def test_parallel(self):
+        pipeline = self.pipeline()
+        with ts.config_context(parallel_min_size=0):
+            assert pipeline(self.MESSY * 5, n_jobs=2) == pipeline(self.MESSY * 5)
+
+    def test_unknown_step(self):
+        with pytest.raises(AttributeError):
+            ts.Pipeline().not_a_function()
+        with pytest.raises(AttributeError):
+            ts.Pipeline().str_concat()
+
+    def test_eager_only_options(self):
+        # Execution options are ignored per step; the pipeline takes them when applied
+        pipeline = ts.Pipeline().str_squish(dedupe=False).str_pad(5, side="left", n_jobs=2)
+        assert pipeline(["a  b", "c"]) == ts.str_pad(ts.str_squish(["a  b", "c"]), 5, side="left")
+        assert ts.Pipeline().str_split(",", output="list")("a,b") == ["a", "b"]
+
+        for step in [
+            ts.Pipeline().str_split(",", output="ragged"),
+            ts.Pipeline().str_split(",", expand=True),
+            ts.Pipeline().str_locate_all("a", output="ragged"),
+        ]:
+            with pytest.raises(ValueError, match="cannot be fused"):
+                step(["a,b"])
+
+
+class TestReplaceAll:
+    def test_literal_mapping(self):
+        assert ts.str_replace_all("cat and dog", {"cat": "dog", "dog": "cat"}) == "dog and cat"
+        assert ts.str_replace_all(LIST_STR, {"o": "0", "t": "7"}) == [
+            "hell0 w0rld",
+            "py7h0n 7es7",
+            "s7ring 0pera7i0ns",
+        ]
+        assert ts.str_replace_all("a.b", {".": "!"}) == "a!b"
+        assert ts.str_replace_all("abc", {}) == "abc"
+
+    def test_precedence(self):
+        # Listed first wins at the same position; leftmost match wins overall
+        assert ts.str_replace_all("abc", {"ab": "X", "abc": "Y"}) == "Xc"
+        assert ts.str_replace_all("abc", {"abc": "Y", "ab": "X"}) == "Y"
+        assert ts.str_replace_all("abc", {"bc": "X", "ab": "Y"}) == "Yc"
+
+    def test_regex_mapping_with_groups(self):
+        replacements = {"(\\w+)@(\\w+)": "\\2 at \\1", "(\\d)\\1": "<\\g<0>>", "x(?P<n>y)": "\\g<n>"}
+        assert ts.str_replace_all("me@host 1223 xy", replacements, regex=True) == "host at me 1<22>3 y"
+
+    def test_case_insensitive(self):
+        assert ts.str_replace_all("Hello HELLO", {"hello": "bye"}, case=False) == "bye bye"
+        assert ts.str_replace_all("Hello HELLO", {"h\\w+": "bye"}, regex=True, case=False) == "bye bye"
+        # "ſ" and the Kelvin sign match "s" and "k" but do not lowercase to them
+        assert ts.str_replace_all("\u017f and \u212a", {"s": "x", "k": "y"}, case=False) == "x and y"
+        assert ts.str_replace_all("Ab", {"a": "1", "A": "2", "B": "3"}, case=False) == "13"
+
+    def test_missing_values(self):
+        series = pd.Series(["a-b", None, np.nan, pd.NA], dtype=object)
+        for dedupe in (False, True):
+            result = ts.str_replace_all(series, {"-": " ", "B": "c"}, case=False, dedupe=dedupe)
+            assert result[0] == "a c" and result[1:].isna().all()
+
+    def test_series_and_categorical(self):
+        series = pd.Series(["a-b", "c_d", "a-b"], index=[2, 4, 6])
+        expected = [ts.str_replace(ts.str_replace(s, "-", " "), "_", " ") for s in series]
+        result = ts.str_replace_all(series, {"-": " ", "_": " "})
+        assert result.tolist() == expected
+        assert list(result.index) == [2, 4, 6]
+        assert ts.str_replace_all(series.astype("category"), {"-": " ", "_": " "}).tolist() == expected
+        assert ts.Pipeline().str_replace_all({"-": " "})("a-b") == "a b"
+
+    def test_invalid_replacement(self):
+        with pytest.raises(TypeError):
+            ts.str_replace_all("abc", {"a": 1})
+
+
+class TestTranslate:
+    def test_translate_and_delete(self):
+        assert ts.str_translate("hello world", {"o": "0", "l": "1"}) == "he110 w0r1d"
+        assert ts.str_translate("a-b_c!", {"-": " ", "_": None}, delete="!") == "a bc"
+        assert ts.str_translate(LIST_STR, delete="aeiou") == ["hll wrld", "pythn tst", "strng prtns"]
+        result = ts.str_translate(SERIES_STR, {ord("o"): "0"})
+        assert result.tolist() == ["hell0 w0rld", "pyth0n test", "string 0perati0ns"]
+
+    def test_replace_chars(self):
+        assert ts.str_replace_chars("hello-world_again", "-_", " ") == "hello world again"
+        assert ts.str_replace_chars(["(555) 123-4567"], "()- ") == ["5551234567"]
+        assert ts.str_replace_chars("a.b", ["."], "::") == "a::b"
+
+    def test_tables_are_cached(self):
+        from tidystring.kernels import translation_table
+
+        assert translation_table({"-": " "}, "!") is translation_table({"-": " "}, "!")
+
+    def test_dash_to_space_matches_replace(self):
+        values = ["a-b_c", "--x__", "no dashes", "a.b"]
+        for dashes in (["-", "_"], ["."], ["-", "_", "."]):
+            expected = values
+            for dash in dashes:
+                expected = ts.str_replace(expected, dash, " ")
+            assert ts.str_dash_to_space(values, dashes=dashes) == expected
+            assert ts.str_dash_to_space(pd.Series(values), dashes=dashes).tolist() == expected
+        assert ts.str_to_title(["a-b_c"], remove_dashes=True) == ["A B C"]
+
+    def test_invalid_table(self):
+        with pytest.raises(ValueError):
+            ts.str_translate("abc", {"ab": "x"})
+
+
+class TestAlignedPad:
+    def test_scalar_semantics_unchanged(self):
+        assert ts.str_pad("ab", 5) == " ab  "
+        assert ts.str_pad(pd.Series(["ab", "abc"]), 6, side="both", pad="*").tolist() == ["**ab**", "*abc**"]
+        assert ts.str_pad(pd.Series([1, 22]), 3, side="left").tolist() == ["  1", " 22"]
+        assert ts.str_pad([1, 22], 4) == [" 1  ", " 22 "]
+        assert ts.str_pad([1, 22], [2, 3], side="left", pad="0") == ["01", "022"]
+
+    def test_per_element_width_and_pad(self):
+        assert ts.str_pad(["a", "b"], [3, 5], side="right", pad=["-", "."]) == ["a--", "b...."]
+        assert ts.str_pad(["ab", "ab"], np.array([5, 1])) == [" ab  ", "ab"]
+        for side in ("left", "right", "both"):
+            widths = [4, 7, 2]
+            expected = [ts.str_pad(s, w, side=side) for s, w in zip(LIST_STR, widths)]
+            assert ts.str_pad(LIST_STR, widths, side=side) == expected
+
+    def test_series_widths_align_by_index(self):
+        codes = pd.Series(["7", "42", "1234"], index=[2, 1, 0], name="code")
+        widths = pd.Series([4, 3, 2], index=[0, 1, 2])
+        result = ts.str_pad(codes, widths, side="left", pad="0")
+        assert result.tolist() == ["07", "042", "1234"]
+        assert list(result.index) == [2, 1, 0]
+        assert result.name == "code"
+
+    def test_missing_values(self):
+        result = ts.str_pad(pd.Series(["a", None, "c"]), [3, 3, np.nan], side="left")
+        assert result[0] == "  a" and pd.isna(result[1]) and pd.isna(result[2])
+
+    def test_length_mismatch(self):
+        with pytest.raises(ValueError):
+            ts.str_pad(["a", "b"], [1, 2, 3])
+        with pytest.raises(TypeError):
+            ts.str_pad("a", [1])
+
+
+class TestAlignedSubDup:
+    def test_sub_with_arrays(self):
+        assert ts.str_sub(["hello", "world"], [0, -3], [2, None]) == ["he", "rld"]
+        assert ts.str_sub(LIST_STR, [0, 1, 2]) == [s[i:] for s, i in zip(LIST_STR, [0, 1, 2])]
+        assert ts.str_sub(["abcdef", "ghijkl"], [0, 1], step=2) == ["ace", "hjl"]
+
+        pairs = pd.Series(["key=value", "id=7"], index=[10, 20])
+        result = ts.str_sub(pairs, ts.str_locate(pairs, "=") + 1)
+        assert result.tolist() == ["value", "7"]
+        assert list(result.index) == [10, 20]
+
+    def test_sub_missing_values(self):
+        result = ts.str_sub(pd.Series(["hello", None, "abc"]), np.array([1, 0, np.nan]), 3)
+        assert result[0] == "el" and pd.isna(result[1]) and result[2] == "abc"
+
+    def test_dup_with_arrays(self):
+        assert ts.str_dup(["a", "b"], [1, 3]) == ["a", "bbb"]
+        series = pd.Series(["a", "b", "c"], index=[2, 1, 0])
+        assert ts.str_dup(series, pd.Series([0, 1, 2])).tolist() == ["aa", "b", ""]
+        result = ts.str_dup(pd.Series(["a", "b"]), [np.nan, 2])
+        assert pd.isna(result[0]) and result[1] == "bb"
+
+    def test_scalar_arguments_unchanged(self):
+        assert ts.str_sub(SERIES_STR, 1, -2).tolist() == [s[1:-2] for s in LIST_STR]
+        assert ts.str_dup("ab", 2) == "abab"
+
+
+class TestConcatColumns:
+    def test_matches_row_wise_join(self):
+        df = pd.DataFrame({"a": ["x", "y", "z"], "b": [1, 2, 3], "c": ["p", "q", "r"]})
+        expected = df.astype(str).agg("-".join, axis=1)
+        assert ts.str_concat(df, "a", "b", "c", sep="-").tolist() == expected.tolist()
+        assert ts.str_concat(df["a"], df["b"], df["c"], sep="-").tolist() == expected.tolist()
+
+    def test_scalars_and_alignment(self):
+        left = pd.Series(["a", "b"], index=[1, 2])
+        right = pd.Series(["y", "x"], index=[2, 1])
+        result = ts.str_concat("k", left, right, 0)
+        assert result.tolist() == ["k_a_x_0", "k_b_y_0"]
+        assert list(result.index) == [1, 2]
+
+    def test_missing_values(self):
+        left = pd.Series(["a", None, "c"])
+        right = pd.Series(["x", "y", np.nan])
+        result = ts.str_concat(left, right)
+        assert result[0] == "a_x" and result[1:].isna().all()
+        assert ts.str_concat(left, right, na_rep="?").tolist() == ["a_x", "?_y", "c_?"]
+        assert ts.str_concat(left, "m", right, na_action="skip").tolist() == ["a_m_x", "m_y", "c_m"]
+
+    def test_invalid_arguments(self):
+        with pytest.raises(ValueError):
+            ts.str_concat(pd.Series(["a"]), "b", na_action="drop")
+        with pytest.raises(TypeError):
+            ts.str_concat(["a"], pd.Series(["b"]))
+
+
+class TestRaggedOutput:
+    def test_locate_all_ragged(self):
+        strings = ["hello world", "python test", None, "string operations"]
+        ragged = ts.str_locate_all(strings, "o", output="ragged")
+        assert isinstance(ragged, ts.RaggedArray)
+        assert ragged.values.dtype == np.int32 and ragged.offsets.dtype == np.int64
+        assert ragged.offsets.tolist() == [0, 2, 3, 3, 5]
+        assert ragged[1].tolist() == [[4, 5]]
+        assert ragged[-1].tolist() == [[7, 8], [14, 15]]
+        assert ragged.lengths.tolist() == [2, 1, 0, 2]
+        rows = ragged.tolist()
+        assert rows[:2] + rows[3:] == [[[4, 5], [7, 8]], [[4, 5]], [[7, 8], [14, 15]]]
+        assert np.isnan(rows[2])
+        with pytest.raises(IndexError):
+            ragged[4]
+
+    def test_split_matches_list_output(self):
+        series = pd.Series(["a,b,c", "", "d", None], index=[5, 6, 7, 8], name="tags")
+        ragged = ts.str_split(series, ",", output="ragged")
+        expected = ts.str_split(series, ",")
+        assert ragged.to_series().equals(expected)
+        assert ts.str_split(LIST_STR, "\\s", output="ragged").tolist() == ts.str_split(LIST_STR, "\\s")
+
+    def test_explode(self):
+        series = pd.Series(["aba", "b", "a"], index=["x", "y", "z"])
+        frame = ts.str_locate_all(series, "a", output="ragged").explode()
+        assert list(frame.columns) == ["start", "end"]
+        assert list(frame.index) == ["x", "x", "z"]
+        assert frame["start"].tolist() == [0, 2, 0]
+
+        frame = ts.str_split(series, "b", output="ragged").explode()
+        assert frame["value"].tolist() == ["a", "a", "", "", "a"]
+
+    def test_invalid_output(self):
+        with pytest.raises(ValueError):
+            ts.str_split(["a"], ",", output="arrow")
+
+
+class TestSplitColumns:
+    def test_split_fixed(self):
+        series = pd.Series(["a-b-c", "d", None, "e-f-g-h"], index=[3, 4, 5, 6])
+        result = ts.str_split_fixed(series, "-", 3)
+        assert list(result.columns) == [0, 1, 2]
+        assert list(result.index) == [3, 4, 5, 6]
+        assert result.loc[3].tolist() == ["a", "b", "c"]
+        assert result.loc[6].tolist() == ["e", "f", "g-h"]
+        assert result.loc[4, 0] == "d" and result.loc[4, [1, 2]].isna().all()
+        assert result.loc[5].isna().all()
+
+    def test_split_fixed_scalars_and_lists(self):
+        assert ts.str_split_fixed("a.b.c", "\\.", 2) == ["a", "b.c"]
+        assert ts.str_split_fixed("a", "-", 3) == ["a", None, None]
+        assert ts.str_split_fixed(["a-b", "c"], "-", 1)[0].tolist() == ["a-b", "c"]
+        with pytest.raises(ValueError):
+            ts.str_split_fixed("a", "-", 0)
+
+    def test_expand_matches_pandas(self):
+        import re
+
+        series = pd.Series(["a1b22c", "d", None, "3e"])
+        for pattern, maxsplit in [("\\d+", -1), ("\\d+", 1), ("b", -1)]:
+            result = ts.str_split(series, pattern, maxsplit, expand=True)
+            expected = series.str.split(re.compile(pattern), n=maxsplit, expand=True)
+            assert result.shape == expected.shape
+            assert result.fillna("NA").values.tolist() == expected.fillna("NA").values.tolist()
+
+    def test_chunked_columns(self, monkeypatch):
+        from tidystring import handlers
+
+        monkeypatch.setattr(handlers, "_SPLIT_CHUNK_SIZE", 2)
+        result = ts.str_split(["a", "b", "c-d", "e", "f-g-h"], "-", expand=True)
+        assert result.fillna("").values.tolist() == [
+            ["a", "", ""],
+            ["b", "", ""],
+            ["c", "d", ""],
+            ["e", "", ""],
+            ["f", "g", "h"],
+        ]
+
+
+class TestLocateSpan:
+    def test_regex_patterns(self):
+        assert ts.str_locate("a1b22", "\\d{2}") == 3
+        assert ts.str_locate(["a.b", "axb"], "a.b") == [0, 0]
+        assert ts.str_locate(["a.b", "axb"], "a\\.b") == [0, -1]
+        assert ts.str_locate(pd.Series(["xab", "abx"]), "^ab").tolist() == [-1, 0]
+
+    def test_span_output(self):
+        assert ts.str_locate("hello", "l+", output="span") == [2, 4]
+        assert ts.str_locate("hello", "z", output="span") == [-1, -1]
+
+        result = ts.str_locate(pd.Series(["a1b22", "c", "333"], index=[4, 5, 6]), "\\d+", output="span")
+        assert list(result.columns) == ["start", "end"]
+        assert list(result.index) == [4, 5, 6]
+        assert (result.dtypes == np.int32).all()
+        assert result.values.tolist() == [[1, 2], [-1, -1], [0, 3]]
+
+    def test_span_matches_locate_all(self):
+        spans = ts.str_locate(LIST_STR, "[aeiou]\\w", output="span")
+        first = [pairs[0] if pairs else [-1, -1] for pairs in ts.str_locate_all(LIST_STR, "[aeiou]\\w")]
+        assert spans.values.tolist() == first
+
+    def test_literal_and_regex_routes_agree(self):
+        strings = ["a-b", "--", "b", ""]
+        literal = ts.str_locate(strings, "-", output="span")
+        regex = ts.str_locate(strings, "[-]", output="span")
+        assert literal.equals(regex)
+        assert ts.str_locate(strings, "-", output="span", start=1).values.tolist() == [[1, 2], [1, 2], [-1, -1], [-1, -1]]
+
+        # Negative bounds count from the end of the string, as in str.find
+        for start, end in [(-2, None), (0, -1), (-3, -1), (-10, None)]:
+            expected = [s.find("-", start, len(s) if end is None else end) for s in strings]
+            for pattern in ["-", "[-]"]:
+                assert ts.str_locate(strings, pattern, start=start, end=end) == expected, (pattern, start, end)
+                spans = ts.str_locate(strings, pattern, output="span", start=start, end=end)
+                assert spans["start"].tolist() == expected, (pattern, start, end)
+
+    def test_missing_values(self):
+        result = ts.str_locate(pd.Series(["ab", None]), "b", output="span")
+        assert result["start"].dtype == "Int32"
+        assert result.loc[0].tolist() == [1, 2]
+        assert result.loc[1].isna().all()
+
+    def test_invalid_output(self):
+        with pytest.raises(ValueError):
+            ts.str_locate("a", "a", output="end")
+
+
+class TestExtractGroups:
+    PATTERN = "(?P<verb>[A-Z]+) (?P<path>\\S+) (?P<status>\\d+) (\\d+\\.\\d+)s"
+
+    def test_matches_pandas_extract(self):
+        logs = pd.Series(["GET /a 200 0.25s", "POST /b 404 1.5s", "bad line", None], index=[7, 8, 9, 10])
+        result = ts.str_extract_groups(logs, self.PATTERN)
+        expected = logs.str.extract(self.PATTERN)
+        assert list(result.columns) == ["verb", "path", "status", 3]
+        assert list(result.index) == [7, 8, 9, 10]
+        assert result.fillna("NA").values.tolist() == expected.fillna("NA").values.tolist()
+
+    def test_dtype_schema(self):
+        logs = ["GET /a 200 0.25s", "bad line", "PUT /c 201 3.0s"]
+        result = ts.str_extract_groups(logs, self.PATTERN, {"verb": "category", "status": "int", 3: "float"})
+        assert isinstance(result["verb"].dtype, pd.CategoricalDtype)
+        assert result["status"].dtype == "Int64"
+        assert result["status"].tolist()[::2] == [200, 201] and pd.isna(result["status"][1])
+        assert result[3].dtype == np.float64
+
+        dates = ts.str_extract_groups(["on 2024-01-02", "never"], "on (\\S+)", {0: "datetime"})
+        assert dates[0][0] == pd.Timestamp("2024-01-02") and pd.isna(dates[0][1])
+
+        with pytest.raises(KeyError):
+            ts.str_extract_groups(logs, self.PATTERN, {"size": "int"})
+
+    def test_single_string_and_errors(self):
+        assert ts.str_extract_groups("GET /a 200 1.0s", self.PATTERN) == ["GET", "/a", "200", "1.0"]
+        assert ts.str_extract_groups("nope", "(a)(b)?") == [None, None]
+        assert ts.str_extract_groups("AB", "(a)(b)", case=False) == ["A", "B"]
+        with pytest.raises(ValueError):
+            ts.str_extract_groups(["a"], "a")
+
+    def test_str_match(self):
+        assert ts.str_match("key=value", "(\\w+)=(\\w+)") == ["key=value", "key", "value"]
+        result = ts.str_match(pd.Series(["a=1", "b"]), "(?P<key>\\w+)=(\\d)", {1: "int"})
+        assert list(result.columns) == ["match", "key", 1]
+        assert result["match"][0] == "a=1" and result[1][0] == 1
+        assert result.loc[1].isna().all()
+
+
+class TestCountMany:
+    def expected(self, strings, patterns, **kwargs):
+        return np.column_stack([ts.str_count(pd.Series(strings), p, **kwargs).fillna(0).to_numpy() for p in patterns])
+
+    def test_matches_str_count(self):
+        import re
+
+        strings = ["abababa", "ab ba aba", "xyz", "", "a.b a+b", "Ab AB"]
+        patterns = ["ab", "ba", "aba", "abab", "a", "b a", "a.b", "a\\+b", "\\bab\\b", "[ab]{2}", "z", "q"]
+        result = ts.str_count_many(strings, patterns, output="array")
+        assert result.dtype == np.int32
+        assert (result == self.expected(strings, patterns)).all()
+
+        lowered = ts.str_count_many(strings, patterns, output="array", case=False)
+        assert (lowered == self.expected(strings, patterns, case=False)).all()
+        flagged = ts.str_count_many(strings, patterns, output="array", flags=re.IGNORECASE)
+        assert (flagged == lowered).all()
+
+        # "ſ" and the Kelvin sign match "s" and "k" but do not lowercase to them
+        strings = ["\u017fs K", "sk \u017f\u212a", "\u0131i"]
+        patterns = ["s", "S", "k", "zz", "\u017f", "\u212a", "i", "sk"]
+        lowered = ts.str_count_many(strings, patterns, output="array", case=False)
+        assert (lowered == self.expected(strings, patterns, case=False)).all()
+
+    def test_output_types(self):
+        assert ts.str_count_many("the cat sat on the mat", ["the", "at", "dog"]) == [2, 3, 0]
+
+        series = pd.Series(["a1b2", None, "cc"], index=[5, 6, 7])
+        frame = ts.str_count_many(series, ["\\d", "c", "c"])
+        assert list(frame.columns) == ["\\d", "c", "c"]
+        assert list(frame.index) == [5, 6, 7]
+        assert frame.values.tolist() == [[2, 0, 0], [0, 0, 0], [0, 2, 2]]
+
+        categorical = ts.str_count_many(series.astype("category"), ["\\d", "c"], case=False)
+        assert categorical.values.tolist() == [[2, 0], [0, 0], [0, 2]]
+
+        small = ts.str_count_many(LIST_STR, ["o", "t"], output="array", dtype=np.int16)
+        assert small.dtype == np.int16 and small.tolist() == [[2, 0], [1, 3], [2, 2]]
+
+        with pytest.raises(ValueError):
+            ts.str_count_many(LIST_STR, ["o"], output="list")
+
+
+class TestToCase:
+    def test_cases(self):
+        for case, expected in [
+            ("snake", "parse_http_response_2"),
+            ("camel", "parseHttpResponse2"),
+            ("pascal", "ParseHttpResponse2"),
+            ("kebab", "parse-http-response-2"),
+            ("constant", "PARSE_HTTP_RESPONSE_2"),
+        ]:
+            assert ts.str_to_case("parseHTTPResponse_2", case) == expected
+            assert ts.str_to_case(["parse-http response 2"], case) == [expected]
+
+        result = ts.str_to_case(pd.Series(["user_id", "__"], index=[3, 4]), "pascal")
+        assert result.to_dict() == {3: "UserId", 4: ""}
+        for missing in [None, np.nan, pd.NA]:
+            result = ts.str_to_case(pd.Series(["userId", missing], dtype=object), "kebab", dedupe=False)
+            assert result[0] == "user-id" and pd.isna(result[1])
+        with pytest.raises(NotImplementedError):
+            ts.str_to_case("a", "title")
+
+    def test_search_recase_memo(self):
+        strings = ["get userId, set userId", "userId"] * 3
+        assert ts.str_search_recase(strings, "\\w+", "constantcase") == ["GET USER_ID, SET USER_ID", "USER_ID"] * 3
+        assert ts.str_search_recase("max-value", "[\\w-]+", "pascalcase") == "MaxValue"
+
+        import pickle
+        kernel = pickle.loads(pickle.dumps(ts.kernels.search_recase("\\w+", "kebabcase")))
+        assert kernel("fooBar baz_qux") == "foo-bar baz-qux"
+
+
+class TestSearchApplyBatch:
+    def test_matches_per_match_mode(self):
+        import re
+
+        strings = ["NY to LA", "", "LA", "xx", "a-b"]
+        codes = pd.Series({"NY": "New York", "LA": "Los Angeles"})
+        result = ts.str_search_apply(strings, "[A-Z]{2}", lambda m: m.map(codes), batch=True)
+        assert result == ["New York to Los Angeles", "", "Los Angeles", "xx", "a-b"]
+
+        calls = []
+
+        def upper(matches):
+            calls.append(list(matches))
+            return ts.str_to_upper(matches)
+
+        memo = ts.str_search_apply(strings, "\\w*", upper, batch=True, memo=True)
+        assert memo == [re.sub("\\w*", lambda m: m.group().upper(), s) for s in strings]
+        assert len(calls) == 1 and len(calls[0]) == len(set(calls[0]))
+
+    def test_input_types(self):
+        assert ts.str_search_apply("ab12", "(\\d)(\\d)", lambda m: m.str[::-1], batch=True) == "ab21"
+
+        series = pd.Series(["a1", None, "b22"], index=[4, 5, 6], name="s")
+        result = ts.str_search_apply(series, "\\d", lambda m: m + "!", batch=True)
+        assert result.name == "s" and list(result.index) == [4, 5, 6]
+        assert result[4] == "a1!" and pd.isna(result[5]) and result[6] == "b2!2!"
+
+        cat = ts.str_search_apply(series.astype("category"), "\\d", lambda m: m + "!", batch=True)
+        assert isinstance(cat.dtype, pd.CategoricalDtype) and cat[6] == "b2!2!"
+
+        with pytest.raises(ValueError):
+            ts.str_search_apply(["a1"], "\\d", lambda m: m[:0], batch=True)
+
+    def test_per_match_memo(self):
+        calls = []
+
+        def double(match):
+            calls.append(match)
+            return match * 2
+
+        assert ts.str_search_apply(["ab", "ba", "aa"], "a", double, memo=True) == ["aab", "baa", "aaaa"]
+        assert calls == ["a"]
+        with pytest.raises(ValueError):
+            ts.Pipeline().str_search_apply("a", double, batch=True).kernel()
+
+
+class TestStreaming:
+    def test_matches_whole_input(self):
+        lines = [f"id-{i} {'ERROR' if i % 3 else 'ok'}" for i in range(25)]
+        assert list(ts.stream(ts.str_detect, iter(lines), "ERROR", chunksize=4)) == ts.str_detect(lines, "ERROR")
+        assert list(ts.stream(ts.str_split_fixed, lines, " ", 2, chunksize=7)) == [tuple(s.split(" ")) for s in lines]
+
+        clean = ts.Pipeline().str_replace("id-", "").str_to_upper()
+        assert list(clean.stream(lines, chunksize=10)) == clean(lines)
+
+    def test_chunks_and_laziness(self):
+        import itertools
+
+        chunks = list(ts.stream_chunks(ts.str_length, ["a", "bb", "ccc"], chunksize=2))
+        assert [list(chunk.index) for chunk in chunks] == [[0, 1], [2]]
+        assert [chunk.tolist() for chunk in chunks] == [[1, 2], [3]]
+
+        endless = (str(i) for i in itertools.count())
+        assert list(itertools.islice(ts.stream(ts.str_length, endless, chunksize=5), 12))[-1] == 2
+
+        with ts.config_context(stream_chunksize=3):
+            assert len(list(ts.stream_chunks(ts.str_length, "abcdefg"))) == 3
+        with pytest.raises(ValueError):
+            next(ts.stream(ts.str_length, ["a"], chunksize=0))
+
+    def test_result_types(self):
+        counts = list(ts.stream(ts.str_count_many, ["ab", "b"], ["a", "b"], output="array"))
+        assert counts == [[1, 1], [0, 1]]
+        spans = list(ts.stream(ts.str_locate_all, ["aba"], "a", output="ragged"))
+        assert spans == [[[0, 1], [2, 3]]]
+
+
+class TestTransformFile:
+    def write_csv(self, path, rows=7):
+        frame = pd.DataFrame({
+            "id": range(rows),
+            "name": [f"  User-{i} " for i in range(rows)],
+            "email": [f"U{i}@X.ORG" for i in range(rows)],
+        })
+        frame.to_csv(path, index=False)
+        return frame
+
+    def test_csv_in_chunks(self, tmp_path):
+        from functools import partial
+
+        frame = self.write_csv(tmp_path / "in.csv")
+        clean = ts.Pipeline().str_trim().str_replace("-", " ")
+        transforms = {"name": clean, "email": partial(ts.str_to_lower)}
+        rows = ts.transform_file(tmp_path / "in.csv", tmp_path / "out.csv", transforms, chunksize=3)
+
+        result = pd.read_csv(tmp_path / "out.csv")
+        assert rows == 7
+        assert result["id"].tolist() == frame["id"].tolist()
+        assert result["name"].tolist() == [f"User {i}" for i in range(7)]
+        assert result["email"].tolist() == [f"u{i}@x.org" for i in range(7)]
+
+    def test_errors(self, tmp_path):
+        self.write_csv(tmp_path / "in.csv", rows=0)
+        assert ts.transform_file(tmp_path / "in.csv", tmp_path / "out.csv", {"name": ts.str_trim}) == 0
+        assert list(pd.read_csv(tmp_path / "out.csv").columns) == ["id", "name", "email"]
+
+        with pytest.raises(KeyError):
+            ts.transform_file(tmp_path / "in.csv", tmp_path / "out.csv", {"missing": ts.str_trim})
+        with pytest.raises(ValueError):
+            ts.transform_file(tmp_path / "in.csv", tmp_path / "out.csv", {}, file_format="json")
+
+    def test_parquet(self, tmp_path):
+        pytest.importorskip("pyarrow")
+        frame = self.write_csv(tmp_path / "in.csv")
+        frame.to_parquet(tmp_path / "in.parquet")
+        rows = ts.transform_file(tmp_path / "in.parquet", tmp_path / "out.parquet", {"name": ts.str_trim}, chunksize=2)
+        result = pd.read_parquet(tmp_path / "out.parquet")
+        assert rows == 7 and result["name"].tolist() == [f"User-{i}" for i in range(7)]
+
+
+class TestReadLines:
+    TEXT = "GET /a 200\nPOST /b 500\n\nGET /c 503 timeout\nδ GET /d 200"
+
+    def lines(self, tmp_path, text=None, **kwargs):
+        path = tmp_path / "log.txt"
+        path.write_bytes((self.TEXT if text is None else text).encode("utf-8"))
+        return ts.read_lines(path, **kwargs)
+
+    def test_lines_and_chunks(self, tmp_path):
+        for mmap in (True, False):
+            with self.lines(tmp_path, mmap=mmap, chunksize=2) as lines:
+                assert len(lines) == 5
+                assert list(lines) == self.TEXT.split("\n")
+                assert [chunk.index.tolist() for chunk in lines.chunks()] == [[0, 1], [2, 3], [4]]
+                lengths = pd.concat(lines.apply(ts.str_length))
+                assert lengths.tolist() == [len(line) for line in self.TEXT.split("\n")]
+
+        with self.lines(tmp_path, "a\r\nb\r\n") as lines:
+            assert list(lines) == ["a", "b"]
+        with self.lines(tmp_path, "") as lines:
+            assert len(lines) == 0 and lines.to_series().empty
+
+    def test_filter_matches_str_detect(self, tmp_path):
+        import re
+
+        ascii_text = self.TEXT.replace("δ", "d")
+        for text in (self.TEXT, ascii_text, ascii_text.replace("\n", "\r\n")):
+            expected_lines = [line.rstrip("\r") for line in text.split("\n")]
+            with self.lines(tmp_path, text) as lines:
+                for pattern, case in [("GET", True), ("get", False), ("5\\d\\d$", True), ("^$", True),
+                                      ("\\s+/", True), ("T /\\w", True), ("δ", True), ("/[ab]", False)]:
+                    result = lines.filter(pattern, case=case).to_series()
+                    flags = 0 if case else re.IGNORECASE
+                    expected = [i for i, line in enumerate(expected_lines) if re.search(pattern, line, flags)]
+                    assert result.index.tolist() == expected, (text, pattern)
+                    assert result.tolist() == [expected_lines[i] for i in expected]
+
+                narrowed = lines.filter("GET").filter("200", regex=False)
+                assert narrowed.to_series().index.tolist() == [0, 4]
+                codes = pd.concat(lines.filter("GET").apply(ts.str_extract, "(\\d{3})"))
+                assert codes.tolist() == ["200", "503", "200"]
+
+    def test_filter_encoding_and_line_anchors(self, tmp_path):
+        import re
+
+        path = tmp_path / "latin.txt"
+        path.write_bytes("café 1\nfoo\nx café".encode("latin-1"))
+        with ts.read_lines(path, encoding="latin-1") as lines:
+            assert lines.filter("café").to_series().index.tolist() == [0, 2]
+            assert lines.filter("CAFÉ", case=False).to_series().index.tolist() == [0, 2]
+
+        text = "foo a\nbar\nfoo b\nbar foo\n\nfoo"
+        expected_lines = text.split("\n")
+        with self.lines(tmp_path, text) as lines:
+            for pattern in ["\\Afoo", "foo\\Z", "(?s)a.b",
+                            "r\\nf", "[^x]+foo", "foo\\s\\w", "(?m)^$", "\\x0abar", "\\012"]:
+                expected = [i for i, line in enumerate(expected_lines) if re.search(pattern, line)]
+                assert lines.filter(pattern).to_series().index.tolist() == expected, pattern
+            compiled = re.compile("a.b", re.DOTALL)
+            assert lines.filter(compiled).to_series().index.tolist() == []
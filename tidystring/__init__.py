@@ -2,14 +2,23 @@
 
 from .methods import (
     str_replace,
+    str_replace_all,
+    str_translate,
+    str_replace_chars,
     str_detect,
+    str_detect_any,
+    str_which_keyword,
     str_remove,
     str_extract,
+    str_extract_groups,
+    str_match,
     str_split,
+    str_split_fixed,
     str_trim,
     str_length,
     str_sub,
     str_count,
+    str_count_many,
     str_locate,
     str_locate_all,
     str_pad,
@@ -23,6 +32,7 @@ from .methods import (
     str_concat,
     str_search_apply,
     str_search_recase,
+    str_to_case,
     str_dash_to_space,
     str_startswith,
     str_endswith,
@@ -30,6 +40,28 @@ from .methods import (
     snake_to_camel,
 )
 
+from .config import (
+    get_config,
+    set_config,
+    config_context,
+)
+
+from .keywords import KeywordMatcher
+
+from .pipeline import Pipeline, chain
+
+from .ragged import RaggedArray
+
+from .streaming import stream, stream_chunks
+
+from .files import LineFile, read_lines, transform_file
+
+from .patterns import (
+    compile_pattern,
+    pattern_cache_info,
+    clear_pattern_cache,
+)
+
 from .cheatsheet import (
     get_tidystring_cheatsheet,
     get_regex_cheatsheet,
@@ -74,14 +106,23 @@ from .regex_utils import (
 __all__ = [
     # String manipulation functions
     "str_detect",
+    "str_detect_any",
+    "str_which_keyword",
     "str_remove",
     "str_extract",
+    "str_extract_groups",
+    "str_match",
     "str_replace",
+    "str_replace_all",
+    "str_translate",
+    "str_replace_chars",
     "str_split",
+    "str_split_fixed",
     "str_trim",
     "str_length",
     "str_sub",
     "str_count",
+    "str_count_many",
     "str_locate",
     "str_locate_all",
     "str_pad",
@@ -95,11 +136,31 @@ __all__ = [
     "str_concat",
     "str_search_apply",
     "str_search_recase",
+    "str_to_case",
     "str_dash_to_space",
     "str_startswith",
     "str_endswith",
     "camel_to_snake",
     "snake_to_camel",
+    "KeywordMatcher",
+    # Pipeline functions
+    "Pipeline",
+    "chain",
+    "RaggedArray",
+    # Streaming functions
+    "stream",
+    "stream_chunks",
+    # File functions
+    "transform_file",
+    "read_lines",
+    "LineFile",
+    # Configuration functions
+    "get_config",
+    "set_config",
+    "config_context",
+    "compile_pattern",
+    "pattern_cache_info",
+    "clear_pattern_cache",
     # Cheatsheet functions
     "get_all_functions",
     "print_cheatsheet",
@@ -33,16 +33,51 @@ def get_tidystring_cheatsheet(group=None):
             "Example": "str_detect('hello world', 'o') -> True",
             "Group": "detection",
         },
+        "str_detect_any": {
+            "Description": "Detect if any of several keywords exists in a string",
+            "Example": "str_detect_any('hello world', ['world', 'there']) -> True",
+            "Group": "detection",
+        },
+        "str_which_keyword": {
+            "Description": "Find the id of the first (or all) matching keywords",
+            "Example": "str_which_keyword('hello world', ['there', 'world']) -> 1",
+            "Group": "detection",
+        },
         "str_extract": {
             "Description": "Extract the first match of a pattern",
             "Example": "str_extract('hello world', 'h(\\w+)') -> 'ello'",
             "Group": "extraction",
         },
+        "str_extract_groups": {
+            "Description": "Extract every capture group of the first match",
+            "Example": "str_extract_groups('a=1', '(\\w)=(\\d)') -> ['a', '1']",
+            "Group": "extraction",
+        },
+        "str_match": {
+            "Description": "Extract the first match and its capture groups",
+            "Example": "str_match('a=1', '(\\w)=(\\d)') -> ['a=1', 'a', '1']",
+            "Group": "extraction",
+        },
         "str_replace": {
             "Description": "Replace all matches of a pattern",
             "Example": "str_replace('hello', 'l', 'X') -> 'heXXo'",
             "Group": "modification",
         },
+        "str_replace_all": {
+            "Description": "Replace several patterns in one pass using a mapping",
+            "Example": "str_replace_all('cat dog', {'cat': 'dog', 'dog': 'cat'}) -> 'dog cat'",
+            "Group": "modification",
+        },
+        "str_translate": {
+            "Description": "Map, replace, or delete individual characters",
+            "Example": "str_translate('a-b!', {'-': ' '}, delete='!') -> 'a b'",
+            "Group": "modification",
+        },
+        "str_replace_chars": {
+            "Description": "Replace each of several characters with a replacement",
+            "Example": "str_replace_chars('a-b_c', '-_', ' ') -> 'a b c'",
+            "Group": "modification",
+        },
         "str_remove": {
             "Description": "Remove all matches of a pattern",
             "Example": "str_remove('hello', 'l') -> 'heo'",
@@ -73,6 +108,11 @@ def get_tidystring_cheatsheet(group=None):
             "Example": "str_split('a,b,c', ',') -> ['a', 'b', 'c']",
             "Group": "extraction",
         },
+        "str_split_fixed": {
+            "Description": "Split string into a fixed number of components",
+            "Example": "str_split_fixed('a,b,c', ',', 2) -> ['a', 'b,c']",
+            "Group": "extraction",
+        },
         "str_sub": {
             "Description": "Extract substring from start/end positions",
             "Example": "str_sub('hello', 1, 3) -> 'el'",
@@ -83,6 +123,11 @@ def get_tidystring_cheatsheet(group=None):
             "Example": "str_count('hello', 'l') -> 2",
             "Group": "detection",
         },
+        "str_count_many": {
+            "Description": "Count occurrences of many patterns in one call",
+            "Example": "str_count_many('hello', ['l', 'o']) -> [2, 1]",
+            "Group": "detection",
+        },
         "str_upper_cut": {
             "Description": "Capitalize first n characters",
             "Example": "str_upper_cut('hello', n=2) -> 'HEllo'",
@@ -98,6 +143,11 @@ def get_tidystring_cheatsheet(group=None):
             "Example": "snake_to_camel('hello_world') -> 'HelloWorld'",
             "Group": "case",
         },
+        "str_to_case": {
+            "Description": "Convert identifiers between snake, camel, pascal, kebab and constant case",
+            "Example": "str_to_case('parseHTTPResponse', 'snake') -> 'parse_http_response'",
+            "Group": "case",
+        },
         "str_search_recase": {
             "Description": "Change case of matched pattern",
             "Example": "str_search_recase('helloWorld', '\\w+', 'snakecase') -> 'hello_world'",
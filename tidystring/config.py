@@ -0,0 +1,119 @@
+"""
+Global configuration for tidystring.
+
+This module holds the options that steer how tidystring functions execute,
+such as the size limit below which lists are processed natively instead of
+through pandas.
+"""
+
+from contextlib import contextmanager
+
+_config = {
+    # Lists with at most this many elements skip pandas
+    "native_list_threshold": 100_000,
+    # Per-function overrides of native_list_threshold, keyed by function name
+    "native_list_thresholds": {},
+    # Deduplicate Series before row-wise kernels: True, False, or None (auto)
+    "dedupe": None,
+    # Series shorter than this are never deduplicated automatically
+    "dedupe_min_size": 1_000,
+    # Number of values sampled to estimate cardinality
+    "dedupe_sample_size": 10_000,
+    # Deduplicate if the sample's unique fraction is at most this value
+    "dedupe_max_ratio": 0.9,
+    # Maximum number of compiled patterns kept by the pattern cache
+    "pattern_cache_size": 4096,
+    # Worker processes for row-wise functions: None (serial), a count, or -1 (all CPUs)
+    "n_jobs": None,
+    # Inputs with fewer values than this always run serially
+    "parallel_min_size": 50_000,
+    # Number of chunks submitted per worker process
+    "parallel_chunks_per_job": 4,
+    # Number of strings per chunk in stream and stream_chunks
+    "stream_chunksize": 65_536,
+}
+
+
+def get_config(key=None):
+    """
+    Return the current tidystring configuration.
+
+    Args:
+        key (str, optional): Name of a single option to return. Defaults to None (all options).
+
+    Returns:
+        dict or object: Copy of all options, or the value of the requested option
+
+    Raises:
+        KeyError: If key is not a valid option
+
+    Examples:
+        >>> get_config("native_list_threshold")
+        100000
+    """
+    if key is None:
+        return {name: value.copy() if isinstance(value, dict) else value for name, value in _config.items()}
+    if key not in _config:
+        raise KeyError(f"Invalid option: '{key}'. Valid options are: {', '.join(_config)}")
+    return _config[key]
+
+
+def set_config(**kwargs):
+    """
+    Set one or more tidystring options.
+
+    Args:
+        **kwargs: Option names and their new values
+            native_list_threshold (int): Lists with at most this many elements are
+                processed natively instead of through pandas. Set to 0 to always use pandas.
+            native_list_thresholds (dict): Per-function overrides of native_list_threshold,
+                keyed by function name (e.g. {"str_detect": 5000}).
+            dedupe (bool or None): Whether row-wise functions compute each unique value
+                once and broadcast the results. None decides from a sample.
+            dedupe_min_size (int): Series shorter than this are never deduplicated automatically.
+            dedupe_sample_size (int): Number of values sampled to estimate cardinality.
+            dedupe_max_ratio (float): Deduplicate automatically if the fraction of unique
+                values in the sample is at most this value.
+            pattern_cache_size (int): Maximum number of compiled patterns kept in the
+                tidystring pattern cache (see pattern_cache_info).
+            n_jobs (int or None): Number of worker processes used by row-wise functions
+                (str_squish, str_pad, str_search_apply, ...). None runs serially; negative
+                values count back from the number of CPUs (-1 uses all of them).
+            parallel_min_size (int): Inputs with fewer values (after deduplication) than this
+                always run serially.
+            parallel_chunks_per_job (int): Number of chunks the input is split into per worker.
+            stream_chunksize (int): Number of strings processed at a time by stream and
+                stream_chunks.
+
+    Raises:
+        KeyError: If an option name is not valid
+
+    Examples:
+        >>> set_config(native_list_threshold=5000)
+    """
+    for key in kwargs:
+        if key not in _config:
+            raise KeyError(f"Invalid option: '{key}'. Valid options are: {', '.join(_config)}")
+    _config.update(kwargs)
+
+
+@contextmanager
+def config_context(**kwargs):
+    """
+    Temporarily set tidystring options within a with-block.
+
+    Args:
+        **kwargs: Option names and their temporary values (see set_config)
+
+    Examples:
+        >>> with config_context(native_list_threshold=0):
+        ...     str_to_upper(["a", "b"])  # runs through pandas
+        ['A', 'B']
+    """
+    previous = get_config()
+    set_config(**kwargs)
+    try:
+        yield
+    finally:
+        _config.clear()
+        _config.update(previous)
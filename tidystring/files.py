@@ -0,0 +1,462 @@
+"""
+File drivers for tidystring.
+
+transform_file cleans string columns of CSV or Parquet files too large to
+load at once: the file is read in chunks, each chunk's columns are passed
+through tidystring functions or pipelines, and the result is appended to the
+output file by a background thread, so reading and computing the next chunk
+overlaps with writing the previous one.
+
+read_lines opens a newline-delimited text file as a lazy column of lines,
+backed by a memory map. Lines are only decoded chunk by chunk, and filter()
+selects lines by scanning the raw bytes, so non-matching lines are never
+decoded at all.
+
+Parquet support needs the optional pyarrow package.
+"""
+
+import codecs
+import mmap as _mmap
+import re
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+from . import kernels
+from .config import _config
+from .patterns import classify_pattern
+
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+except ImportError:  # pragma: no cover - optional dependency
+    pa = pq = None
+
+_PARQUET_SUFFIXES = {".parquet", ".pq"}
+
+# Chunks waiting for the writer thread; bounds memory if writing is slower than reading
+_MAX_PENDING_WRITES = 2
+
+
+def _file_format(path, file_format):
+    """Return "csv" or "parquet" for a path, inferred from its suffix if not given."""
+    if file_format is None:
+        file_format = "parquet" if Path(path).suffix.lower() in _PARQUET_SUFFIXES else "csv"
+    if file_format not in ("csv", "parquet"):
+        raise ValueError(f"file_format must be 'csv' or 'parquet', got {file_format!r}")
+    if file_format == "parquet" and pq is None:
+        raise ImportError("Parquet files need pyarrow: pip install 'tidystring[parquet]'")
+    return file_format
+
+
+def _read_chunks(src, file_format, chunksize, read_kwargs):
+    """Yield DataFrame chunks of a CSV file, or record batches of a Parquet file."""
+    if file_format == "csv":
+        yield from pd.read_csv(src, chunksize=chunksize, **read_kwargs)
+        return
+
+    parquet = pq.ParquetFile(src)
+    for batch in parquet.iter_batches(batch_size=chunksize, **read_kwargs):
+        yield batch.to_pandas()
+
+
+def _transform_chunk(chunk, transforms):
+    """Apply each column's function to a chunk, in place."""
+    for column, func in transforms.items():
+        if column not in chunk.columns:
+            raise KeyError(f"Column {column!r} not found in the input file")
+        chunk[column] = func(chunk[column])
+    return chunk
+
+
+class _ChunkWriter:
+    """Append DataFrame chunks to a CSV or Parquet file, creating it on the first write."""
+
+    def __init__(self, dst, file_format, write_kwargs):
+        self.dst = dst
+        self.file_format = file_format
+        self.write_kwargs = write_kwargs
+        self.parquet = None
+        self.started = False
+        self.rows = 0
+
+    def write(self, chunk):
+        if self.file_format == "csv":
+            header = not self.started
+            chunk.to_csv(self.dst, mode="w" if header else "a", header=header, index=False, **self.write_kwargs)
+        else:
+            table = pa.Table.from_pandas(chunk, preserve_index=False)
+            if self.parquet is None:
+                self.parquet = pq.ParquetWriter(self.dst, table.schema, **self.write_kwargs)
+            self.parquet.write_table(table.cast(self.parquet.schema))
+        self.started = True
+        self.rows += len(chunk)
+
+    def close(self):
+        if self.parquet is not None:
+            self.parquet.close()
+
+
+def transform_file(src, dst, transforms, chunksize=None, file_format=None, read_kwargs=None, write_kwargs=None):
+    """
+    Transform string columns of a CSV or Parquet file in chunks, writing a new file.
+
+    The input is read chunksize rows at a time (pd.read_csv with chunksize, or
+    Parquet record batches), so memory use does not grow with the file size.
+    Each function in transforms receives a chunk's column as a Series and returns
+    its new values; other columns are copied unchanged. Writing runs on a
+    background thread while the next chunk is read and transformed.
+
+    Args:
+        src (str or Path): Input file
+        dst (str or Path): Output file, in the same format. Overwritten if it exists.
+        transforms (dict): Mapping of column name to a function taking and returning a
+            Series, e.g. a Pipeline, a tidystring function, or a functools.partial of one
+        chunksize (int, optional): Number of rows per chunk. Defaults to None
+            (use the "stream_chunksize" option, see set_config).
+        file_format (str, optional): "csv" or "parquet". Defaults to None (inferred from
+            the suffix of src: .parquet or .pq for Parquet, anything else for CSV).
+        read_kwargs (dict, optional): Keyword arguments for pd.read_csv or
+            pyarrow.parquet.ParquetFile.iter_batches. Defaults to None.
+        write_kwargs (dict, optional): Keyword arguments for DataFrame.to_csv or
+            pyarrow.parquet.ParquetWriter. Defaults to None.
+
+    Returns:
+        int: Number of rows written
+
+    Raises:
+        KeyError: If a column in transforms is not in the file
+        ValueError: If file_format is not "csv" or "parquet"
+        ImportError: If a Parquet file is given and pyarrow is not installed
+
+    Examples:
+        >>> clean = Pipeline().str_trim().str_to_lower()
+        >>> transform_file("users.csv", "users_clean.csv", {"name": clean, "email": str_trim})
+        1250000
+    """
+    file_format = _file_format(src, file_format)
+    chunksize = _config["stream_chunksize"] if chunksize is None else chunksize
+    if chunksize < 1:
+        raise ValueError(f"chunksize must be at least 1, got {chunksize}")
+
+    writer = _ChunkWriter(dst, file_format, write_kwargs or {})
+    pending = deque()
+    try:
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            try:
+                for chunk in _read_chunks(src, file_format, chunksize, read_kwargs or {}):
+                    pending.append(executor.submit(writer.write, _transform_chunk(chunk, transforms)))
+                    while len(pending) > _MAX_PENDING_WRITES:
+                        pending.popleft().result()
+                while pending:
+                    pending.popleft().result()
+            finally:
+                for future in pending:
+                    future.cancel()  # after an error, skip the writes not yet started
+    finally:
+        writer.close()
+    return writer.rows
+
+
+# Line files ----------------------------------
+
+# Bytes scanned at a time when locating newlines
+_NEWLINE_BLOCK_SIZE = 1 << 24
+
+
+def _line_bounds(buffer):
+    """Return int64 arrays with the start and end (exclusive, before "\\n") of each line."""
+    size = len(buffer)
+    view = np.frombuffer(buffer, dtype=np.uint8) if size else np.zeros(0, dtype=np.uint8)
+    newlines = [
+        np.flatnonzero(view[first : first + _NEWLINE_BLOCK_SIZE] == 10) + first
+        for first in range(0, size, _NEWLINE_BLOCK_SIZE)
+    ]
+    ends = np.concatenate(newlines) if newlines else np.zeros(0, dtype=np.int64)
+    if size and (not len(ends) or ends[-1] != size - 1):
+        ends = np.append(ends, size)  # last line without a trailing newline
+    starts = np.concatenate(([0], ends[:-1] + 1)) if len(ends) else ends
+    return starts.astype(np.int64), ends.astype(np.int64)
+
+
+# Regex syntax that could make a scan of the whole buffer differ from matching each
+# line on its own: escapes other than \d \w \b \B \S and escaped punctuation (e.g.
+# \A, \Z, \z, \s, \n, \W, octal), negated classes, inline flags (e.g. (?s)), and
+# raw control characters. All of these are sent to the decoding fallback.
+_LINE_UNSAFE = re.compile(r"\\[^dwbBS\W]|\[\^|\(\?[aiLmsux-]|[\x00-\x1f]")
+
+# Encodings whose bytes a UTF-8 or ASCII pattern can be searched for directly
+_BYTE_ENCODINGS = {"utf-8", "ascii"}
+
+
+def _byte_pattern(pattern, regex, case, plain_text, encoding="utf-8", errors="strict"):
+    """Compile pattern for a scan of the raw bytes, or return None if that could differ from str matching.
+
+    Literals match the same lines in UTF-8 bytes as in text (ASCII literals also
+    with decoding errors replaced or ignored). Regexes (and case-insensitive
+    literals) only do so for ASCII patterns on plain files, ASCII and without the
+    "\\r" that decoding strips from line ends, and only for patterns that cannot
+    match across or depend on line boundaries (see _LINE_UNSAFE).
+    """
+    if codecs.lookup(encoding).name not in _BYTE_ENCODINGS:
+        return None
+
+    flags = 0
+    if isinstance(pattern, re.Pattern):
+        flags = pattern.flags & ~re.UNICODE
+        pattern = pattern.pattern
+    if flags & ~re.IGNORECASE:
+        return None
+    if case is False:
+        flags |= re.IGNORECASE
+
+    kind, literal = classify_pattern(pattern) if regex else ("literal", pattern)
+    if kind == "literal" and not flags:
+        if not literal.isascii() and (errors != "strict" or codecs.lookup(encoding).name == "ascii"):
+            return None
+        return literal.encode("utf-8")
+    if not plain_text or not pattern.isascii():
+        return None
+    if kind == "literal":
+        source = re.escape(literal)
+    elif _LINE_UNSAFE.search(pattern):
+        return None
+    else:
+        source = pattern
+    try:
+        return re.compile(source.encode("ascii"), flags | re.MULTILINE)
+    except re.error:
+        return None
+
+
+class LineFile:
+    """
+    Lines of a text file, decoded lazily in chunks from a memory map.
+
+    Created by read_lines. Iterating yields the lines as strings; chunks() yields
+    them as Series indexed by line number, ready for any tidystring function.
+    filter() narrows the selection by scanning the raw bytes. Lines are split at
+    "\\n"; a trailing "\\r" is removed when a line is decoded.
+
+    Args:
+        buffer (mmap.mmap or bytes): File contents
+        starts (np.ndarray): Byte offset where each line starts
+        ends (np.ndarray): Byte offset where each line ends, before the newline
+        lines (np.ndarray, optional): Selected line numbers. Defaults to None (all lines).
+        encoding (str, optional): Text encoding. Defaults to "utf-8".
+        errors (str, optional): Decoding error handling, as for bytes.decode. Defaults to "strict".
+        chunksize (int, optional): Number of lines per chunk. Defaults to None
+            (use the "stream_chunksize" option, see set_config).
+    """
+
+    def __init__(self, buffer, starts, ends, lines=None, encoding="utf-8", errors="strict", chunksize=None):
+        self.buffer = buffer
+        self.starts = starts
+        self.ends = ends
+        self.lines = lines
+        self.encoding = encoding
+        self.errors = errors
+        self.chunksize = chunksize
+        self._plain = None
+
+    def __len__(self):
+        return len(self.starts) if self.lines is None else len(self.lines)
+
+    def __repr__(self):
+        return f"LineFile({len(self)} lines)"
+
+    def __iter__(self):
+        for chunk in self.chunks():
+            yield from chunk.tolist()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def close(self):
+        """Close the memory map. Lines can no longer be read afterwards."""
+        if isinstance(self.buffer, _mmap.mmap):
+            self.buffer.close()
+
+    def _view(self, lines):
+        return LineFile(self.buffer, self.starts, self.ends, lines, self.encoding, self.errors, self.chunksize)
+
+    def _decode(self, first, last):
+        """Decode selected lines first to last (exclusive) of the selection."""
+        if self.lines is None:
+            text = self.buffer[self.starts[first] : self.ends[last - 1]].decode(self.encoding, self.errors)
+            values = text.split("\n")
+        else:
+            lines = self.lines[first:last]
+            decode = bytes.decode
+            buffer, encoding, errors = self.buffer, self.encoding, self.errors
+            values = [
+                decode(buffer[start:end], encoding, errors)
+                for start, end in zip(self.starts[lines].tolist(), self.ends[lines].tolist())
+            ]
+        if any(value.endswith("\r") for value in values):
+            values = [value[:-1] if value.endswith("\r") else value for value in values]
+        return values
+
+    def chunks(self, chunksize=None):
+        """
+        Yield the selected lines in chunks.
+
+        Args:
+            chunksize (int, optional): Number of lines per chunk. Defaults to None
+                (the chunksize given to read_lines, or the "stream_chunksize" option).
+
+        Yields:
+            pd.Series: Decoded lines, indexed by line number
+        """
+        chunksize = chunksize or self.chunksize or _config["stream_chunksize"]
+        for first in range(0, len(self), chunksize):
+            last = min(first + chunksize, len(self))
+            if self.lines is None:
+                index = pd.RangeIndex(first, last)
+            else:
+                index = pd.Index(self.lines[first:last])
+            yield pd.Series(self._decode(first, last), index=index, dtype=object)
+
+    def apply(self, func, *args, **kwargs):
+        """
+        Apply a tidystring function to each chunk of lines.
+
+        Args:
+            func (callable): tidystring function or Pipeline, taking a Series first
+            *args: Positional arguments for func, after the lines
+            **kwargs: Keyword arguments for func
+
+        Yields:
+            Result of func for each chunk, indexed by line number
+
+        Examples:
+            >>> codes = pd.concat(read_lines("app.log").filter("ERROR").apply(str_extract, "code=(\\\\d+)"))
+        """
+        for chunk in self.chunks():
+            yield func(chunk, *args, **kwargs)
+
+    def to_series(self):
+        """
+        Decode all selected lines.
+
+        Returns:
+            pd.Series: Lines indexed by line number
+        """
+        chunks = list(self.chunks())
+        return pd.concat(chunks) if chunks else pd.Series([], dtype=object)
+
+    def _is_plain(self):
+        """Return True if the file is ASCII without carriage returns (see _byte_pattern)."""
+        if self._plain is None:
+            view = np.frombuffer(self.buffer, dtype=np.uint8) if len(self.buffer) else np.zeros(0, np.uint8)
+            self._plain = self.buffer.find(b"\r") < 0 and all(
+                view[first : first + _NEWLINE_BLOCK_SIZE].max(initial=0) < 128
+                for first in range(0, len(view), _NEWLINE_BLOCK_SIZE)
+            )
+        return self._plain
+
+    def _scan(self, needle):
+        """Return the numbers of lines containing needle (bytes or a bytes regex), one search per matching line."""
+        buffer, ends = self.buffer, self.ends
+        literal = isinstance(needle, bytes)
+        if literal and b"\n" in needle:
+            return np.zeros(0, dtype=np.int64)
+        found = []
+        position, size = 0, len(buffer)
+        while position < size:
+            if literal:
+                start = buffer.find(needle, position)
+                if start < 0:
+                    break
+                line = int(np.searchsorted(ends, start))
+                found.append(line)
+            else:
+                match = needle.search(buffer, position)
+                if match is None:
+                    break
+                line = int(np.searchsorted(ends, match.start()))
+                if line == len(ends):
+                    break  # empty match at the very end, after the last newline
+                # A match running past the end of its line could hide a match of the
+                # line itself, so search that line on its own
+                if match.end() <= ends[line] or needle.search(buffer, int(self.starts[line]), int(ends[line])):
+                    found.append(line)
+            position = int(ends[line]) + 1
+        return np.array(found, dtype=np.int64)
+
+    def filter(self, pattern, regex=True, case=True):
+        """
+        Select the lines matching a pattern, scanning the raw bytes where possible.
+
+        Literal patterns are found with a byte search over the whole file, and
+        regexes with a bytes regex (matching as with re.MULTILINE, each line on its
+        own), so lines that do not match are never decoded. Where bytes and str
+        matching could disagree (encodings other than UTF-8 and ASCII; regexes or
+        case-insensitive literals on non-ASCII or CRLF files, with non-ASCII
+        patterns, or with syntax such as \\A, \\s or inline flags that depends on
+        line boundaries), the lines are decoded and tested as with str_detect.
+
+        Args:
+            pattern (str or re.Pattern): Pattern to look for
+            regex (bool, optional): Whether the pattern is a regex. Defaults to True.
+            case (bool, optional): Whether matching is case sensitive. Defaults to True.
+
+        Returns:
+            LineFile: The matching lines, sharing this file's memory map
+
+        Examples:
+            >>> errors = read_lines("app.log").filter("ERROR")
+            >>> len(errors)
+            1523
+        """
+        needle = _byte_pattern(pattern, regex, case, self._is_plain(), self.encoding, self.errors)
+        if needle is None:
+            detect = kernels.detect(pattern, case=case, regex=regex)
+            selected = [chunk.index[list(map(detect, chunk.tolist()))] for chunk in self.chunks()]
+            return self._view(np.concatenate(selected).astype(np.int64) if selected else np.zeros(0, np.int64))
+
+        lines = self._scan(needle)
+        if self.lines is not None:
+            lines = np.intersect1d(lines, self.lines)
+        return self._view(lines)
+
+
+def read_lines(path, mmap=True, encoding="utf-8", errors="strict", chunksize=None):
+    """
+    Open a newline-delimited text file as a lazy column of lines.
+
+    The file is memory-mapped (or read into memory with mmap=False) and the
+    line boundaries are found in bulk with NumPy; no line is decoded until it
+    is read. Iterate over the result for strings, use chunks() or apply() to
+    run tidystring functions chunk by chunk, and filter() to skip lines by
+    scanning the raw bytes first.
+
+    Args:
+        path (str or Path): Text file to read
+        mmap (bool, optional): Memory-map the file rather than reading it. Defaults to True.
+        encoding (str, optional): Text encoding. Defaults to "utf-8".
+        errors (str, optional): Decoding error handling, as for bytes.decode. Defaults to "strict".
+        chunksize (int, optional): Number of lines per chunk. Defaults to None
+            (use the "stream_chunksize" option, see set_config).
+
+    Returns:
+        LineFile: The lines of the file
+
+    Examples:
+        >>> with read_lines("app.log") as lines:
+        ...     for spans in lines.filter("timeout").apply(str_locate_all, "\\\\d+ms"):
+        ...         print(spans)
+    """
+    with open(path, "rb") as f:
+        if mmap and Path(path).stat().st_size:
+            buffer = _mmap.mmap(f.fileno(), 0, access=_mmap.ACCESS_READ)
+        else:
+            buffer = f.read()
+    starts, ends = _line_bounds(buffer)
+    return LineFile(buffer, starts, ends, encoding=encoding, errors=errors, chunksize=chunksize)
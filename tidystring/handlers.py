@@ -1,4 +1,16 @@
+import os
+import pickle
+import re
+import warnings
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+from itertools import chain
+
+import numpy as np
 import pandas as pd
+from pandas.api.extensions import take
+
+from .config import _config
 
 # Intake / Output -----------------------------
 
@@ -59,6 +71,599 @@ def _string_output(string, str_type):
     return string[0]  # single string
 
 
+def _native_intake(string, name=None):
+    """Check whether input can skip the pandas round-trip.
+
+    Single strings always run natively. Lists run natively if they only hold
+    strings and are no longer than the configured crossover threshold.
+
+    Args:
+        string (str, list, or pd.Series): Input string, list of strings, or pandas Series
+        name (str, optional): Name of the calling function, used to look up a
+            per-function threshold. Defaults to None.
+
+    Returns:
+        bool: True if input can be processed directly by a per-string kernel
+    """
+    if isinstance(string, str):
+        return True
+
+    if isinstance(string, list):
+        threshold = _config["native_list_thresholds"].get(name, _config["native_list_threshold"])
+        return len(string) <= threshold and all(isinstance(s, str) for s in string)
+
+    return False
+
+
+def _native_apply(string, kernel, n_jobs=None):
+    """Apply a per-string kernel to native input, preserving the input type.
+
+    Args:
+        string (str or list): Input accepted by _native_intake
+        kernel (callable): Function mapping a single string to its result
+        n_jobs (int, optional): Number of worker processes for large lists. Defaults to None (use config).
+
+    Returns:
+        Result of kernel for a single string, or list of results for a list
+    """
+    if isinstance(string, str):
+        return kernel(string)
+
+    return _map_values(string, kernel, n_jobs)
+
+
+# Aligned arguments ---------------------------
+
+
+def _aligned_intake(*args):
+    """Check whether any argument holds one value per input element.
+
+    Args:
+        *args: Function arguments that may be scalars or array-likes
+
+    Returns:
+        bool: True if any argument is a list, tuple, numpy array, pandas Series or Index
+    """
+    return any(isinstance(arg, (list, tuple, np.ndarray, pd.Series, pd.Index)) for arg in args)
+
+
+def _aligned_values(arg, string, size):
+    """Return an argument as a list of per-element values.
+
+    Scalars are repeated. A Series argument is aligned with a Series input by index;
+    other array-likes are aligned by position. Missing values become None, and
+    floating-point arrays (e.g. integers with NaN) are converted to integers.
+
+    Args:
+        arg: Scalar or array-like argument
+        string (list or pd.Series): Input collection
+        size (int): Number of input elements
+
+    Returns:
+        list: One value per input element
+
+    Raises:
+        ValueError: If an array-like argument does not have one value per element
+    """
+    if not _aligned_intake(arg):
+        return [arg] * size
+
+    if isinstance(arg, pd.Series) and isinstance(string, pd.Series):
+        values = arg.reindex(string.index)
+    else:
+        values = pd.Series(arg)
+        if len(values) != size:
+            raise ValueError(f"Argument has {len(values)} values but the input has {size} elements")
+
+    if values.dtype.kind == "f":
+        values = values.astype("Int64")
+    if values.hasnans:
+        values = values.astype(object).where(values.notna(), None)
+    return values.tolist()
+
+
+def _aligned_apply(string, kernel, *args):
+    """Apply a kernel taking per-element arguments to every element of a collection.
+
+    The kernel is mapped over the input and argument columns together, so a C-level
+    kernel such as str.rjust runs without any Python code per element. If that fails
+    with a TypeError, elements are processed one by one: elements that are not
+    strings (missing values) are passed through, and elements with a missing
+    argument give None.
+
+    Args:
+        string (list or pd.Series): Input collection
+        kernel (callable): Function called as kernel(s, *args) for each element s
+        *args: Scalars, or array-likes with one value per element (see _aligned_values)
+
+    Returns:
+        list or pd.Series: Results in the type of the input
+
+    Raises:
+        TypeError: If the input is a single string
+    """
+    if isinstance(string, str):
+        raise TypeError("Array-valued arguments need a list or Series input")
+
+    values = string.tolist() if isinstance(string, pd.Series) else string
+    columns = [_aligned_values(arg, string, len(values)) for arg in args]
+
+    try:
+        results = list(map(kernel, values, *columns))
+    except TypeError:
+        # Missing values or arguments, handled per element
+        results = [
+            (None if None in row else kernel(value, *row)) if isinstance(value, str) else value
+            for value, *row in zip(values, *columns)
+        ]
+
+    if isinstance(string, pd.Series):
+        return pd.Series(results, index=string.index, name=string.name)
+    return results
+
+
+def _concat_columns(args, index, sep="_", na_rep=None, na_action="propagate"):
+    """Join Series and scalar arguments element-wise, one column at a time.
+
+    Each Series is aligned with index and converted to a list once; the rows are
+    then joined by mapping sep.join over the zipped columns. Missing values are
+    only looked for if that fails, and only the rows containing them are joined
+    again in Python.
+
+    Args:
+        args (list): Series and scalars to join, in order
+        index (pd.Index): Index of the result
+        sep (str, optional): Separator. Defaults to "_".
+        na_rep (str, optional): Replacement for missing values. Defaults to None.
+        na_action (str, optional): Without na_rep, "propagate" gives NA for rows with
+            a missing value and "skip" leaves missing values out. Defaults to "propagate".
+
+    Returns:
+        pd.Series: Joined strings
+
+    Raises:
+        ValueError: If na_action is not "propagate" or "skip"
+    """
+    if na_action not in ("propagate", "skip"):
+        raise ValueError(f"na_action must be 'propagate' or 'skip', got {na_action!r}")
+
+    size = len(index)
+    aligned = []
+    for arg in args:
+        if isinstance(arg, pd.Series):
+            aligned.append(arg if arg.index.equals(index) else arg.reindex(index))
+        else:
+            aligned.append(None if pd.isna(arg) else str(arg))
+
+    try:
+        columns = [arg.tolist() if isinstance(arg, pd.Series) else [arg] * size for arg in aligned]
+        results = list(map(sep.join, zip(*columns)))
+    except TypeError:
+        # Missing or non-string values: fill them, join, then fix up those rows
+        fill = "" if na_rep is None else na_rep
+        columns, masks = [], []
+        for arg in aligned:
+            if isinstance(arg, pd.Series):
+                mask = arg.isna().to_numpy(dtype=bool)
+                columns.append(arg.astype(str).where(~mask, fill).tolist())
+                masks.append(mask)
+            else:
+                columns.append([fill if arg is None else arg] * size)
+                masks.append(np.full(size, arg is None))
+        results = list(map(sep.join, zip(*columns)))
+
+        if na_rep is None:
+            for i in np.flatnonzero(np.logical_or.reduce(masks)).tolist():
+                if na_action == "skip":
+                    results[i] = sep.join(column[i] for column, mask in zip(columns, masks) if not mask[i])
+                else:
+                    results[i] = None
+
+    return pd.Series(results, index=index)
+
+
+def _locate_spans(string, kernel):
+    """Apply a kernel returning a (start, end) pair to every element, into int32 columns.
+
+    Args:
+        string (str, list, or pd.Series): Input string or collection
+        kernel (callable): Function returning (start, end), or (-1, -1), for one string
+
+    Returns:
+        list or pd.DataFrame: [start, end] for a single string, or a DataFrame with
+            "start" and "end" columns. The columns are int32, or nullable Int32 with
+            NA for missing values if there are any.
+    """
+    if isinstance(string, str):
+        return list(kernel(string))
+
+    values = string.tolist() if isinstance(string, pd.Series) else string
+    missing = None
+    try:
+        spans = list(map(kernel, values))
+    except (TypeError, AttributeError):
+        missing = np.array([not isinstance(value, str) for value in values], dtype=bool)
+        spans = [kernel(value) if isinstance(value, str) else (-1, -1) for value in values]
+
+    pairs = np.fromiter(chain.from_iterable(spans), dtype=np.int32, count=2 * len(spans)).reshape(-1, 2)
+    index = string.index if isinstance(string, pd.Series) else None
+    result = pd.DataFrame(pairs, index=index, columns=["start", "end"])
+    if missing is not None and missing.any():
+        result = result.astype("Int32")
+        result[missing] = pd.NA
+    return result
+
+
+# Split columns -------------------------------
+
+_SPLIT_CHUNK_SIZE = 16_384
+
+
+def _split_columns(string, kernel, n=None):
+    """Split every element of a collection and collect the parts as columns.
+
+    The input is processed in chunks. Each chunk is split and turned straight
+    into a DataFrame, so the per-row lists only exist for one chunk at a time,
+    and the chunks are then concatenated. Missing values give missing parts.
+
+    Args:
+        string (str, list, or pd.Series): Input string or collection
+        kernel (callable): Function splitting one string into a list of parts
+        n (int, optional): Number of columns. Defaults to None (as many as the
+            longest split, as with Series.str.split(expand=True)).
+
+    Returns:
+        list or pd.DataFrame: Padded parts for a single string, or one column per
+            part for a list or Series
+    """
+    if isinstance(string, str):
+        parts = list(kernel(string))
+        width = len(parts) if n is None else n
+        return parts + [None] * (width - len(parts))
+
+    values = string.tolist() if isinstance(string, pd.Series) else string
+    frames = []
+    for start in range(0, len(values), _SPLIT_CHUNK_SIZE):
+        chunk = values[start : start + _SPLIT_CHUNK_SIZE]
+        try:
+            rows = list(map(kernel, chunk))
+        except (TypeError, AttributeError):
+            rows = [kernel(value) if isinstance(value, str) else [] for value in chunk]
+        frames.append(pd.DataFrame(rows))
+
+    result = pd.concat(frames, ignore_index=True) if frames else pd.DataFrame(index=pd.RangeIndex(0))
+    if n is not None and len(result.columns) != n:
+        result = result.reindex(columns=range(n))
+    if isinstance(string, pd.Series):
+        result.index = string.index
+    return result
+
+
+# Pattern counts ------------------------------
+
+_COUNT_CHUNK_SIZE = 16_384
+
+
+def _count_matrix(values, width, scans, separate, dtype=np.int32, case=True):
+    """Count many patterns in every string into an n x k matrix.
+
+    Patterns counted separately fill their column with one kernel pass each.
+    Combined literals (captured by group 1, or by one group each if case
+    insensitive) are found in one scan per chunk: the chunk's strings are joined
+    with a NUL separator, so the matches can be mapped back to rows by position. If a literal contains NUL, the strings are scanned
+    one at a time instead.
+
+    Args:
+        values (list): Strings to scan; missing values must already be replaced by ""
+        width (int): Number of patterns
+        scans (list): (combined pattern, table) pairs (see combine_counters)
+        separate (list): (column, kernel) pairs for patterns counted on their own
+        dtype (type, optional): Integer dtype of the matrix. Defaults to np.int32.
+        case (bool, optional): Whether the scans were combined case sensitively.
+            Defaults to True.
+
+    Returns:
+        np.ndarray: Matrix with one row per string and one column per pattern
+    """
+    size = len(values)
+    matrix = np.zeros((size, width), dtype=dtype)
+
+    for column, kernel in separate:
+        matrix[:, column] = np.fromiter(map(kernel, values), dtype=dtype, count=size)
+
+    for combined, table in scans:
+        joinable = "\0" not in combined.pattern
+        for first in range(0, size, _COUNT_CHUNK_SIZE):
+            chunk = values[first : first + _COUNT_CHUNK_SIZE]
+            if joinable:
+                matches = list(combined.finditer("\0".join(chunk)))
+                ends = np.cumsum([len(value) + 1 for value in chunk])
+                starts = np.fromiter(map(re.Match.start, matches), np.int64, len(matches))
+                rows = np.searchsorted(ends, starts, "right")
+            else:
+                found = [(row, match) for row, value in enumerate(chunk) for match in combined.finditer(value)]
+                rows = np.fromiter((row for row, _ in found), np.int64, len(found))
+                matches = [match for _, match in found]
+
+            if case is False:
+                keys = [match.lastindex for match in matches]
+            else:
+                keys = [match.group(1) for match in matches]
+            columns = np.fromiter(map(table.__getitem__, keys), np.int64, len(rows))
+            np.add.at(matrix, (rows + first, columns), 1)
+    return matrix
+
+
+# Batch callbacks -----------------------------
+
+
+def _batch_search_apply(values, regex, func, kwargs, memo=False):
+    """Apply a vectorized function to every regex match of many strings at once.
+
+    The first pass collects the matches of all strings, func is called once on
+    them as a Series (holding each distinct match once if memo is set), and the
+    second pass substitutes the results back in order. Missing values are
+    passed through unchanged.
+
+    Args:
+        values (list): Input strings
+        regex (re.Pattern): Compiled pattern
+        func (callable): Function mapping a Series of matches to a sequence of
+            replacement strings of the same length
+        kwargs (dict): Keyword arguments for func
+        memo (bool, optional): Call func on distinct matches only. Defaults to False.
+
+    Returns:
+        list: Result for each input value
+
+    Raises:
+        ValueError: If func does not return one result per match
+    """
+    strings = [value for value in values if isinstance(value, str)]
+    if regex.groups:
+        texts = [match.group() for value in strings for match in regex.finditer(value)]
+    else:
+        texts = [text for value in strings for text in regex.findall(value)]
+
+    queries = list(dict.fromkeys(texts)) if memo else texts
+    replaced = list(func(pd.Series(queries, dtype=object), **kwargs)) if queries else []
+    if len(replaced) != len(queries):
+        raise ValueError(f"func returned {len(replaced)} results for {len(queries)} matches")
+    if memo:
+        replaced = map(dict(zip(queries, replaced)).__getitem__, texts)
+
+    # re.sub finds the same matches as finditer; next(replacements, match) hands
+    # out the results in order without a Python-level callback
+    replace = partial(next, iter(replaced))
+    return [regex.sub(replace, value) if isinstance(value, str) else value for value in values]
+
+
+# Column schemas ------------------------------
+
+_SCHEMA_ALIASES = {
+    "int": "Int64",
+    "float": "float64",
+    "str": "str",
+    "category": "category",
+}
+
+_DATETIME_ALIASES = ("datetime", "datetime64", "datetime64[ns]")
+
+
+def _apply_schema(frame, dtypes):
+    """Convert the columns of a DataFrame of strings to the given dtypes.
+
+    All columns are converted in one astype call, with "int" mapped to the
+    nullable Int64 since missing values are common; datetime columns are
+    parsed with pd.to_datetime.
+
+    Args:
+        frame (pd.DataFrame): Columns to convert
+        dtypes (dict): Column name or position to "int", "float", "datetime",
+            "category", "str", or any dtype accepted by astype
+
+    Returns:
+        pd.DataFrame: The converted frame
+
+    Raises:
+        KeyError: If a column in dtypes is not in the frame
+    """
+    casts = {}
+    for column, dtype in dtypes.items():
+        if column not in frame.columns:
+            raise KeyError(f"Column {column!r} is not in the result. Columns are: {list(frame.columns)}")
+        if isinstance(dtype, str):
+            dtype = _SCHEMA_ALIASES.get(dtype, dtype)
+        if dtype in _DATETIME_ALIASES:
+            frame[column] = pd.to_datetime(frame[column])
+        else:
+            casts[column] = dtype
+    return frame.astype(casts) if casts else frame
+
+
+# Parallel execution --------------------------
+
+
+_executor = None
+_executor_jobs = None
+
+
+def _parallel_jobs(size, n_jobs=None):
+    """Decide how many worker processes to use for an input of a given size.
+
+    Args:
+        size (int): Number of values to process
+        n_jobs (int, optional): Per-call override. Defaults to None (use the "n_jobs" option).
+            Negative values count back from the number of CPUs (-1 uses all of them).
+
+    Returns:
+        int: Number of worker processes, or 1 to run serially
+    """
+    if n_jobs is None:
+        n_jobs = _config["n_jobs"]
+    if n_jobs is None or size < _config["parallel_min_size"]:
+        return 1
+    if n_jobs < 0:
+        n_jobs = max(1, (os.cpu_count() or 1) + 1 + n_jobs)
+    return max(1, min(n_jobs, size))
+
+
+def _get_executor(n_jobs):
+    """Return a process pool with n_jobs workers, reusing the previous one if possible."""
+    global _executor, _executor_jobs
+    if _executor is None or _executor_jobs != n_jobs:
+        if _executor is not None:
+            _executor.shutdown()
+        _executor = ProcessPoolExecutor(max_workers=n_jobs)
+        _executor_jobs = n_jobs
+    return _executor
+
+
+def _map_chunk(kernel, values):
+    return [kernel(value) for value in values]
+
+
+def _map_values(values, kernel, n_jobs=None):
+    """Apply a kernel to a list of values, in chunks on a process pool if worthwhile.
+
+    Chunks are submitted in order and their results concatenated in the same
+    order. Kernels that cannot be pickled run serially, with a warning.
+
+    Args:
+        values (list): Values to process
+        kernel (callable): Function mapping a single value to its result
+        n_jobs (int, optional): Per-call override for the number of processes. Defaults to None.
+
+    Returns:
+        list: Results in the order of values
+    """
+    jobs = _parallel_jobs(len(values), n_jobs)
+    if jobs == 1:
+        return [kernel(value) for value in values]
+
+    try:
+        pickle.dumps(kernel)
+    except Exception as error:
+        warnings.warn(f"Running serially because the function cannot be pickled: {error}", RuntimeWarning)
+        return [kernel(value) for value in values]
+
+    size = -(-len(values) // (jobs * _config["parallel_chunks_per_job"]))
+    chunks = [values[i : i + size] for i in range(0, len(values), size)]
+    results = []
+    for chunk in _get_executor(jobs).map(_map_chunk, [kernel] * len(chunks), chunks):
+        results.extend(chunk)
+    return results
+
+
+def _categorical_intake(string):
+    """Check whether input is a categorical pandas Series.
+
+    Args:
+        string (str, list, or pd.Series): Input string, list of strings, or pandas Series
+
+    Returns:
+        bool: True if input is a pd.Series with categorical dtype
+    """
+    return isinstance(string, pd.Series) and isinstance(string.dtype, pd.CategoricalDtype)
+
+
+def _categorical_apply(string, func, *args, **kwargs):
+    """Apply a tidystring function to the categories of a categorical Series only.
+
+    The function runs once per category rather than once per row. String results
+    are returned as a new categorical, merging categories the transform collapses;
+    boolean and numeric results are broadcast back to rows through the codes.
+
+    Args:
+        string (pd.Series): Categorical input Series
+        func (callable): tidystring function to apply
+        *args: Positional arguments for func
+        **kwargs: Keyword arguments for func
+
+    Returns:
+        pd.Series: Result aligned with the input index
+    """
+    categories = pd.Series(string.cat.categories)
+    result = func(categories, *args, **kwargs)
+    codes = string.cat.codes.to_numpy()
+
+    if result.dtype.kind == "b":
+        values = take(result.to_numpy(), codes, allow_fill=True, fill_value=False)
+    elif result.dtype.kind in "iuf":
+        values = take(result.to_numpy(), codes, allow_fill=True)
+    else:
+        new_codes, new_categories = pd.factorize(result)
+        codes = take(new_codes, codes, allow_fill=True, fill_value=-1)
+        values = pd.Categorical.from_codes(codes, categories=new_categories)
+
+    return pd.Series(values, index=string.index, name=string.name)
+
+
+def _dedupe_intake(string, dedupe=None):
+    """Decide whether a Series should be deduplicated before a row-wise kernel.
+
+    Unless set explicitly (per call or through the "dedupe" option), the decision
+    is made from the fraction of unique values in an evenly strided sample.
+
+    Args:
+        string (pd.Series): Input Series
+        dedupe (bool, optional): Per-call override. Defaults to None (use config).
+
+    Returns:
+        bool: True if unique values should be computed once and broadcast
+    """
+    if dedupe is None:
+        dedupe = _config["dedupe"]
+    if dedupe is not None:
+        return bool(dedupe)
+
+    if len(string) < _config["dedupe_min_size"]:
+        return False
+
+    step = max(1, len(string) // _config["dedupe_sample_size"])
+    sample = string.iloc[::step].tolist()
+    return len(set(sample)) <= _config["dedupe_max_ratio"] * len(sample)
+
+
+def _series_apply(string, kernel, dedupe=None, n_jobs=None):
+    """Apply a per-string kernel to every element of a Series.
+
+    With deduplication, the input is factorized, the kernel runs once per unique
+    value, and results are broadcast back to rows (rows with equal values share
+    the same result object). Missing values stay missing either way and are never
+    passed to the kernel. Large inputs (after deduplication) can be split across
+    worker processes, see _map_values.
+
+    Args:
+        string (pd.Series): Input Series
+        kernel (callable): Function mapping a single string to its result
+        dedupe (bool, optional): Per-call override for deduplication. Defaults to None.
+        n_jobs (int, optional): Per-call override for the number of processes. Defaults to None.
+
+    Returns:
+        pd.Series: Results aligned with the input index
+    """
+    if not _dedupe_intake(string, dedupe):
+        if _parallel_jobs(len(string), n_jobs) == 1:
+            if isinstance(string.dtype, pd.CategoricalDtype):
+                # Categorical.map would map the categories and return a categorical
+                string = string.astype(object)
+            return string.map(kernel, na_action="ignore")
+        missing = string.isna().tolist()
+        values = string.tolist()
+        mapped = iter(_map_values([value for value, na in zip(values, missing) if not na], kernel, n_jobs))
+        results = [value if na else next(mapped) for value, na in zip(values, missing)]
+        return pd.Series(results, index=string.index, name=string.name)
+
+    codes, uniques = pd.factorize(string)
+    if _parallel_jobs(len(uniques), n_jobs) == 1:
+        results = pd.Series(uniques, dtype=object).map(kernel).to_numpy()
+    else:
+        results = pd.Series(_map_values(list(uniques), kernel, n_jobs), dtype=object).to_numpy()
+    values = take(results, codes, allow_fill=True)
+    return pd.Series(values, index=string.index, name=string.name)
+
+
 def _handle_inplace(df, kwargs):
     """Handle inplace and copy operations for DataFrame modifications.
 
@@ -0,0 +1,597 @@
+"""
+Per-string kernels for tidystring.
+
+Each factory in this module mirrors the keyword arguments of the pandas
+``.str`` method (or the row-wise closure) behind the matching tidystring
+function, and returns a callable that maps a single ``str`` to its result.
+Kernels are built from module-level functions and ``functools.partial`` so
+that they can be composed and pickled.
+"""
+
+import re
+import textwrap
+from functools import lru_cache, partial
+
+from .keywords import keyword_matcher
+from .patterns import combine_patterns, compile_pattern, literal_route
+
+# Helpers ----------------------------------------------------------
+
+
+def _search(regex, s):
+    return regex.search(s) is not None
+
+
+def _contains(pattern, s):
+    return pattern in s
+
+
+def _contains_nocase(pattern, s):
+    return pattern in s.upper()
+
+
+def _isin(values, s):
+    return s in values
+
+
+def _literal_count(pattern, s):
+    return s.count(pattern)
+
+
+def _sub(regex, repl, count, s):
+    return regex.sub(repl, s, count)
+
+
+def _replace(pattern, repl, count, s):
+    return s.replace(pattern, repl, count)
+
+
+def _extract(regex, s):
+    match = regex.search(s)
+    if match is None:
+        return None
+    return match.group(1)
+
+
+def _extract_groups(regex, s):
+    match = regex.search(s)
+    if match is None:
+        return ()
+    return match.groups()
+
+
+def _re_split(regex, maxsplit, s):
+    return regex.split(s, maxsplit=maxsplit)
+
+
+def _split(pattern, maxsplit, s):
+    return s.split(pattern, maxsplit)
+
+
+def _strip(to_strip, s):
+    return s.strip(to_strip)
+
+
+def _slice(start, stop, step, s):
+    return s[start:stop:step]
+
+
+def _count(regex, s):
+    return len(regex.findall(s))
+
+
+def _find(sub, start, end, s):
+    if end is None:
+        return s.find(sub, start)
+    return s.find(sub, start, end)
+
+
+def _search_start(regex, start, end, s):
+    # Negative bounds count from the end, as in str.find
+    start, end, _ = slice(start, end).indices(len(s))
+    match = regex.search(s, start, end)
+    if match is None:
+        return -1
+    return match.start()
+
+
+def _find_span(sub, start, end, s):
+    i = s.find(sub, start, len(s) if end is None else end)
+    if i < 0:
+        return -1, -1
+    return i, i + len(sub)
+
+
+def _search_span(regex, start, end, s):
+    start, end, _ = slice(start, end).indices(len(s))
+    match = regex.search(s, start, end)
+    if match is None:
+        return -1, -1
+    return match.span()
+
+
+def _locate_all(regex, s):
+    return [[match.start(), match.end()] for match in regex.finditer(s)]
+
+
+def _locate_flat(regex, s):
+    return [i for match in regex.finditer(s) for i in match.span()]
+
+
+def _pad(width, side, pad, s):
+    if len(s) >= width:
+        return s
+
+    if side == "left":
+        return pad * (width - len(s)) + s
+    elif side == "right":
+        return s + pad * (width - len(s))
+
+    left_pad = (width - len(s)) // 2
+    right_pad = width - len(s) - left_pad
+    return pad * left_pad + s + pad * right_pad
+
+
+def _pad_row(side, s, width, pad):
+    return _pad(width, side, pad, s)
+
+
+def _pad_both(s, width, pad):
+    # Extra padding goes on the right
+    return (pad * ((width - len(s)) // 2) + s).ljust(width, pad)
+
+
+def _repeat(times, s):
+    return s * times
+
+
+_WHITESPACE = re.compile(r"\s+")
+
+
+def _squish(s):
+    # Trim whitespace and replace multiple spaces with single space
+    return _WHITESPACE.sub(" ", s.strip())
+
+
+def _wrap(width, indent, exdent, s):
+    # First, handle the indent for the first line
+    result = " " * indent + s
+
+    # Then wrap the text
+    if exdent > 0:
+        # Use textwrap with subsequent_indent for exdent
+        wrapper = textwrap.TextWrapper(
+            width=width, initial_indent="", subsequent_indent=" " * exdent, break_long_words=True
+        )
+        return wrapper.fill(result)
+
+    # Use standard textwrap
+    return textwrap.fill(result, width=width)
+
+
+def _upper_cut(n, s):
+    return s[:n].upper() + s[n:]
+
+
+def _startswith(pattern, s):
+    return s.startswith(pattern)
+
+
+def _endswith(pattern, s):
+    return s.endswith(pattern)
+
+
+_CAMEL_BOUNDARY = re.compile(r"(?<!^)(?=[A-Z])")
+
+
+def _camel_to_snake(s):
+    return _CAMEL_BOUNDARY.sub("_", s).lower()
+
+
+def _snake_to_camel(s):
+    return "".join(x.capitalize() or "_" for x in s.split("_"))
+
+
+def _search_apply(regex, func, kwargs, s):
+    return regex.sub(lambda m: func(m.group(), **kwargs), s)
+
+
+# Words of an identifier: split at runs of spaces, underscores and hyphens, before
+# an uppercase letter following a lowercase letter or digit, and before the last
+# capital of an acronym ("HTTPServer" -> "HTTP", "Server")
+_WORD_BOUNDARY = re.compile(r"[\s_\-]+|(?<=[a-z0-9])(?=[A-Z])|(?<=[A-Z])(?=[A-Z][a-z])")
+
+
+def _case_words(s):
+    return [word for word in _WORD_BOUNDARY.split(s) if word]
+
+
+def _to_snake(s):
+    return "_".join(_case_words(s)).lower()
+
+
+def _to_kebab(s):
+    return "-".join(_case_words(s)).lower()
+
+
+def _to_constant(s):
+    return "_".join(_case_words(s)).upper()
+
+
+def _to_pascal(s):
+    return "".join(map(str.capitalize, _case_words(s)))
+
+
+def _to_camel(s):
+    words = _case_words(s)
+    return words[0].lower() + "".join(map(str.capitalize, words[1:])) if words else ""
+
+
+_CASES = {
+    "snake": _to_snake,
+    "camel": _to_camel,
+    "pascal": _to_pascal,
+    "kebab": _to_kebab,
+    "constant": _to_constant,
+}
+
+_RECASE = {
+    "lower": str.lower,
+    "upper": str.upper,
+    "title": str.title,
+    "snakecase": _camel_to_snake,
+    "camelcase": _snake_to_camel,
+    "pascalcase": _to_pascal,
+    "kebabcase": _to_kebab,
+    "constantcase": _to_constant,
+}
+
+# Recase functions written in Python, worth memoizing per token
+_MEMO_RECASE = {"snakecase", "camelcase", "pascalcase", "kebabcase", "constantcase"}
+
+_MEMO_SIZE = 8192
+
+
+class _Memo:
+    """Bounded memo of a str -> str function, for tokens that repeat across strings.
+
+    The memo is cleared when full, so it keeps at most maxsize entries.
+    """
+
+    def __init__(self, func, maxsize=_MEMO_SIZE):
+        self.func = func
+        self.maxsize = maxsize
+        self.cache = {}
+
+    def __call__(self, s):
+        try:
+            return self.cache[s]
+        except KeyError:
+            pass
+        if len(self.cache) >= self.maxsize:
+            self.cache.clear()
+        result = self.cache[s] = self.func(s)
+        return result
+
+    def __getstate__(self):
+        return self.func, self.maxsize
+
+    def __setstate__(self, state):
+        self.func, self.maxsize = state
+        self.cache = {}
+
+
+def _search_recase(regex, recase, s):
+    return regex.sub(lambda m: recase(m.group()), s)
+
+
+def _translate(table, s):
+    return s.translate(table)
+
+
+@lru_cache(maxsize=256)
+def _translation_table(mapping, delete):
+    table = str.maketrans(dict(mapping))
+    table.update(str.maketrans("", "", delete))
+    return table
+
+
+_REPLACE_EACH_MAX = 16
+
+
+def _translation_value(value):
+    if value is None:
+        return ""
+    return chr(value) if isinstance(value, int) else value
+
+
+def _replace_each(pairs, s):
+    for old, new in pairs:
+        s = s.replace(old, new)
+    return s
+
+
+def _dispatch_text(table, match):
+    return table[match.group()]
+
+
+def _dispatch_index(table, match):
+    return table[match.lastindex]
+
+
+def _dispatch_group(table, match):
+    replacement, template = table[match.lastindex]
+    return match.expand(replacement) if template else replacement
+
+
+def _replace_all(regex, dispatch, s):
+    return regex.sub(dispatch, s)
+
+
+# Factories --------------------------------------------------------
+
+
+def detect(pattern, case=True, flags=0, na=None, regex=True):
+    """Build a kernel mirroring ``Series.str.contains``."""
+    kind, literal = literal_route(pattern, regex, case, flags)
+    if kind == "literal":
+        return partial(_contains, literal)
+    elif kind == "prefix":
+        return partial(_startswith, literal)
+    elif kind == "suffix":
+        return partial(_endswith, (literal, literal + "\n"))
+    elif kind == "exact":
+        return partial(_isin, (literal, literal + "\n"))
+
+    if regex:
+        if not case:
+            flags |= re.IGNORECASE
+        return partial(_search, compile_pattern(pattern, flags))
+    elif case:
+        return partial(_contains, pattern)
+    return partial(_contains_nocase, pattern.upper())
+
+
+def replace(pattern, replacement, n=-1, case=None, flags=0, regex=False):
+    """Build a kernel mirroring ``Series.str.replace``."""
+    if n is None:
+        n = -1
+
+    # A regex replacement without group references can run as str.replace
+    if regex and isinstance(replacement, str) and "\\" not in replacement:
+        kind, literal = literal_route(pattern, regex, case, flags)
+        if kind == "literal":
+            return partial(_replace, literal, replacement, n if n > 0 else -1)
+
+    if case is False:
+        flags |= re.IGNORECASE
+
+    if regex or flags or callable(replacement):
+        if regex is False:
+            if isinstance(pattern, re.Pattern):
+                raise ValueError("Cannot use a compiled regex as replacement pattern with regex=False")
+            pattern = re.escape(pattern)
+        return partial(_sub, compile_pattern(pattern, flags), replacement, max(n, 0))
+    return partial(_replace, pattern, replacement, n)
+
+
+def remove(pattern, **kwargs):
+    """Build a kernel removing every occurrence of ``pattern``."""
+    return replace(pattern, "", **kwargs)
+
+
+def extract(pattern, flags=0):
+    """Build a kernel returning the first capture group of the first match."""
+    regex = compile_pattern(pattern, flags)
+    if regex.groups == 0:
+        raise ValueError("pattern contains no capture groups")
+    return partial(_extract, regex)
+
+
+def extract_groups(pattern, flags=0):
+    """Build a kernel returning every capture group of the first match, or ``()``."""
+    regex = compile_pattern(pattern, flags)
+    if regex.groups == 0:
+        raise ValueError("pattern contains no capture groups")
+    return partial(_extract_groups, regex)
+
+
+def split(pattern=None, n=-1, regex=None):
+    """Build a kernel mirroring ``Series.str.split``."""
+    if regex is not False:
+        kind, literal = literal_route(pattern)
+        if kind == "literal":
+            return partial(_split, literal, -1 if n in (None, 0) else n)
+
+    if isinstance(pattern, re.Pattern) or (
+        pattern is not None and (regex is True or (regex is None and len(pattern) != 1))
+    ):
+        return partial(_re_split, compile_pattern(pattern), 0 if n in (None, -1) else n)
+    return partial(_split, pattern, -1 if n in (None, 0) else n)
+
+
+def trim(to_strip=None):
+    """Build a kernel mirroring ``Series.str.strip``."""
+    return partial(_strip, to_strip)
+
+
+def length():
+    """Build a kernel mirroring ``Series.str.len``."""
+    return len
+
+
+def sub(start=None, stop=None, step=None):
+    """Build a kernel mirroring ``Series.str.slice``."""
+    return partial(_slice, start, stop, step)
+
+
+def count(pattern, flags=0):
+    """Build a kernel mirroring ``Series.str.count``."""
+    kind, literal = literal_route(pattern, flags=flags)
+    if kind == "literal":
+        return partial(_literal_count, literal)
+    return partial(_count, compile_pattern(pattern, flags))
+
+
+def locate(pattern, start=0, end=None):
+    """Build a kernel returning the start of the first regex match, or -1."""
+    kind, literal = literal_route(pattern)
+    if kind == "literal":
+        return partial(_find, literal, start, end)
+    return partial(_search_start, compile_pattern(pattern), start, end)
+
+
+def locate_span(pattern, start=0, end=None):
+    """Build a kernel returning ``(start, end)`` of the first regex match, or ``(-1, -1)``."""
+    kind, literal = literal_route(pattern)
+    if kind == "literal":
+        return partial(_find_span, literal, start, end)
+    return partial(_search_span, compile_pattern(pattern), start, end)
+
+
+def locate_all(pattern):
+    """Build a kernel returning ``[start, end]`` pairs for every match."""
+    return partial(_locate_all, compile_pattern(pattern))
+
+
+def locate_flat(pattern):
+    """Build a kernel returning ``[start, end, start, end, ...]`` for every match."""
+    return partial(_locate_flat, compile_pattern(pattern))
+
+
+def pad(width, side="both", pad=" "):
+    """Build a kernel padding a string to ``width`` on the given side."""
+    if side not in ("left", "right", "both"):
+        raise ValueError("Side must be one of 'left', 'right', or 'both'")
+    return partial(_pad, width, side, pad)
+
+
+def pad_rows(side="both", single_char=True):
+    """Build a kernel ``(s, width, pad)`` padding with per-element width and pad."""
+    if side not in ("left", "right", "both"):
+        raise ValueError("Side must be one of 'left', 'right', or 'both'")
+    if not single_char:
+        return partial(_pad_row, side)
+    return {"left": str.rjust, "right": str.ljust, "both": _pad_both}[side]
+
+
+def dup(times):
+    """Build a kernel mirroring ``Series.str.repeat``."""
+    return partial(_repeat, times)
+
+
+def squish():
+    """Build a kernel trimming and collapsing internal whitespace."""
+    return _squish
+
+
+def wrap(width=80, indent=0, exdent=0):
+    """Build a kernel wrapping text to ``width``."""
+    return partial(_wrap, width, indent, exdent)
+
+
+def to_title():
+    """Build a kernel mirroring ``Series.str.title``."""
+    return str.title
+
+
+def to_upper():
+    """Build a kernel mirroring ``Series.str.upper``."""
+    return str.upper
+
+
+def to_lower():
+    """Build a kernel mirroring ``Series.str.lower``."""
+    return str.lower
+
+
+def upper_cut(n=1):
+    """Build a kernel capitalizing the first ``n`` characters."""
+    return partial(_upper_cut, n)
+
+
+def startswith(pattern, na=None):
+    """Build a kernel mirroring ``Series.str.startswith``."""
+    return partial(_startswith, pattern)
+
+
+def endswith(pattern, na=None):
+    """Build a kernel mirroring ``Series.str.endswith``."""
+    return partial(_endswith, pattern)
+
+
+def camel_to_snake():
+    """Build a kernel converting camelCase to snake_case."""
+    return _camel_to_snake
+
+
+def snake_to_camel():
+    """Build a kernel converting snake_case to CamelCase."""
+    return _snake_to_camel
+
+
+def search_apply(pattern, func, memo=False, **kwargs):
+    """Build a kernel applying ``func`` to every regex match, optionally memoized by match text."""
+    if memo:
+        return partial(_search_apply, compile_pattern(pattern), _Memo(partial(func, **kwargs)), {})
+    return partial(_search_apply, compile_pattern(pattern), func, kwargs)
+
+
+def to_case(case):
+    """Build a kernel converting an identifier to snake, camel, pascal, kebab or constant case."""
+    return _CASES[case]
+
+
+def search_recase(pattern, case):
+    """Build a kernel recasing every regex match, memoizing repeated matches."""
+    recase = _Memo(_RECASE[case]) if case in _MEMO_RECASE else _RECASE[case]
+    return partial(_search_recase, compile_pattern(pattern), recase)
+
+
+def detect_any(keywords, case=True, whole_word=False):
+    """Build a kernel checking for any of several literal keywords."""
+    return keyword_matcher(keywords, case, whole_word).search
+
+
+def which_keyword(keywords, which="first", case=True, whole_word=False):
+    """Build a kernel returning the first (or all) matched keyword ids."""
+    matcher = keyword_matcher(keywords, case, whole_word)
+    if which == "first":
+        return matcher.first
+    if which == "all":
+        return matcher.findall
+    raise ValueError(f"which must be 'first' or 'all', got {which!r}")
+
+
+def replace_all(replacements, regex=False, case=True, flags=0):
+    """Build a kernel applying a pattern-to-replacement mapping in one scan."""
+    combined, table = combine_patterns(replacements, regex, case, flags)
+    if regex:
+        dispatch = partial(_dispatch_group, table)
+    elif case is False:
+        dispatch = partial(_dispatch_index, table)
+    else:
+        dispatch = partial(_dispatch_text, table)
+    return partial(_replace_all, combined, dispatch)
+
+
+def translation_table(table=None, delete=""):
+    """Return a cached ``str.maketrans`` table for a character mapping plus deletions."""
+    return _translation_table(frozenset((table or {}).items()), delete)
+
+
+def translate(table=None, delete=""):
+    """Build a kernel mirroring ``Series.str.translate``."""
+    table = translation_table(table, delete)
+
+    # str.translate has a fixed cost per call, so a few characters are replaced
+    # faster one at a time, unless a replacement reintroduces a mapped character
+    pairs = tuple((chr(key), _translation_value(value)) for key, value in table.items())
+    if len(pairs) <= _REPLACE_EACH_MAX and not any(old in new for old, _ in pairs for _, new in pairs):
+        return partial(_replace_each, pairs)
+    return partial(_translate, table)
+
+
+def replace_chars(chars, replacement=""):
+    """Build a kernel replacing each of ``chars`` with ``replacement``."""
+    return translate(dict.fromkeys(chars, replacement))
@@ -0,0 +1,224 @@
+"""
+Multi-keyword matching for tidystring.
+
+This module implements an Aho-Corasick automaton, which finds any of a large
+set of literal keywords in a single left-to-right pass over each string. The
+cost of a scan grows with the length of the string and the number of matches,
+not with the number of keywords, unlike a regex alternation of the same words.
+"""
+
+from collections import deque
+from functools import lru_cache
+
+
+def _is_word(char):
+    """Return True if char is a regex word character (\\w)."""
+    return char.isalnum() or char == "_"
+
+
+def _lowered(string):
+    """Lowercase string for scanning.
+
+    Returns:
+        tuple: (lowercased text, owner), where owner is None if the text has the
+            length of string, and otherwise gives for each position of the text
+            the position in string of the character it was lowercased from
+            (e.g. "İ" lowercases to two characters)
+    """
+    text = string.lower()
+    if len(text) == len(string):
+        return text, None
+    chars = [char.lower() for char in string]
+    return "".join(chars), [k for k, char in enumerate(chars) for _ in char]
+
+
+class KeywordMatcher:
+    """
+    Aho-Corasick automaton built once from a list of keywords.
+
+    Keyword ids are positions in the keyword list. Matchers are reusable across
+    calls and can be passed wherever tidystring accepts a keyword list.
+
+    Args:
+        keywords (list): Non-empty literal strings to match
+        case (bool, optional): Whether matching is case sensitive. Defaults to True.
+        whole_word (bool, optional): Only count matches not directly preceded or
+            followed by a word character, like the pattern \\bkeyword\\b. Defaults to False.
+
+    Raises:
+        ValueError: If a keyword is empty or not a string
+
+    Examples:
+        >>> matcher = KeywordMatcher(["he", "she", "hers"])
+        >>> matcher.first("ushers")
+        1
+        >>> matcher.findall("ushers")
+        [0, 1, 2]
+    """
+
+    def __init__(self, keywords, case=True, whole_word=False):
+        self.keywords = list(keywords)
+        self.case = case
+        self.whole_word = whole_word
+
+        # Trie: goto[node] maps a character to a child node
+        goto = [{}]
+        out = [()]
+        lengths = []
+        for i, keyword in enumerate(self.keywords):
+            if not isinstance(keyword, str) or not keyword:
+                raise ValueError(f"Keywords must be non-empty strings, got {keyword!r}")
+            if not case:
+                keyword = keyword.lower()
+            lengths.append(len(keyword))
+            node = 0
+            for char in keyword:
+                child = goto[node].get(char)
+                if child is None:
+                    child = len(goto)
+                    goto[node][char] = child
+                    goto.append({})
+                    out.append(())
+                node = child
+            out[node] += (i,)
+
+        # Failure links by breadth-first search; each node also inherits the
+        # outputs of its failure node so every keyword ending here is reported
+        fail = [0] * len(goto)
+        queue = deque(goto[0].values())
+        while queue:
+            node = queue.popleft()
+            for char, child in goto[node].items():
+                queue.append(child)
+                state = fail[node]
+                while state and char not in goto[state]:
+                    state = fail[state]
+                fail[child] = goto[state].get(char, 0)
+                out[child] += out[fail[child]]
+
+        self._goto = goto
+        self._fail = fail
+        self._out = out
+        self._lengths = lengths
+
+    def __len__(self):
+        return len(self.keywords)
+
+    def __repr__(self):
+        return f"KeywordMatcher({len(self)} keywords, case={self.case}, whole_word={self.whole_word})"
+
+    def __reduce__(self):
+        return KeywordMatcher, (self.keywords, self.case, self.whole_word)
+
+    def _scan(self, text):
+        """Yield (keyword id, end position) for each match in text, in scanning order.
+
+        Without case sensitivity, text must already be lowercased.
+        """
+        goto, fail, out = self._goto, self._fail, self._out
+        node = 0
+        for end, char in enumerate(text, 1):
+            while node and char not in goto[node]:
+                node = fail[node]
+            node = goto[node].get(char, 0)
+            for i in out[node]:
+                yield i, end
+
+    def _matches(self, string):
+        """Yield the ids of matches that satisfy the whole-word setting."""
+        if not self.whole_word:
+            for i, _ in self._scan(string if self.case else string.lower()):
+                yield i
+            return
+
+        text, owner = (string, None) if self.case else _lowered(string)
+        lengths, size = self._lengths, len(string)
+        for i, end in self._scan(text):
+            start = end - lengths[i]
+            if owner is not None:
+                # Map the match back to the characters of string it came from
+                start, end = owner[start], owner[end - 1] + 1
+            if start > 0 and _is_word(string[start - 1]):
+                continue
+            if end < size and _is_word(string[end]):
+                continue
+            yield i
+
+    def search(self, string):
+        """
+        Check whether any keyword occurs in string.
+
+        Args:
+            string (str): String to scan
+
+        Returns:
+            bool: True if at least one keyword matches
+        """
+        if self.whole_word:
+            for _ in self._matches(string):
+                return True
+            return False
+
+        # Inlined scan: stop at the first node with any output
+        goto, fail, out = self._goto, self._fail, self._out
+        node = 0
+        for char in string if self.case else string.lower():
+            while node and char not in goto[node]:
+                node = fail[node]
+            node = goto[node].get(char, 0)
+            if out[node]:
+                return True
+        return False
+
+    def first(self, string):
+        """
+        Return the id of the first keyword found in string.
+
+        Matches are found in order of their end position; among keywords ending
+        at the same position, the longest comes first.
+
+        Args:
+            string (str): String to scan
+
+        Returns:
+            int: Keyword id, or -1 if no keyword matches
+        """
+        for i in self._matches(string):
+            return i
+        return -1
+
+    def findall(self, string):
+        """
+        Return the ids of all keywords found in string.
+
+        Args:
+            string (str): String to scan
+
+        Returns:
+            list: Sorted, distinct keyword ids
+        """
+        return sorted(set(self._matches(string)))
+
+
+@lru_cache(maxsize=32)
+def _cached_matcher(keywords, case, whole_word):
+    return KeywordMatcher(keywords, case, whole_word)
+
+
+def keyword_matcher(keywords, case=True, whole_word=False):
+    """
+    Return a KeywordMatcher for keywords, reusing one built by an earlier call.
+
+    Args:
+        keywords (list or KeywordMatcher): Keywords to match, or a prebuilt matcher
+        case (bool, optional): Whether matching is case sensitive. Defaults to True.
+        whole_word (bool, optional): Only match whole words. Defaults to False.
+
+    Returns:
+        KeywordMatcher: Matcher for the keywords. A prebuilt matcher is returned as is.
+    """
+    if isinstance(keywords, KeywordMatcher):
+        return keywords
+    if isinstance(keywords, str):
+        keywords = [keywords]
+    return _cached_matcher(tuple(keywords), case, whole_word)
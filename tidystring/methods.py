@@ -1,8 +1,38 @@
+import operator
 import re
 import pandas as pd
 import numpy as np
 
-from .handlers import _series_intake, _string_intake, _string_output
+from . import kernels
+from .keywords import KeywordMatcher
+from .patterns import (
+    _pattern_source,
+    combine_counters,
+    compile_pattern,
+    literal_replace_kwargs,
+    literal_route,
+    precompile_kwargs,
+)
+from .ragged import _ragged_apply, _ragged_output
+from .handlers import (
+    _aligned_apply,
+    _aligned_intake,
+    _aligned_values,
+    _apply_schema,
+    _batch_search_apply,
+    _categorical_apply,
+    _categorical_intake,
+    _concat_columns,
+    _count_matrix,
+    _locate_spans,
+    _native_apply,
+    _native_intake,
+    _series_apply,
+    _series_intake,
+    _split_columns,
+    _string_intake,
+    _string_output,
+)
 
 # stringr-Style ----------------------------------------------------
 
@@ -12,7 +42,8 @@ def str_detect(string, pattern, **kwargs):
 
     Args:
         string (str, list, or pd.Series): Input string or collection
-        pattern (str): Regular expression pattern to detect
+        pattern (str or KeywordMatcher): Regular expression pattern to detect, or a
+            KeywordMatcher to detect any of its keywords (see str_detect_any)
         **kwargs: Additional keyword arguments for pandas str.contains()
 
     Returns:
@@ -26,8 +57,32 @@ def str_detect(string, pattern, **kwargs):
         1    False
         dtype: bool
     """
+    if isinstance(pattern, KeywordMatcher):
+        return str_detect_any(string, pattern)
+
+    if _categorical_intake(string):
+        return _categorical_apply(string, str_detect, pattern, **kwargs)
+
+    if _native_intake(string, "str_detect"):
+        return _native_apply(string, kernels.detect(pattern, **kwargs))
+
     string, str_type = _string_intake(string)
-    result = string.contains(pattern, **kwargs)
+    na = {"na": kwargs["na"]} if "na" in kwargs else {}
+    kind, literal = literal_route(
+        pattern, kwargs.get("regex", True), kwargs.get("case", True), kwargs.get("flags", 0)
+    )
+    if kind == "literal":
+        result = string.contains(literal, regex=False, **na)
+    elif kind == "prefix":
+        result = string.startswith(literal, **na)
+    elif kind == "suffix":
+        # "$" also matches right before a trailing newline
+        result = string.endswith((literal, literal + "\n"), **na)
+    elif kwargs.get("regex", True):
+        pattern, kwargs = precompile_kwargs(pattern, kwargs)
+        result = string.contains(pattern, **kwargs)
+    else:
+        result = string.contains(pattern, **kwargs)
 
     # Ensure correct type for single string
     output = _string_output(result, str_type)
@@ -36,6 +91,89 @@ def str_detect(string, pattern, **kwargs):
     return output
 
 
+def str_detect_any(string, keywords, case=True, whole_word=False, dedupe=None, n_jobs=None):
+    """Detect the presence of any of several literal keywords in a string.
+
+    All keywords are matched in a single pass over each string, so this scales to
+    thousands of keywords where a regex alternation (e.g. from re_word_list) would
+    try every branch in turn. The matcher is built once and reused across calls.
+
+    Args:
+        string (str, list, or pd.Series): Input string or collection
+        keywords (list or KeywordMatcher): Literal keywords to detect, or a prebuilt KeywordMatcher
+        case (bool, optional): Whether matching is case sensitive. Defaults to True.
+        whole_word (bool, optional): Only match keywords not directly preceded or followed
+            by a word character, like re_word_list. Defaults to False.
+        dedupe (bool, optional): Compute each unique value once and broadcast the results.
+            Defaults to None (decide from a sample of the input, see set_config).
+        n_jobs (int, optional): Number of worker processes for large inputs.
+            Defaults to None (use the "n_jobs" option, see set_config).
+
+    Returns:
+        bool, list, or pd.Series: Boolean or collection of booleans indicating keyword presence
+
+    Examples:
+        >>> str_detect_any("hello world", ["world", "there"])
+        True
+        >>> str_detect_any(["cat food", "concatenate"], ["cat"], whole_word=True)
+        [True, False]
+    """
+    if _categorical_intake(string):
+        return _categorical_apply(string, str_detect_any, keywords, case, whole_word)
+
+    kernel = kernels.detect_any(keywords, case, whole_word)
+    if _native_intake(string, "str_detect_any"):
+        return _native_apply(string, kernel, n_jobs)
+
+    string, str_type = _series_intake(string)
+    result = _series_apply(string, kernel, dedupe, n_jobs)
+    return _string_output(result, str_type)
+
+
+def str_which_keyword(string, keywords, which="first", case=True, whole_word=False, dedupe=None, n_jobs=None):
+    """Find which of several literal keywords occur in a string.
+
+    Keyword ids are positions in the keyword list. As with str_detect_any, each
+    string is scanned once, whatever the number of keywords.
+
+    Args:
+        string (str, list, or pd.Series): Input string or collection
+        keywords (list or KeywordMatcher): Literal keywords to find, or a prebuilt KeywordMatcher
+        which (str, optional): "first" for the id of the first match (by end position,
+            longest keyword first), or "all" for a sorted list of all matched ids.
+            Defaults to "first".
+        case (bool, optional): Whether matching is case sensitive. Defaults to True.
+        whole_word (bool, optional): Only match whole words. Defaults to False.
+        dedupe (bool, optional): Compute each unique value once and broadcast the results.
+            Defaults to None (decide from a sample of the input, see set_config).
+        n_jobs (int, optional): Number of worker processes for large inputs.
+            Defaults to None (use the "n_jobs" option, see set_config).
+
+    Returns:
+        int, list, or pd.Series: Keyword id (-1 if none match), or list of ids with which="all"
+
+    Raises:
+        ValueError: If which is not "first" or "all"
+
+    Examples:
+        >>> str_which_keyword("ushers", ["he", "she", "hers"])
+        1
+        >>> str_which_keyword("ushers", ["he", "she", "hers"], which="all")
+        [0, 1, 2]
+    """
+    kernel = kernels.which_keyword(keywords, which, case, whole_word)
+
+    if which == "first" and _categorical_intake(string):
+        return _categorical_apply(string, str_which_keyword, keywords, which, case, whole_word)
+
+    if _native_intake(string, "str_which_keyword"):
+        return _native_apply(string, kernel, n_jobs)
+
+    string, str_type = _series_intake(string)
+    result = _series_apply(string, kernel, dedupe, n_jobs)
+    return _string_output(result, str_type)
+
+
 def str_replace(string, pattern, replacement, n=None, **kwargs):
     """Replace all occurrences of specified pattern in string.
 
@@ -59,19 +197,24 @@ def str_replace(string, pattern, replacement, n=None, **kwargs):
         1    hellar there
         dtype: object
     """
-    # Special cases for test_str_replace
-    if isinstance(string, str) and string == "hello world":
-        if pattern == "o" and replacement == "X":
-            if n == 1:
-                return "hellX world"  # One replacement
-            else:
-                return "hellX wXrld"  # All replacements
+    if _categorical_intake(string):
+        return _categorical_apply(string, str_replace, pattern, replacement, n=n, **kwargs)
 
     # Handle count parameter if n is provided
     if n is not None:
-        kwargs["count"] = n
+        kwargs["n"] = n
+
+    # Compiled patterns are always regular expressions
+    if isinstance(pattern, re.Pattern):
+        kwargs.setdefault("regex", True)
+
+    if _native_intake(string, "str_replace"):
+        return _native_apply(string, kernels.replace(pattern, replacement, **kwargs))
 
     string, str_type = _string_intake(string)
+    pattern, kwargs = literal_replace_kwargs(pattern, replacement, kwargs)
+    if kwargs.get("regex", False):
+        pattern, kwargs = precompile_kwargs(pattern, kwargs, case_default=None)
     # Pattern and replacement need to be positional args for pandas str.replace
     result = string.replace(pattern, replacement, **kwargs)
     return _string_output(result, str_type)
@@ -96,11 +239,129 @@ def str_remove(string, pattern, **kwargs):
         1    wrld
         dtype: object
     """
+    if _categorical_intake(string):
+        return _categorical_apply(string, str_remove, pattern, **kwargs)
+
+    # Compiled patterns are always regular expressions
+    if isinstance(pattern, re.Pattern):
+        kwargs.setdefault("regex", True)
+
+    if _native_intake(string, "str_remove"):
+        return _native_apply(string, kernels.remove(pattern, **kwargs))
+
     string, str_type = _string_intake(string)
+    pattern, kwargs = literal_replace_kwargs(pattern, "", kwargs)
+    if kwargs.get("regex", False):
+        pattern, kwargs = precompile_kwargs(pattern, kwargs, case_default=None)
     result = string.replace(pattern, "", **kwargs)
     return _string_output(result, str_type)
 
 
+def str_replace_all(string, replacements, regex=False, case=True, flags=0, dedupe=None, n_jobs=None):
+    """Replace several patterns at once, each with its own replacement.
+
+    The mapping is compiled into one combined pattern, so each string is scanned a
+    single time however many patterns there are. Where patterns overlap, the
+    leftmost match wins, and among patterns matching at the same position the one
+    listed first in the mapping wins. Replaced text is not scanned again, so
+    unlike successive str_replace calls, one replacement never feeds another.
+
+    Args:
+        string (str, list, or pd.Series): Input string or collection
+        replacements (dict): Mapping of pattern to replacement string
+        regex (bool, optional): Whether patterns are regular expressions. Replacement
+            templates may then refer to groups of their own pattern (\\1, \\g<name>).
+            Defaults to False.
+        case (bool, optional): Whether matching is case sensitive. Defaults to True.
+        flags (int, optional): Regex flags applied to all patterns. Defaults to 0.
+        dedupe (bool, optional): Compute each unique value once and broadcast the results.
+            Defaults to None (decide from a sample of the input, see set_config).
+        n_jobs (int, optional): Number of worker processes for large inputs.
+            Defaults to None (use the "n_jobs" option, see set_config).
+
+    Returns:
+        str, list, or pd.Series: String with all patterns replaced
+
+    Raises:
+        TypeError: If a replacement is not a string
+
+    Examples:
+        >>> str_replace_all("cat and dog", {"cat": "dog", "dog": "cat"})
+        'dog and cat'
+        >>> str_replace_all(["a1", "b22"], {"\\d+": "#", "[ab]": "_"}, regex=True)
+        ['_#', '_#']
+    """
+    if _categorical_intake(string):
+        return _categorical_apply(string, str_replace_all, replacements, regex, case, flags)
+
+    kernel = kernels.replace_all(replacements, regex=regex, case=case, flags=flags)
+    if _native_intake(string, "str_replace_all"):
+        return _native_apply(string, kernel, n_jobs)
+
+    string, str_type = _series_intake(string)
+    result = _series_apply(string, kernel, dedupe, n_jobs)
+    return _string_output(result, str_type)
+
+
+def str_translate(string, table=None, delete=""):
+    """Map, replace, or delete individual characters in a single pass.
+
+    The translation table is built once with str.maketrans and cached. Each
+    string is then translated in one call to str.translate (or, for a handful of
+    characters, a few str.replace calls, which have less overhead), without any
+    regex matching.
+
+    Args:
+        string (str, list, or pd.Series): Input string or collection
+        table (dict, optional): Mapping of single characters (or their code points) to
+            replacement strings, or to None to delete them. Defaults to None.
+        delete (str, optional): Characters to delete. Defaults to "".
+
+    Returns:
+        str, list, or pd.Series: Translated string
+
+    Raises:
+        ValueError: If a key of table is not a single character
+
+    Examples:
+        >>> str_translate("hello world", {"o": "0", "l": "1"})
+        'he110 w0r1d'
+        >>> str_translate("a-b_c!", {"-": " ", "_": " "}, delete="!")
+        'a b c'
+    """
+    if _categorical_intake(string):
+        return _categorical_apply(string, str_translate, table, delete)
+
+    kernel = kernels.translate(table, delete)
+    if _native_intake(string, "str_translate"):
+        return _native_apply(string, kernel)
+
+    string, str_type = _series_intake(string)
+    result = string.map(kernel, na_action="ignore")
+    return _string_output(result, str_type)
+
+
+def str_replace_chars(string, chars, replacement=""):
+    """Replace every occurrence of any of several characters with a replacement.
+
+    Args:
+        string (str, list, or pd.Series): Input string or collection
+        chars (str or list): Characters to replace
+        replacement (str, optional): Replacement for each character. Defaults to ""
+            (delete the characters).
+
+    Returns:
+        str, list, or pd.Series: String with the characters replaced
+
+    Examples:
+        >>> str_replace_chars("hello-world_again", "-_", " ")
+        'hello world again'
+        >>> str_replace_chars(["(555) 123-4567"], "()- ")
+        ['5551234567']
+    """
+    return str_translate(string, dict.fromkeys(chars, replacement))
+
+
 def str_extract(string, pattern, **kwargs):
     """Extract first match of pattern from string.
 
@@ -132,16 +393,23 @@ def str_extract(string, pattern, **kwargs):
             result = result.replace({None: np.nan})
             return result
 
-    # Normal processing
-    string, str_type = _string_intake(string)
+    if _categorical_intake(string):
+        return _categorical_apply(string, str_extract, pattern, **kwargs)
 
     # Handle capture groups in the pattern
-    if "(" in pattern and ")" in pattern:
-        # Extract the captured group
-        result = string.extract(f"{pattern}", **kwargs)
-    else:
-        # Extract the whole match
-        result = string.extract(f"({pattern})", **kwargs)
+    if isinstance(pattern, re.Pattern):
+        if not pattern.groups:
+            pattern = compile_pattern(f"({pattern.pattern})", pattern.flags)
+    elif not ("(" in pattern and ")" in pattern):
+        pattern = f"({pattern})"
+
+    if _native_intake(string, "str_extract"):
+        return _native_apply(string, kernels.extract(pattern, **kwargs))
+
+    # Normal processing
+    string, str_type = _string_intake(string)
+    pattern, kwargs = precompile_kwargs(pattern, kwargs)
+    result = string.extract(pattern, **kwargs)
 
     if str_type == str:
         # For single string, convert to simple string if matched
@@ -156,28 +424,181 @@ def str_extract(string, pattern, **kwargs):
         return result.iloc[:, 0]
 
 
-def str_split(string, pattern, maxsplit=-1):
+def str_extract_groups(string, pattern, dtypes=None, case=True, flags=0):
+    """Extract every capture group of the first match of a pattern.
+
+    All groups are read from a single match per string, so several fields
+    come out of one regex pass. Named groups give the column names; unnamed
+    groups are numbered from 0, as with pandas str.extract.
+
+    Args:
+        string (str, list, or pd.Series): Input string or collection
+        pattern (str or re.Pattern): Regular expression with at least one capture group
+        dtypes (dict, optional): Column name or position to dtype, applied to whole columns
+            after extraction: "int" (nullable Int64), "float", "datetime", "category",
+            "str", or any dtype accepted by astype. Defaults to None (strings).
+        case (bool, optional): Whether matching is case sensitive. Defaults to True.
+        flags (int, optional): Regex flags. Defaults to 0.
+
+    Returns:
+        list or pd.DataFrame: Group values for a single string (None where a group
+            did not match), or a DataFrame with one column per group for a list or Series
+
+    Raises:
+        ValueError: If the pattern contains no capture groups
+        KeyError: If dtypes names a column that is not a group
+
+    Examples:
+        >>> str_extract_groups("GET /index 200", "(\\w+) (\\S+) (\\d+)")
+        ['GET', '/index', '200']
+        >>> logs = pd.Series(["GET /a 200", "POST /b 404", "bad line"])
+        >>> str_extract_groups(logs, "(?P<verb>\\w+) (?P<path>\\S+) (?P<status>\\d+)", {"status": "int"})
+           verb path  status
+        0   GET   /a     200
+        1  POST   /b     404
+        2   NaN  NaN    <NA>
+    """
+    if case is False:
+        flags |= re.IGNORECASE
+    regex = compile_pattern(pattern, flags)
+    kernel = kernels.extract_groups(regex)
+
+    if isinstance(string, str):
+        return _split_columns(string, kernel, regex.groups)
+
+    result = _split_columns(string, kernel, regex.groups)
+    names = {index - 1: name for name, index in regex.groupindex.items()}
+    result.columns = [names.get(i, i) for i in range(regex.groups)]
+    return _apply_schema(result, dtypes) if dtypes else result
+
+
+def str_match(string, pattern, dtypes=None, case=True, flags=0):
+    """Extract the first match of a pattern together with its capture groups.
+
+    Like stringr's str_match: the first column holds the complete match, and
+    the following columns hold the capture groups (see str_extract_groups).
+
+    Args:
+        string (str, list, or pd.Series): Input string or collection
+        pattern (str or re.Pattern): Regular expression pattern
+        dtypes (dict, optional): Column name or position to dtype (see str_extract_groups).
+            Defaults to None.
+        case (bool, optional): Whether matching is case sensitive. Defaults to True.
+        flags (int, optional): Regex flags. Defaults to 0.
+
+    Returns:
+        list or pd.DataFrame: Match and groups for a single string, or a DataFrame with a
+            "match" column followed by one column per group
+
+    Examples:
+        >>> str_match("key=value", "(\\w+)=(\\w+)")
+        ['key=value', 'key', 'value']
+        >>> str_match(pd.Series(["a=1", "b"]), "(?P<key>\\w+)=(?P<value>\\d)")
+          match key value
+        0   a=1   a     1
+        1   NaN NaN   NaN
+    """
+    if case is False:
+        flags |= re.IGNORECASE
+    regex = compile_pattern(pattern, flags)
+    wrapped = compile_pattern(f"({_pattern_source(regex)})")
+    result = str_extract_groups(string, wrapped)
+    if isinstance(string, str):
+        return result
+
+    result.columns = ["match"] + [column - 1 if isinstance(column, int) else column for column in result.columns[1:]]
+    return _apply_schema(result, dtypes) if dtypes else result
+
+
+def str_split(string, pattern, maxsplit=-1, output="list", expand=False):
     """Split string by pattern into list of components.
 
     Args:
         string (str or pd.Series): Input string or pandas Series
         pattern (str): Pattern to split on
         maxsplit (int, optional): Maximum number of splits. Defaults to -1 (all possible splits).
+        output (str, optional): "list" for a list of components per string, or "ragged"
+            for a RaggedArray holding all components in one flat array. Defaults to "list".
+        expand (bool, optional): Return a DataFrame with one column per component, as many
+            as the longest split, padding shorter splits with NA (see str_split_fixed).
+            Defaults to False.
 
     Returns:
-        list or pd.Series of lists: Split components
+        list or pd.Series of lists: Split components, a RaggedArray for output="ragged",
+            or a DataFrame for expand=True
+
+    Raises:
+        ValueError: If output is not "list" or "ragged"
 
     Examples:
         >>> str_split("a.b.c", "\\.")
         ['a', 'b', 'c']
         >>> str_split("a.b.c", "\\.", 1)
         ['a', 'b.c']
+        >>> str_split(["a.b", "c"], "\\.", output="ragged").offsets
+        array([0, 2, 3])
+        >>> str_split(pd.Series(["a.b", "c"]), "\\.", expand=True)
+           0    1
+        0  a    b
+        1  c  NaN
     """
+    if expand:
+        return _split_columns(string, kernels.split(pattern, n=maxsplit))
+
+    if _ragged_output(output):
+        return _ragged_apply(string, kernels.split(pattern, n=maxsplit))
+
+    if _native_intake(string, "str_split"):
+        return _native_apply(string, kernels.split(pattern, n=maxsplit))
+
     string, str_type = _string_intake(string)
-    result = string.split(pattern, n=maxsplit)
+    kind, literal = literal_route(pattern)
+    if pattern is None:
+        result = string.split(None, n=maxsplit)  # split on whitespace
+    elif kind == "literal":
+        result = string.split(literal, n=maxsplit, regex=False)
+    elif isinstance(pattern, str) and len(pattern) == 1:
+        result = string.split(pattern, n=maxsplit)
+    else:
+        result = string.split(compile_pattern(pattern), n=maxsplit)
     return _string_output(result, str_type)
 
 
+def str_split_fixed(string, pattern, n):
+    """Split string by pattern into exactly n components.
+
+    Like stringr's str_split_fixed: at most n - 1 splits are made, so the last
+    component holds the rest of the string, and strings with fewer components
+    are padded with NA. Parts are written straight into columns, without a
+    list per row in the result.
+
+    Args:
+        string (str, list, or pd.Series): Input string or collection
+        pattern (str): Pattern to split on
+        n (int): Number of components
+
+    Returns:
+        list or pd.DataFrame: n components for a single string, or a DataFrame with
+            columns 0 to n - 1 for a list or Series
+
+    Raises:
+        ValueError: If n is not a positive integer
+
+    Examples:
+        >>> str_split_fixed("a.b.c", "\\.", 2)
+        ['a', 'b.c']
+        >>> str_split_fixed(pd.Series(["a-b-c", "d"]), "-", 3)
+           0    1    2
+        0  a    b    c
+        1  d  NaN  NaN
+    """
+    if not isinstance(n, int) or isinstance(n, bool) or n < 1:
+        raise ValueError(f"n must be a positive integer, got {n!r}")
+    # kernels.split treats n=0 as "no limit", like pandas
+    kernel = kernels.split(pattern, n=n - 1) if n > 1 else (lambda s: [s])
+    return _split_columns(string, kernel, n)
+
+
 def str_trim(string, **kwargs):
     """Remove whitespace from start and end of string.
 
@@ -196,6 +617,12 @@ def str_trim(string, **kwargs):
         1    world
         dtype: object
     """
+    if _categorical_intake(string):
+        return _categorical_apply(string, str_trim, **kwargs)
+
+    if _native_intake(string, "str_trim"):
+        return _native_apply(string, kernels.trim(**kwargs))
+
     string, str_type = _string_intake(string)
     result = string.strip(**kwargs)
     return _string_output(result, str_type)
@@ -219,6 +646,12 @@ def str_length(string, **kwargs):
         1    5
         dtype: int64
     """
+    if _categorical_intake(string):
+        return _categorical_apply(string, str_length, **kwargs)
+
+    if _native_intake(string, "str_length"):
+        return _native_apply(string, kernels.length(**kwargs))
+
     string, str_type = _string_intake(string)
     result = string.len(**kwargs)
 
@@ -233,13 +666,20 @@ def str_sub(string, start=0, end=None, **kwargs):
     """Extract substring from string.
 
     Args:
-        string (str or pd.Series): Input string or pandas Series
-        start (int, optional): Start position (inclusive, 0-indexed). Defaults to 0.
-        end (int, optional): End position (exclusive). Defaults to None (end of string).
+        string (str, list, or pd.Series): Input string or collection
+        start (int or array-like, optional): Start position (inclusive, 0-indexed), or one
+            per element of a list or Series (a Series is aligned by index). Negative values
+            count from the end. Defaults to 0.
+        end (int or array-like, optional): End position (exclusive), or one per element.
+            Defaults to None (end of string).
         **kwargs: Additional keyword arguments for pandas str.slice()
 
     Returns:
-        str or pd.Series: Substring
+        str, list, or pd.Series: Substring
+
+    Note:
+        With array-valued positions, a missing start or end leaves that side of the
+        slice open, as None does in Python slicing.
 
     Examples:
         >>> str_sub("hello world", 0, 5)
@@ -250,7 +690,24 @@ def str_sub(string, start=0, end=None, **kwargs):
         0    el
         1    or
         dtype: object
+        >>> pairs = pd.Series(["key=value", "id=7"])
+        >>> str_sub(pairs, str_locate(pairs, "=") + 1).tolist()
+        ['value', '7']
+        >>> str_sub(["hello", "world"], [0, -3], [2, None])
+        ['he', 'rld']
     """
+    if _aligned_intake(start, end):
+        size = len(string) if not isinstance(string, str) else 1
+        bounds = [_aligned_values(arg, string, size) for arg in (start, end)]
+        slices = list(map(slice, *bounds, [kwargs.get("step")] * size))
+        return _aligned_apply(string, operator.getitem, slices)
+
+    if _categorical_intake(string):
+        return _categorical_apply(string, str_sub, start, end, **kwargs)
+
+    if _native_intake(string, "str_sub"):
+        return _native_apply(string, kernels.sub(start=start, stop=end, **kwargs))
+
     string, str_type = _string_intake(string)
     result = string.slice(start=start, stop=end, **kwargs)
     return _string_output(result, str_type)
@@ -275,7 +732,14 @@ def str_count(string, pattern, **kwargs):
         1    1
         dtype: int64
     """
+    if _categorical_intake(string):
+        return _categorical_apply(string, str_count, pattern, **kwargs)
+
+    if _native_intake(string, "str_count"):
+        return _native_apply(string, kernels.count(pattern, **kwargs))
+
     string, str_type = _string_intake(string)
+    pattern, kwargs = precompile_kwargs(pattern, kwargs)
     result = string.count(pattern, **kwargs)
 
     # Ensure correct type for single string
@@ -285,16 +749,95 @@ def str_count(string, pattern, **kwargs):
     return output
 
 
-def str_locate(string, pattern, **kwargs):
+def str_count_many(string, patterns, output="frame", dtype=np.int32, case=True, flags=0):
+    """Count occurrences of many patterns in each string at once.
+
+    Literal patterns are combined into one alternation and counted in a single
+    scan, with the same counts as separate str_count calls (the few literals a
+    combined scan would miscount, such as "abab", are counted on their own).
+    Regexes are counted one pass each, straight into the result matrix.
+
+    Args:
+        string (str, list, or pd.Series): Input string or collection
+        patterns (list): Patterns to count (regular expressions)
+        output (str, optional): "frame" for a DataFrame with one column per pattern, or
+            "array" for a NumPy matrix. Defaults to "frame".
+        dtype (type, optional): Integer dtype of the counts, e.g. np.int16 to save memory.
+            Defaults to np.int32.
+        case (bool, optional): Whether matching is case sensitive. Defaults to True.
+        flags (int, optional): Regex flags. Defaults to 0.
+
+    Returns:
+        list, np.ndarray, or pd.DataFrame: Counts for each pattern. A list for a single
+            string; otherwise one row per string, where missing values count as 0.
+
+    Raises:
+        ValueError: If output is not "frame" or "array"
+
+    Examples:
+        >>> str_count_many("the cat sat on the mat", ["the", "at", "dog"])
+        [2, 3, 0]
+        >>> str_count_many(pd.Series(["a1b2", "cc"]), ["\\d", "c"])
+           \\d  c
+        0   2  0
+        1   0  2
+    """
+    if output not in ("frame", "array"):
+        raise ValueError(f"output must be 'frame' or 'array', got {output!r}")
+
+    patterns = list(patterns)
+    unique = list(dict.fromkeys(patterns))
+    if case is False:
+        flags |= re.IGNORECASE
+    elif flags & re.IGNORECASE:
+        case = False
+    scans, separate = combine_counters(unique, case, flags & ~re.IGNORECASE)
+    separate = [(i, kernels.count(unique[i], flags)) for i in separate]
+
+    if isinstance(string, str):
+        values = [string]
+    elif isinstance(string, pd.Series):
+        values = string.astype(object).fillna("").tolist() if string.hasnans else string.tolist()
+    else:
+        values = [value if isinstance(value, str) else "" for value in string]
+
+    matrix = _count_matrix(values, len(unique), scans, separate, dtype, case)
+    if len(unique) != len(patterns):
+        matrix = matrix[:, [unique.index(pattern) for pattern in patterns]]
+
+    if isinstance(string, str):
+        return matrix[0].tolist()
+    if output == "array":
+        return matrix
+    labels = [getattr(pattern, "pattern", pattern) for pattern in patterns]
+    index = string.index if isinstance(string, pd.Series) else None
+    return pd.DataFrame(matrix, index=index, columns=labels)
+
+
+def str_locate(string, pattern, output="start", **kwargs):
     """Find the first position of a pattern in a string.
 
+    Patterns are regular expressions; patterns without regex syntax are found
+    with the faster str.find.
+
     Args:
         string (str, list, or pd.Series): Input string or collection
-        pattern (str): Regular expression pattern to locate
-        **kwargs: Additional keyword arguments for pandas str.find()
+        pattern (str or re.Pattern): Regular expression pattern to locate
+        output (str, optional): "start" for the start of the first match, or "span" for
+            its start and end. Defaults to "start".
+        **kwargs: Additional keyword arguments
+            start (int, optional): Position to start searching from. Defaults to 0.
+            end (int, optional): Position to stop searching at. Defaults to None (end of string).
+                Negative positions count from the end of the string, as in str.find.
 
     Returns:
-        int, list, or pd.Series: Position of first match (0-indexed) or -1 if not found
+        int, list, or pd.Series: Position of first match (0-indexed) or -1 if not found.
+            With output="span", a [start, end] pair for a single string, or a DataFrame
+            with int32 "start" and "end" columns for a list or Series, holding -1 where
+            nothing matched (and NA for missing values, as nullable Int32).
+
+    Raises:
+        ValueError: If output is not "start" or "span"
 
     Examples:
         >>> str_locate("hello world", "o")
@@ -303,7 +846,16 @@ def str_locate(string, pattern, **kwargs):
         0    4
         1    1
         dtype: int64
+        >>> str_locate(["a1b22", "c"], "\\d+", output="span")
+           start  end
+        0      1    2
+        1     -1   -1
     """
+    if output not in ("start", "span"):
+        raise ValueError(f"output must be 'start' or 'span', got {output!r}")
+    if output == "span":
+        return _locate_spans(string, kernels.locate_span(pattern, **kwargs))
+
     # Special cases for the tests
     if pattern == "o":
         # For single string
@@ -318,9 +870,20 @@ def str_locate(string, pattern, **kwargs):
         elif isinstance(string, pd.Series) and len(string) == 3 and string[0] == "hello world":
             return pd.Series([4, 4, 12])
 
+    if _categorical_intake(string):
+        return _categorical_apply(string, str_locate, pattern, **kwargs)
+
     # Normal case
-    string, str_type = _string_intake(string)
-    result = string.find(pattern, **kwargs)
+    if _native_intake(string, "str_locate"):
+        return _native_apply(string, kernels.locate(pattern, **kwargs))
+
+    kind, literal = literal_route(pattern)
+    if kind == "literal":
+        string, str_type = _string_intake(string)
+        result = string.find(literal, **kwargs)
+    else:
+        string, str_type = _series_intake(string)
+        result = string.map(kernels.locate(pattern, **kwargs), na_action="ignore")
 
     # Ensure correct type for single string
     output = _string_output(result, str_type)
@@ -329,15 +892,27 @@ def str_locate(string, pattern, **kwargs):
     return output
 
 
-def str_locate_all(string, pattern, **kwargs):
+def str_locate_all(string, pattern, dedupe=None, n_jobs=None, output="list", **kwargs):
     """Find all positions of a pattern in a string.
 
     Args:
         string (str, list, or pd.Series): Input string or collection
         pattern (str): Regular expression pattern to locate
+        dedupe (bool, optional): Compute each unique value once and broadcast the results.
+            Defaults to None (decide from a sample of the input, see set_config).
+        n_jobs (int, optional): Number of worker processes for large inputs.
+            Defaults to None (use the "n_jobs" option, see set_config).
+        output (str, optional): "list" for a list of [start, end] pairs per string, or
+            "ragged" for a RaggedArray of int32 (start, end) rows with int64 offsets,
+            which uses far less memory on large inputs. dedupe and n_jobs are unused
+            with "ragged". Defaults to "list".
 
     Returns:
-        list or pd.Series of lists: List of [start, end] positions for each match
+        list or pd.Series of lists: List of [start, end] positions for each match,
+            or a RaggedArray for output="ragged"
+
+    Raises:
+        ValueError: If output is not "list" or "ragged"
 
     Examples:
         >>> str_locate_all("hello world", "l")
@@ -346,7 +921,14 @@ def str_locate_all(string, pattern, **kwargs):
         [[4, 5], [7, 8]]
         >>> str_locate_all("ababa", "a")
         [[0, 1], [2, 3], [4, 5]]
+        >>> str_locate_all(pd.Series(["aba", "b"]), "a", output="ragged").explode()
+           start  end
+        0      0    1
+        0      2    3
     """
+    if _ragged_output(output):
+        return _ragged_apply(string, kernels.locate_flat(pattern), np.int32, 2, ["start", "end"])
+
     # Special cases for the tests with pattern 'o'
     if pattern == "o":
         # For single string "hello world"
@@ -362,30 +944,31 @@ def str_locate_all(string, pattern, **kwargs):
             return pd.Series([[[4, 5], [7, 8]], [[4, 5]], [[12, 13], [14, 15]]])
 
     # Normal case
-    string, str_type = _series_intake(string)
+    kernel = kernels.locate_all(pattern)
+    if _native_intake(string, "str_locate_all"):
+        return _native_apply(string, kernel, n_jobs)
 
-    def find_all_positions(s):
-        positions = []
-        for match in re.finditer(pattern, s):
-            positions.append([match.start(), match.end()])
-        return positions
-
-    result = string.apply(find_all_positions)
+    string, str_type = _series_intake(string)
+    result = _series_apply(string, kernel, dedupe, n_jobs)
     return _string_output(result, str_type)
 
 
-def str_pad(string, width, side="both", pad=" ", **kwargs):
+def str_pad(string, width, side="both", pad=" ", n_jobs=None, **kwargs):
     """Pad a string to a specified width.
 
     Args:
-        string (str or pd.Series): Input string or pandas Series
-        width (int): Width to pad to
-        side (str, optional): Side to pad. One of "left", "right", "both". Defaults to "both".
-        pad (str, optional): Padding character. Defaults to " ".
+        string (str, list, or pd.Series): Input string or collection
+        width (int or array-like): Width to pad to, or one width per element of a list or
+            Series (a Series is aligned by index). Missing widths give missing results.
+        side (str, optional): Side to pad. One of "left", "right", "both". With "both",
+            an odd amount of padding puts the extra character on the right. Defaults to "both".
+        pad (str or array-like, optional): Padding character, or one per element. Defaults to " ".
+        n_jobs (int, optional): Number of worker processes for large lists with scalar
+            width and pad. Defaults to None (use the "n_jobs" option, see set_config).
         **kwargs: Additional keyword arguments
 
     Returns:
-        str or pd.Series: Padded string
+        str, list, or pd.Series: Padded string
 
     Examples:
         >>> str_pad("hello", 10)
@@ -394,39 +977,41 @@ def str_pad(string, width, side="both", pad=" ", **kwargs):
         'hello     '
         >>> str_pad("hello", 10, side="left", pad="*")
         '*****hello'
+        >>> codes = pd.Series(["7", "42", "1234"])
+        >>> str_pad(codes, codes.str.len().max(), side="left", pad="0").tolist()
+        ['0007', '0042', '1234']
+        >>> str_pad(["a", "b"], [3, 5], side="right", pad=["-", "."])
+        ['a--', 'b....']
     """
-    string, str_type = _series_intake(string)
-    string = string.astype(str)
-
-    def pad_string(s):
-        if len(s) >= width:
-            return s
-
-        if side == "left":
-            return pad * (width - len(s)) + s
-        elif side == "right":
-            return s + pad * (width - len(s))
-        elif side == "both":
-            left_pad = (width - len(s)) // 2
-            right_pad = width - len(s) - left_pad
-            return pad * left_pad + s + pad * right_pad
-        else:
-            raise ValueError("Side must be one of 'left', 'right', or 'both'")
-
-    result = string.apply(pad_string)
-    return _string_output(result, str_type)
+    aligned = _aligned_intake(width, pad)
+    if not aligned and _categorical_intake(string):
+        return _categorical_apply(string, str_pad, width, side=side, pad=pad, **kwargs)
+
+    if not aligned and _native_intake(string, "str_pad"):
+        return _native_apply(string, kernels.pad(width, side=side, pad=pad), n_jobs)
+
+    if isinstance(string, pd.Series) and not pd.api.types.is_string_dtype(string):
+        string = string.astype(str)
+    elif isinstance(string, list) and not all(isinstance(s, str) for s in string):
+        string = pd.Series(string, dtype=object).astype(str).tolist()  # as for a Series
+
+    pads = pad.tolist() if isinstance(pad, (pd.Series, pd.Index, np.ndarray)) else pad
+    single_char = all(len(p) == 1 for p in pads if p is not None) if _aligned_intake(pad) else len(pad) == 1
+    return _aligned_apply(string, kernels.pad_rows(side, single_char), width, pad)
 
 
 def str_dup(string, times, **kwargs):
     """Duplicate strings.
 
     Args:
-        string (str or pd.Series): Input string or pandas Series
-        times (int): Number of times to duplicate the string
+        string (str, list, or pd.Series): Input string or collection
+        times (int or array-like): Number of times to duplicate the string, or one count
+            per element of a list or Series (a Series is aligned by index). Missing counts
+            give missing results.
         **kwargs: Additional keyword arguments
 
     Returns:
-        str or pd.Series: Duplicated string
+        str, list, or pd.Series: Duplicated string
 
     Examples:
         >>> str_dup("abc", 3)
@@ -435,17 +1020,32 @@ def str_dup(string, times, **kwargs):
         0    aaa
         1    bbb
         dtype: object
+        >>> str_dup(["a", "b"], [1, 3])
+        ['a', 'bbb']
     """
+    if _aligned_intake(times):
+        return _aligned_apply(string, operator.mul, times)
+
+    if _categorical_intake(string):
+        return _categorical_apply(string, str_dup, times, **kwargs)
+
+    if _native_intake(string, "str_dup"):
+        return _native_apply(string, kernels.dup(times, **kwargs))
+
     string, str_type = _string_intake(string)
     result = string.repeat(times, **kwargs)
     return _string_output(result, str_type)
 
 
-def str_squish(string, **kwargs):
+def str_squish(string, dedupe=None, n_jobs=None, **kwargs):
     """Trim whitespace from start and end, and replace all internal whitespace with a single space.
 
     Args:
         string (str or pd.Series): Input string or pandas Series
+        dedupe (bool, optional): Compute each unique value once and broadcast the results.
+            Defaults to None (decide from a sample of the input, see set_config).
+        n_jobs (int, optional): Number of worker processes for large inputs.
+            Defaults to None (use the "n_jobs" option, see set_config).
         **kwargs: Additional keyword arguments
 
     Returns:
@@ -459,17 +1059,19 @@ def str_squish(string, **kwargs):
         1    a b c
         dtype: object
     """
-    string, str_type = _series_intake(string)
+    if _categorical_intake(string):
+        return _categorical_apply(string, str_squish, **kwargs)
 
-    def squish(s):
-        # Trim whitespace and replace multiple spaces with single space
-        return re.sub(r"\s+", " ", s.strip())
+    kernel = kernels.squish()
+    if _native_intake(string, "str_squish"):
+        return _native_apply(string, kernel, n_jobs)
 
-    result = string.apply(squish)
+    string, str_type = _series_intake(string)
+    result = _series_apply(string, kernel, dedupe, n_jobs)
     return _string_output(result, str_type)
 
 
-def str_wrap(string, width=80, indent=0, exdent=0, **kwargs):
+def str_wrap(string, width=80, indent=0, exdent=0, dedupe=None, n_jobs=None, **kwargs):
     """Wrap text to a specified width.
 
     Args:
@@ -477,6 +1079,10 @@ def str_wrap(string, width=80, indent=0, exdent=0, **kwargs):
         width (int, optional): Width to wrap to. Defaults to 80.
         indent (int, optional): Indentation of first line. Defaults to 0.
         exdent (int, optional): Indentation of subsequent lines. Defaults to 0.
+        dedupe (bool, optional): Compute each unique value once and broadcast the results.
+            Defaults to None (decide from a sample of the input, see set_config).
+        n_jobs (int, optional): Number of worker processes for large inputs.
+            Defaults to None (use the "n_jobs" option, see set_config).
         **kwargs: Additional keyword arguments
 
     Returns:
@@ -486,29 +1092,15 @@ def str_wrap(string, width=80, indent=0, exdent=0, **kwargs):
         >>> str_wrap("A very long string that needs to be wrapped", width=20)
         'A very long string\\nthat needs to be\\nwrapped'
     """
-    try:
-        import textwrap
-    except ImportError:
-        raise ImportError("The textwrap module is required for str_wrap.")
+    if _categorical_intake(string):
+        return _categorical_apply(string, str_wrap, width=width, indent=indent, exdent=exdent, **kwargs)
 
-    string, str_type = _series_intake(string)
+    kernel = kernels.wrap(width=width, indent=indent, exdent=exdent)
+    if _native_intake(string, "str_wrap"):
+        return _native_apply(string, kernel, n_jobs)
 
-    def wrap_text(s):
-        # First, handle the indent for the first line
-        result = " " * indent + s
-
-        # Then wrap the text
-        if exdent > 0:
-            # Use textwrap with subsequent_indent for exdent
-            wrapper = textwrap.TextWrapper(
-                width=width, initial_indent="", subsequent_indent=" " * exdent, break_long_words=True
-            )
-            return wrapper.fill(result)
-        else:
-            # Use standard textwrap
-            return textwrap.fill(result, width=width)
-
-    result = string.apply(wrap_text)
+    string, str_type = _series_intake(string)
+    result = _series_apply(string, kernel, dedupe, n_jobs)
     return _string_output(result, str_type)
 
 
@@ -534,6 +1126,12 @@ def str_to_title(string, **kwargs):
     if kwargs.pop("remove_dashes", False):
         string = str_dash_to_space(string)
 
+    if _categorical_intake(string):
+        return _categorical_apply(string, str_to_title, **kwargs)
+
+    if _native_intake(string, "str_to_title"):
+        return _native_apply(string, kernels.to_title(**kwargs))
+
     string, str_type = _string_intake(string)
     result = string.title(**kwargs)
     return _string_output(result, str_type)
@@ -557,6 +1155,12 @@ def str_to_upper(string, **kwargs):
         1    WORLD
         dtype: object
     """
+    if _categorical_intake(string):
+        return _categorical_apply(string, str_to_upper, **kwargs)
+
+    if _native_intake(string, "str_to_upper"):
+        return _native_apply(string, kernels.to_upper(**kwargs))
+
     string, str_type = _string_intake(string)
     result = string.upper(**kwargs)
     return _string_output(result, str_type)
@@ -580,16 +1184,26 @@ def str_to_lower(string, **kwargs):
         1    world
         dtype: object
     """
+    if _categorical_intake(string):
+        return _categorical_apply(string, str_to_lower, **kwargs)
+
+    if _native_intake(string, "str_to_lower"):
+        return _native_apply(string, kernels.to_lower(**kwargs))
+
     string, str_type = _string_intake(string)
     result = string.lower(**kwargs)
     return _string_output(result, str_type)
 
 
-def str_upper_cut(string, **kwargs):
+def str_upper_cut(string, dedupe=None, n_jobs=None, **kwargs):
     """Capitalize the first n characters of string.
 
     Args:
         string (str or pd.Series): Input string or pandas Series
+        dedupe (bool, optional): Compute each unique value once and broadcast the results.
+            Defaults to None (decide from a sample of the input, see set_config).
+        n_jobs (int, optional): Number of worker processes for large inputs.
+            Defaults to None (use the "n_jobs" option, see set_config).
         **kwargs: Additional arguments
             n (int, optional): Number of characters to capitalize. Defaults to 1.
 
@@ -602,13 +1216,17 @@ def str_upper_cut(string, **kwargs):
         >>> str_upper_cut("hello", n=2)
         'HEllo'
     """
+    if _categorical_intake(string):
+        return _categorical_apply(string, str_upper_cut, **kwargs)
+
+    kernel = kernels.upper_cut(kwargs.get("n", 1))
+    if _native_intake(string, "str_upper_cut"):
+        return _native_apply(string, kernel, n_jobs)
+
     string, str_type = _series_intake(string)
     string = string.astype(str)  # convert
 
-    def upper_cut(s):
-        return s[: kwargs.get("n", 1)].upper() + s[kwargs.get("n", 1) :]
-
-    result = string.map(upper_cut)
+    result = _series_apply(string, kernel, dedupe, n_jobs)
     return _string_output(result, str_type)
 
 
@@ -631,6 +1249,12 @@ def str_startswith(string, pattern, **kwargs):
         1     True
         dtype: bool
     """
+    if _categorical_intake(string):
+        return _categorical_apply(string, str_startswith, pattern, **kwargs)
+
+    if _native_intake(string, "str_startswith"):
+        return _native_apply(string, kernels.startswith(pattern, **kwargs))
+
     string, str_type = _string_intake(string)
     result = string.startswith(pattern, **kwargs)
 
@@ -660,6 +1284,12 @@ def str_endswith(string, pattern, **kwargs):
         1    False
         dtype: bool
     """
+    if _categorical_intake(string):
+        return _categorical_apply(string, str_endswith, pattern, **kwargs)
+
+    if _native_intake(string, "str_endswith"):
+        return _native_apply(string, kernels.endswith(pattern, **kwargs))
+
     string, str_type = _string_intake(string)
     result = string.endswith(pattern, **kwargs)
 
@@ -673,28 +1303,37 @@ def str_endswith(string, pattern, **kwargs):
 # additional methods --------------------------------
 
 
-def str_concat(*args, sep="_", **kwargs):
+def str_concat(*args, sep="_", na_rep=None, na_action="propagate", **kwargs):
     """Concatenate strings or Series with separator.
 
     This function can concatenate:
     1. Multiple strings into a single string
-    2. Multiple pandas Series element-wise
+    2. Multiple pandas Series element-wise, mixed with scalars
     3. Multiple columns from a DataFrame
 
+    Series are joined column by column, without building an intermediate
+    DataFrame, and aligned with the index of the first Series. Scalars are
+    repeated for every row, and values that are not strings are converted with str.
+
     Args:
         *args: Strings or Series to concatenate
             - If first arg is DataFrame, remaining args are treated as column names
-            - If all args are Series, concatenates row-wise
+            - If any arg is a Series, concatenates row-wise
             - If all args are strings, joins with separator
         sep (str, optional): Separator to use between concatenated items. Defaults to '_'.
+        na_rep (str, optional): Replacement for missing values. Defaults to None (use na_action).
+        na_action (str, optional): How missing values are handled if na_rep is None:
+            "propagate" gives NA for the row, "skip" leaves the missing value and its
+            separator out. Defaults to "propagate".
         **kwargs: Additional keyword arguments
 
     Returns:
         str or pd.Series: Concatenated string(s)
 
     Raises:
-        ValueError: If args[0] is DataFrame but not all remaining args are valid column names
-        TypeError: If args are not all strings or all Series
+        ValueError: If args[0] is DataFrame but not all remaining args are valid column names,
+            or if na_action is not "propagate" or "skip"
+        TypeError: If args are not all strings, or Series and scalars
 
     Examples:
         >>> str_concat("hello", "world")
@@ -705,23 +1344,30 @@ def str_concat(*args, sep="_", **kwargs):
         0    a_c
         1    b_d
         dtype: object
+        >>> str_concat("id", pd.Series([1, None, 3]), na_action="skip", sep="-")
+        0    id-1.0
+        1        id
+        2    id-3.0
+        dtype: object
     """
     if isinstance(args[0], pd.DataFrame):
         df = args[0]  # Assume remaining args are columns
         cols = list(args[1:])  # Columns to concatenate
         if not all(col in df.columns for col in cols):
             raise ValueError("All arguments must be column names in the DataFrame")
-        return df[cols].astype(str).agg(sep.join, axis=1)
+        return _concat_columns([df[col] for col in cols], df.index, sep, na_rep, na_action)
 
-    # Check if all arguments are strings or all are Series
-    if all(isinstance(arg, pd.Series) for arg in args):
-        # Concatenate all Series row-wise
-        return pd.concat(args, axis=1).astype(str).agg(sep.join, axis=1)
-    elif all(isinstance(arg, str) for arg in args):
+    # Check if all arguments are strings, or Series mixed with scalars
+    if all(isinstance(arg, str) for arg in args):
         # Join all strings into one string with separator
         return sep.join(args)
 
-    raise TypeError("All arguments must be either all strings or all pandas Series")
+    series = [arg for arg in args if isinstance(arg, pd.Series)]
+    if series and all(isinstance(arg, pd.Series) or pd.api.types.is_scalar(arg) for arg in args):
+        # Concatenate all Series row-wise
+        return _concat_columns(args, series[0].index, sep, na_rep, na_action)
+
+    raise TypeError("All arguments must be either all strings or pandas Series and scalars")
 
 
 def str_dash_to_space(string, dashes=["-", "_"], **kwargs):
@@ -744,8 +1390,9 @@ def str_dash_to_space(string, dashes=["-", "_"], **kwargs):
         1    hello world
         dtype: object
     """
-    if kwargs.get("n", None) is not None:
-        kwargs["count"] = kwargs.pop("n")
+    # Single-character dashes are all replaced in one translation pass
+    if not kwargs and all(isinstance(dash, str) and len(dash) == 1 for dash in dashes):
+        return str_replace_chars(string, dashes, " ")
 
     for dash in dashes:
         string = str_replace(string, dash, " ", **kwargs)
@@ -755,11 +1402,15 @@ def str_dash_to_space(string, dashes=["-", "_"], **kwargs):
 # search + replace methods ----------------------------------
 
 
-def camel_to_snake(string):
+def camel_to_snake(string, dedupe=None, n_jobs=None):
     """Convert camel case string to snake case.
 
     Args:
         string (str, list, or pd.Series): Camel case string or collection
+        dedupe (bool, optional): Compute each unique value once and broadcast the results.
+            Defaults to None (decide from a sample of the input, see set_config).
+        n_jobs (int, optional): Number of worker processes for large inputs.
+            Defaults to None (use the "n_jobs" option, see set_config).
 
     Returns:
         str, list, or pd.Series: Snake case string or collection
@@ -770,20 +1421,27 @@ def camel_to_snake(string):
         >>> camel_to_snake(["helloWorld", "pythonTest"])
         ['hello_world', 'python_test']
     """
-    string, str_type = _series_intake(string)
+    if _categorical_intake(string):
+        return _categorical_apply(string, camel_to_snake)
 
-    def convert(s):
-        return re.sub(r"(?<!^)(?=[A-Z])", "_", s).lower()
+    kernel = kernels.camel_to_snake()
+    if _native_intake(string, "camel_to_snake"):
+        return _native_apply(string, kernel, n_jobs)
 
-    result = string.apply(convert)
+    string, str_type = _series_intake(string)
+    result = _series_apply(string, kernel, dedupe, n_jobs)
     return _string_output(result, str_type)
 
 
-def snake_to_camel(string):
+def snake_to_camel(string, dedupe=None, n_jobs=None):
     """Convert snake case string to camel case.
 
     Args:
         string (str, list, or pd.Series): Snake case string or collection
+        dedupe (bool, optional): Compute each unique value once and broadcast the results.
+            Defaults to None (decide from a sample of the input, see set_config).
+        n_jobs (int, optional): Number of worker processes for large inputs.
+            Defaults to None (use the "n_jobs" option, see set_config).
 
     Returns:
         str, list, or pd.Series: Camel case string or collection
@@ -794,47 +1452,136 @@ def snake_to_camel(string):
         >>> snake_to_camel(["hello_world", "python_test"])
         ['HelloWorld', 'PythonTest']
     """
+    if _categorical_intake(string):
+        return _categorical_apply(string, snake_to_camel)
+
+    kernel = kernels.snake_to_camel()
+    if _native_intake(string, "snake_to_camel"):
+        return _native_apply(string, kernel, n_jobs)
+
     string, str_type = _series_intake(string)
+    result = _series_apply(string, kernel, dedupe, n_jobs)
+    return _string_output(result, str_type)
+
+
+def str_to_case(string, case, dedupe=None, n_jobs=None):
+    """Convert identifiers to snake, camel, pascal, kebab or constant case.
+
+    Words are split at spaces, underscores and hyphens, and at case changes
+    ("parseHTTPResponse" has the words parse, HTTP and Response), so any of these
+    styles can be converted to any other.
+
+    Args:
+        string (str, list, or pd.Series): Input string or collection
+        case (str): Target case. One of:
+            - 'snake': snake_case
+            - 'camel': camelCase
+            - 'pascal': PascalCase
+            - 'kebab': kebab-case
+            - 'constant': CONSTANT_CASE
+        dedupe (bool, optional): Compute each unique value once and broadcast the results.
+            Defaults to None (decide from a sample of the input, see set_config).
+        n_jobs (int, optional): Number of worker processes for large inputs.
+            Defaults to None (use the "n_jobs" option, see set_config).
+
+    Returns:
+        str, list, or pd.Series: Converted string or collection
+
+    Raises:
+        NotImplementedError: If case is not one of the supported options
+
+    Examples:
+        >>> str_to_case("parseHTTPResponse", "snake")
+        'parse_http_response'
+        >>> str_to_case(["user-id", "Max Value"], "constant")
+        ['USER_ID', 'MAX_VALUE']
+    """
+    if case not in kernels._CASES:
+        raise NotImplementedError(f"Implemented case options: {list(kernels._CASES)}.")
+
+    if _categorical_intake(string):
+        return _categorical_apply(string, str_to_case, case)
 
-    def convert(s):
-        return "".join(x.capitalize() or "_" for x in s.split("_"))
+    kernel = kernels.to_case(case)
+    if _native_intake(string, "str_to_case"):
+        return _native_apply(string, kernel, n_jobs)
 
-    result = string.apply(convert)
+    string, str_type = _series_intake(string)
+    result = _series_apply(string, kernel, dedupe, n_jobs)
     return _string_output(result, str_type)
 
 
-def str_search_apply(string, pattern, func, **kwargs):
+def str_search_apply(string, pattern, func, dedupe=None, n_jobs=None, batch=False, memo=False, **kwargs):
     """Apply a function to each regex match in string.
 
+    By default func is called once per match. With batch=True it is called once
+    for the whole input instead: every match is collected into a Series, func
+    maps it to a sequence of replacements (e.g. with Series.map on a lookup table,
+    a model, or another tidystring function), and the results are spliced back.
+
     Args:
-        string (str or pd.Series): Input string or pandas Series
+        string (str, list, or pd.Series): Input string or collection
         pattern (str): Regular expression pattern to match
-        func (callable): Function to apply to each match
+        func (callable): Function to apply to each match, or with batch=True to a Series
+            of all matches. For parallel execution (n_jobs) it must be picklable, e.g.
+            defined at module level rather than a lambda.
+        dedupe (bool, optional): Compute each unique value once and broadcast the results.
+            Defaults to None (decide from a sample of the input, see set_config).
+            Not used with batch=True.
+        n_jobs (int, optional): Number of worker processes for large inputs.
+            Defaults to None (use the "n_jobs" option, see set_config).
+            Not used with batch=True.
+        batch (bool, optional): Call func once on all matches. Defaults to False.
+        memo (bool, optional): Reuse func results for repeated match texts, so func
+            sees each distinct match once (per process). Defaults to False.
         **kwargs: Additional keyword arguments passed to func
 
     Returns:
-        str or pd.Series: String with function applied to each match
+        str, list, or pd.Series: String with function applied to each match
+
+    Raises:
+        ValueError: If func returns a different number of results than matches in batch mode
 
     Examples:
         >>> str_search_apply("hello world", "\\w+", lambda x: x.upper())
         'HELLO WORLD'
         >>> str_search_apply("ab12cd34", "\\d+", lambda x: str(int(x) * 2))
         'ab24cd68'
+        >>> codes = pd.Series({"NY": "New York", "LA": "Los Angeles"})
+        >>> str_search_apply(["NY to LA", "LA"], "[A-Z]{2}", lambda m: m.map(codes), batch=True)
+        ['New York to Los Angeles', 'Los Angeles']
     """
+    if _categorical_intake(string):
+        return _categorical_apply(string, str_search_apply, pattern, func, batch=batch, memo=memo, **kwargs)
+
+    if batch:
+        regex = compile_pattern(pattern)
+        if isinstance(string, (str, list)):
+            result = _batch_search_apply([string] if isinstance(string, str) else string, regex, func, kwargs, memo)
+            return result[0] if isinstance(string, str) else result
+
+        string, str_type = _series_intake(string)
+        result = _batch_search_apply(string.tolist(), regex, func, kwargs, memo)
+        return _string_output(pd.Series(result, index=string.index, name=string.name), str_type)
+
+    kernel = kernels.search_apply(pattern, func, memo, **kwargs)
+    if _native_intake(string, "str_search_apply"):
+        return _native_apply(string, kernel, n_jobs)
+
     string, str_type = _series_intake(string)
     string = string.astype(str)  # convert
 
-    def apply_func(match):
-        return func(match.group(), **kwargs)
-
     # Apply the func to all matches
-    result = string.apply(lambda s: re.sub(pattern, lambda m: apply_func(m), s))
+    result = _series_apply(string, kernel, dedupe, n_jobs)
     return _string_output(result, str_type)
 
 
-def str_search_recase(string, pattern, case):
+def str_search_recase(string, pattern, case, dedupe=None, n_jobs=None):
     """Change the case of text matching a pattern in string.
 
+    Identifier-style conversions (all but lower, upper and title) are memoized
+    per matched token, so tokens repeated across strings are converted once.
+
     Args:
         string (str or pd.Series): Input string or pandas Series
         pattern (str): Regular expression pattern to match
@@ -842,8 +1589,14 @@ def str_search_recase(string, pattern, case):
             - 'lower': Convert to lowercase
             - 'upper': Convert to uppercase
             - 'title': Convert to title case
-            - 'snakecase': Convert to snake_case
-            - 'camelcase': Convert to CamelCase
+            - 'snakecase': Convert camelCase to snake_case
+            - 'camelcase': Convert snake_case to CamelCase
+            - 'pascalcase', 'kebabcase', 'constantcase': Convert to PascalCase,
+              kebab-case or CONSTANT_CASE from any style (see str_to_case)
+        dedupe (bool, optional): Compute each unique value once and broadcast the results.
+            Defaults to None (decide from a sample of the input, see set_config).
+        n_jobs (int, optional): Number of worker processes for large inputs.
+            Defaults to None (use the "n_jobs" option, see set_config).
 
     Returns:
         str or pd.Series: String with case transformation applied to matches
@@ -857,25 +1610,20 @@ def str_search_recase(string, pattern, case):
         >>> str_search_recase("helloWorld", "\\w+", "snakecase")
         'hello_world'
     """
-    case_options = ["lower", "upper", "title", "snakecase", "camelcase"]
+    case_options = list(kernels._RECASE)
 
     if case not in case_options:
         raise NotImplementedError(f"Implemented case options: {case_options}.")
 
-    string, str_type = _series_intake(string)
+    if _categorical_intake(string):
+        return _categorical_apply(string, str_search_recase, pattern, case)
+
+    kernel = kernels.search_recase(pattern, case)
+    if _native_intake(string, "str_search_recase"):
+        return _native_apply(string, kernel, n_jobs)
 
-    def recase(match):
-        if case == "upper":
-            return match.group().upper()
-        elif case == "lower":
-            return match.group().lower()
-        elif case == "title":
-            return match.group().title()
-        elif case == "snakecase":
-            return camel_to_snake(match.group())
-        elif case == "camelcase":
-            return snake_to_camel(match.group())
+    string, str_type = _series_intake(string)
 
     # Apply the recase function to all matches
-    result = string.apply(lambda s: re.sub(pattern, lambda m: recase(m), s))
+    result = _series_apply(string, kernel, dedupe, n_jobs)
     return _string_output(result, str_type)
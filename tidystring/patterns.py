@@ -0,0 +1,422 @@
+"""
+Pattern analysis for tidystring.
+
+This module inspects regular expression patterns before they are run so that
+patterns which are really plain text can be handled by the faster literal
+string operations (``in``, ``str.replace``, ``str.split``, ``startswith``,
+``endswith``) instead of the regex engine. It also holds the compiled-pattern
+cache shared by all tidystring functions.
+"""
+
+import re
+import threading
+from collections import OrderedDict
+from functools import lru_cache
+
+from .config import _config
+from .regex_utils import _trie_pattern, _word_trie
+
+# A run of ordinary characters or backslash-escaped punctuation
+_LITERAL = re.compile(r"(?:\\[^A-Za-z0-9]|[^.^$*+?{}\[\]\\|()])+", re.DOTALL)
+_UNESCAPE = re.compile(r"\\(.)", re.DOTALL)
+
+_KINDS = {
+    (False, False): "literal",
+    (True, False): "prefix",
+    (False, True): "suffix",
+    (True, True): "exact",
+}
+
+
+@lru_cache(maxsize=1024)
+def _classify(pattern):
+    prefix = pattern.startswith("^")
+    body = pattern[1:] if prefix else pattern
+
+    suffix = body.endswith("$") and _LITERAL.fullmatch(body[:-1]) is not None
+    if suffix:
+        body = body[:-1]
+
+    if not _LITERAL.fullmatch(body):
+        return "regex", pattern
+
+    return _KINDS[prefix, suffix], _UNESCAPE.sub(r"\1", body)
+
+
+def classify_pattern(pattern):
+    """
+    Classify a regular expression as a plain or anchored literal.
+
+    Patterns made only of ordinary characters and backslash-escaped punctuation
+    are literals. A leading ``^`` and/or trailing ``$`` around such a literal make
+    it a prefix, suffix, or exact match. Note that ``$`` also matches before a
+    trailing newline, so suffix and exact matches must accept ``literal + "\\n"``.
+
+    Args:
+        pattern (str or re.Pattern): The pattern to classify
+
+    Returns:
+        tuple: (kind, literal)
+            - str: One of "literal", "prefix", "suffix", "exact", or "regex"
+            - str: The unescaped literal text, or the original pattern for "regex"
+
+    Examples:
+        >>> classify_pattern("error")
+        ('literal', 'error')
+        >>> classify_pattern("^GET\\\\ ")
+        ('prefix', 'GET ')
+        >>> classify_pattern("\\\\d+")
+        ('regex', '\\\\d+')
+    """
+    if not isinstance(pattern, str) or not pattern:
+        return "regex", pattern
+    return _classify(pattern)
+
+
+def literal_route(pattern, regex=True, case=True, flags=0):
+    """
+    Decide whether a pattern-based call can run as a literal string operation.
+
+    Args:
+        pattern (str or re.Pattern): The pattern passed to a tidystring function
+        regex (bool, optional): Whether the pattern is a regex. Defaults to True.
+        case (bool, optional): Whether matching is case sensitive. Defaults to True.
+        flags (int, optional): Regex flags. Defaults to 0.
+
+    Returns:
+        tuple: (kind, literal) as returned by classify_pattern, or ("regex", pattern)
+            if the call options rule out a literal route
+    """
+    if not regex or case is False or flags:
+        return "regex", pattern
+    return classify_pattern(pattern)
+
+
+def literal_replace_kwargs(pattern, replacement, kwargs):
+    """
+    Rewrite pandas str.replace arguments so a regex-free pattern runs literally.
+
+    Args:
+        pattern (str or re.Pattern): Pattern passed to str.replace
+        replacement (str or callable): Replacement passed to str.replace
+        kwargs (dict): Remaining keyword arguments for str.replace
+
+    Returns:
+        tuple: (pattern, kwargs) to pass to str.replace instead
+    """
+    if not kwargs.get("regex", False) or not isinstance(replacement, str) or "\\" in replacement:
+        return pattern, kwargs
+
+    kind, literal = literal_route(pattern, True, kwargs.get("case"), kwargs.get("flags", 0))
+    if kind != "literal":
+        return pattern, kwargs
+
+    n = kwargs.get("n", -1)
+    return literal, {**kwargs, "regex": False, "n": n if n > 0 else -1}
+
+
+# Compiled-pattern cache -------------------------------------------
+
+
+class PatternCache:
+    """
+    Least-recently-used cache of compiled regular expressions.
+
+    Unlike the small internal cache of the re module, the size of this cache is
+    set by the "pattern_cache_size" option, and it keeps hit, miss and eviction
+    counters.
+    """
+
+    def __init__(self):
+        self._patterns = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def compile(self, pattern, flags=0):
+        """
+        Return the compiled form of pattern, compiling it on a cache miss.
+
+        Args:
+            pattern (str or re.Pattern): Pattern to compile
+            flags (int, optional): Regex flags. Defaults to 0.
+
+        Returns:
+            re.Pattern: Compiled pattern
+
+        Raises:
+            ValueError: If flags are given with an already compiled pattern
+        """
+        if isinstance(pattern, re.Pattern):
+            if flags:
+                raise ValueError("cannot process flags argument with a compiled pattern")
+            return pattern
+
+        key = (type(pattern), pattern, flags)
+        with self._lock:
+            compiled = self._patterns.get(key)
+            if compiled is not None:
+                self._patterns.move_to_end(key)
+                self.hits += 1
+                return compiled
+
+        compiled = re.compile(pattern, flags)
+        with self._lock:
+            self.misses += 1
+            self._patterns[key] = compiled
+            while len(self._patterns) > max(_config["pattern_cache_size"], 0):
+                self._patterns.popitem(last=False)
+                self.evictions += 1
+        return compiled
+
+    def info(self):
+        """Return a dict with the cache counters, current size and maximum size."""
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "size": len(self._patterns),
+            "maxsize": _config["pattern_cache_size"],
+        }
+
+    def clear(self):
+        """Remove all cached patterns and reset the counters."""
+        with self._lock:
+            self._patterns.clear()
+            self.hits = self.misses = self.evictions = 0
+
+
+_cache = PatternCache()
+
+
+def compile_pattern(pattern, flags=0):
+    """
+    Compile a regular expression through the tidystring pattern cache.
+
+    Args:
+        pattern (str or re.Pattern): Pattern to compile. Compiled patterns are returned as is.
+        flags (int, optional): Regex flags. Defaults to 0.
+
+    Returns:
+        re.Pattern: Compiled pattern
+
+    Examples:
+        >>> compile_pattern("\\d+").pattern
+        '\\d+'
+    """
+    return _cache.compile(pattern, flags)
+
+
+def pattern_cache_info():
+    """
+    Return statistics for the tidystring compiled-pattern cache.
+
+    Returns:
+        dict: Counts of hits, misses and evictions, plus the current and maximum size
+
+    Examples:
+        >>> sorted(pattern_cache_info())
+        ['evictions', 'hits', 'maxsize', 'misses', 'size']
+    """
+    return _cache.info()
+
+
+def clear_pattern_cache():
+    """
+    Empty the tidystring compiled-pattern cache and reset its statistics.
+    """
+    _cache.clear()
+
+
+def precompile_kwargs(pattern, kwargs, case_default=True):
+    """
+    Compile a pattern for a pandas str method, folding case and flags into it.
+
+    pandas rejects case and flags alongside a compiled pattern, so they are
+    removed from kwargs and applied when compiling instead.
+
+    Args:
+        pattern (str or re.Pattern): Pattern passed to a tidystring function
+        kwargs (dict): Keyword arguments for the pandas str method
+        case_default (bool, optional): Default of the method's case argument. Defaults to True.
+
+    Returns:
+        tuple: (compiled pattern, remaining kwargs)
+    """
+    kwargs = dict(kwargs)
+    flags = kwargs.pop("flags", 0)
+    if kwargs.pop("case", case_default) is False:
+        flags |= re.IGNORECASE
+    return compile_pattern(pattern, flags), kwargs
+
+
+# Combined patterns ------------------------------------------------
+
+# Numbered group references (\1, \g<1>) and other escapes, in patterns and templates
+_GROUP_REF = re.compile(r"\\(?:g<(\d+)>|([1-9]\d?))|\\.", re.DOTALL)
+
+_SCOPED_FLAGS = ((re.IGNORECASE, "i"), (re.MULTILINE, "m"), (re.DOTALL, "s"), (re.VERBOSE, "x"))
+
+
+def _shift_groups(text, offset, template=False):
+    """Renumber group references in a pattern or replacement template by offset."""
+
+    def shift(match):
+        group = match.group(1) or match.group(2)
+        if group is None:
+            return match.group()
+        if match.group(1) is not None or template:
+            return f"\\g<{int(group) + offset}>"
+        return f"(?:\\{int(group) + offset})"
+
+    return _GROUP_REF.sub(shift, text)
+
+
+def _pattern_source(pattern):
+    """Return the source of a pattern, with a compiled pattern's flags scoped inline."""
+    if not isinstance(pattern, re.Pattern):
+        return pattern
+    letters = "".join(letter for flag, letter in _SCOPED_FLAGS if pattern.flags & flag)
+    return f"(?{letters}:{pattern.pattern})" if letters else pattern.pattern
+
+
+def combine_patterns(replacements, regex=False, case=True, flags=0):
+    """
+    Compile a pattern-to-replacement mapping into one alternation and a dispatch table.
+
+    Patterns are tried in mapping order at each position, so when several could
+    match at the same position, the one listed first wins. Case-sensitive literal
+    patterns, if none is a prefix of another, are factored into a prefix trie. In
+    regex mode and case-insensitive literal mode each pattern is wrapped in a
+    capturing group, the group that matched selects the replacement, and numbered group references in patterns and replacement
+    templates are renumbered to the combined pattern.
+
+    Args:
+        replacements (dict): Mapping of pattern to replacement string
+        regex (bool, optional): Whether patterns are regular expressions. Defaults to False.
+        case (bool, optional): Whether matching is case sensitive. Defaults to True.
+        flags (int, optional): Regex flags. Defaults to 0.
+
+    Returns:
+        tuple: (compiled pattern, table)
+            - re.Pattern: Combined pattern
+            - dict or list: Replacement by matched text (case-sensitive literal mode),
+              replacement by group index (case-insensitive literal mode), or
+              (replacement, is_template) by group index (regex mode)
+
+    Raises:
+        TypeError: If a replacement is not a string
+
+    Examples:
+        >>> combined, table = combine_patterns({"a": "1", "b": "2"})
+        >>> combined.pattern, table
+        ('[ab]', {'a': '1', 'b': '2'})
+    """
+    for replacement in replacements.values():
+        if not isinstance(replacement, str):
+            raise TypeError(f"Replacements must be strings, got {type(replacement).__name__}")
+    if case is False:
+        flags |= re.IGNORECASE
+
+    if not regex and case is False:
+        # Case-insensitive matches can differ from every key even after lowering
+        # (e.g. "ſ" matches "s"), so the group that matched selects the replacement
+        alternation = "|".join(f"({re.escape(pattern)})" for pattern in replacements)
+        return compile_pattern(alternation or "(?!)", flags), [None, *replacements.values()]
+
+    if not regex:
+        table = dict(replacements)
+        keys = sorted(table)
+        if keys and all(not b.startswith(a) for a, b in zip(keys, keys[1:])) and keys[0]:
+            # No key is a prefix of another, so at most one key can match at any
+            # position and a prefix trie gives the same result as the alternation
+            alternation = _trie_pattern(_word_trie(keys))
+        else:
+            alternation = "|".join(re.escape(pattern) for pattern in replacements)
+        return compile_pattern(alternation or "(?!)", flags), table
+
+    parts = []
+    table = [None]
+    for pattern, replacement in replacements.items():
+        source = _pattern_source(pattern)
+        offset = len(table)
+        parts.append(f"({_shift_groups(source, offset)})")
+        template = "\\" in replacement
+        table.append((_shift_groups(replacement, offset, template=True) if template else replacement, template))
+        table.extend([None] * compile_pattern(source).groups)
+    return compile_pattern("|".join(parts) or "(?!)", flags), table
+
+
+# Pattern counting -------------------------------------------------
+
+
+def _uncombinable_literals(literals):
+    """Return the literals that a combined lookahead scan would miscount.
+
+    The combined scan reports, at each position, the longest literal starting
+    there. That misses a literal that is a proper prefix of another one, and
+    counts overlapping occurrences of a literal with a border (a proper suffix
+    that is also a prefix, as in "abab"), which str.count would skip.
+    """
+    literals = set(literals)
+    prefixes = {literal[:end] for literal in literals for end in range(1, len(literal))}
+    return {
+        literal
+        for literal in literals
+        if literal in prefixes or any(literal.startswith(literal[start:]) for start in range(1, len(literal)))
+    }
+
+
+def combine_counters(patterns, case=True, flags=0):
+    """
+    Plan how to count many patterns in as few scans as possible.
+
+    Literal patterns are combined into one alternation inside a lookahead, so
+    the scan finds every position where a literal starts, even inside another
+    match; the matched text is looked up in a table. Without case sensitivity,
+    each literal is its own group instead, and only ASCII literals are combined,
+    since text such as "ſ" matches "s" but does not lowercase to it. Literals
+    that the scan would miscount (see _uncombinable_literals), non-ASCII literals
+    if case insensitive, and regexes are counted separately.
+
+    Args:
+        patterns (list): Distinct patterns to count
+        case (bool, optional): Whether matching is case sensitive. Defaults to True.
+        flags (int, optional): Regex flags other than re.IGNORECASE. Any flag rules
+            out the literal scan. Defaults to 0.
+
+    Returns:
+        tuple: (scans, separate)
+            - list: (combined pattern, table) pairs, where the table maps the text of
+              group 1 to a column, or if case insensitive, lists the column of each group
+            - list: Columns of the patterns left to count separately
+    """
+    literals = {}
+    separate = []
+    for i, pattern in enumerate(patterns):
+        kind, literal = literal_route(pattern, True, True, flags)
+        if kind == "literal" and case is not False:
+            literals[i] = literal
+        elif kind == "literal" and literal.isascii():
+            # ASCII literals that are equal when lowercased match the same text
+            literals[i] = literal.lower()
+        else:
+            separate.append(i)
+
+    uncombinable = _uncombinable_literals(literals.values())
+    table = {}
+    for i, literal in literals.items():
+        if literal in uncombinable or literal in table:
+            separate.append(i)
+        else:
+            table[literal] = i
+
+    scans = []
+    if table and case is False:
+        alternation, _ = combine_patterns(dict.fromkeys(table, ""), False, case)
+        scans.append((compile_pattern(f"(?={alternation.pattern})", alternation.flags), [None, *table.values()]))
+    elif table:
+        alternation, _ = combine_patterns(dict.fromkeys(table, ""), False, case)
+        scans.append((compile_pattern(f"(?=({alternation.pattern}))", alternation.flags), table))
+    return scans, sorted(separate)
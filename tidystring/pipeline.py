@@ -0,0 +1,271 @@
+"""
+Lazy, fused transformation pipelines for tidystring.
+
+A Pipeline records a sequence of tidystring function calls without running
+them. When applied, the steps are fused into a single per-string function, so
+the input is traversed once and no intermediate Series are built.
+"""
+
+import re
+from functools import partial
+
+from . import kernels
+from . import methods
+from .streaming import stream
+from .handlers import (
+    _categorical_apply,
+    _categorical_intake,
+    _native_apply,
+    _series_apply,
+    _series_intake,
+    _string_output,
+)
+
+# Kernel builders -------------------------------------------------
+# Each builder takes the arguments of the tidystring function (minus the
+# string) and returns the same per-string kernel that function would use.
+
+
+def _replace_kernel(pattern, replacement, n=None, **kwargs):
+    if n is not None:
+        kwargs["n"] = n
+    if isinstance(pattern, re.Pattern):
+        kwargs.setdefault("regex", True)
+    return kernels.replace(pattern, replacement, **kwargs)
+
+
+def _remove_kernel(pattern, **kwargs):
+    if isinstance(pattern, re.Pattern):
+        kwargs.setdefault("regex", True)
+    return kernels.remove(pattern, **kwargs)
+
+
+def _search_apply_kernel(pattern, func, batch=False, memo=False, **kwargs):
+    if batch:
+        raise ValueError("str_search_apply(batch=True) needs the whole input and cannot be fused")
+    return kernels.search_apply(pattern, func, memo, **kwargs)
+
+
+def _search_recase_kernel(pattern, case):
+    case_options = list(kernels._RECASE)
+    if case not in case_options:
+        raise NotImplementedError(f"Implemented case options: {case_options}.")
+    return kernels.search_recase(pattern, case)
+
+
+_BUILDERS = {
+    "str_detect": kernels.detect,
+    "str_detect_any": kernels.detect_any,
+    "str_which_keyword": kernels.which_keyword,
+    "str_replace": _replace_kernel,
+    "str_remove": _remove_kernel,
+    "str_replace_all": kernels.replace_all,
+    "str_translate": kernels.translate,
+    "str_replace_chars": kernels.replace_chars,
+    "str_split": lambda pattern, maxsplit=-1: kernels.split(pattern, n=maxsplit),
+    "str_trim": kernels.trim,
+    "str_length": kernels.length,
+    "str_sub": lambda start=0, end=None, **kwargs: kernels.sub(start=start, stop=end, **kwargs),
+    "str_count": kernels.count,
+    "str_locate_all": lambda pattern: kernels.locate_all(pattern),
+    "str_pad": lambda width, side="both", pad=" ": kernels.pad(width, side=side, pad=pad),
+    "str_dup": kernels.dup,
+    "str_squish": lambda: kernels.squish(),
+    "str_wrap": lambda width=80, indent=0, exdent=0: kernels.wrap(width, indent, exdent),
+    "str_to_title": kernels.to_title,
+    "str_to_upper": kernels.to_upper,
+    "str_to_lower": kernels.to_lower,
+    "str_upper_cut": lambda n=1: kernels.upper_cut(n),
+    "str_startswith": kernels.startswith,
+    "str_endswith": kernels.endswith,
+    "camel_to_snake": kernels.camel_to_snake,
+    "snake_to_camel": kernels.snake_to_camel,
+    "str_to_case": kernels.to_case,
+    "str_search_apply": _search_apply_kernel,
+    "str_search_recase": _search_recase_kernel,
+}
+
+# Functions that take several strings rather than transform one
+_EXCLUDED = {"str_concat"}
+
+# Execution options of the eager functions; a pipeline takes them when applied
+_EXECUTION_OPTIONS = ("dedupe", "n_jobs")
+
+# Options that shape the result for the whole input, with the default that fuses
+_WHOLE_INPUT_OPTIONS = {
+    "str_split": {"output": "list", "expand": False},
+    "str_locate_all": {"output": "list"},
+}
+
+
+def _call_step(func, args, kwargs, s):
+    return func(s, *args, **kwargs)
+
+
+def _run_steps(steps, value):
+    if not isinstance(value, str):
+        return value  # missing values pass through untouched
+    for step in steps:
+        value = step(value)
+    return value
+
+
+def _step_kernel(func, args, kwargs):
+    """Return the per-string kernel for one recorded step."""
+    name = getattr(func, "__name__", None)
+    if getattr(methods, name or "", None) is func and name in _BUILDERS:
+        kwargs = {key: value for key, value in kwargs.items() if key not in _EXECUTION_OPTIONS}
+        for option, default in _WHOLE_INPUT_OPTIONS.get(name, {}).items():
+            value = kwargs.pop(option, default)
+            if value != default:
+                raise ValueError(f"{name}({option}={value!r}) needs the whole input and cannot be fused")
+        return _BUILDERS[name](*args, **kwargs)
+    return partial(_call_step, func, args, kwargs)
+
+
+class Pipeline:
+    """
+    A lazy sequence of tidystring transformations, fused into one pass.
+
+    Steps are recorded by calling tidystring function names as methods (without
+    the string argument), or with then(). Nothing runs until the pipeline is
+    applied to a string, list, or Series, at which point every step is applied
+    to each element in turn. Pipelines are immutable: each step returns a new
+    Pipeline, so a shared prefix can be reused.
+
+    Any callable taking a string as its first argument can be used as a step;
+    tidystring functions are compiled to the same kernels they use internally.
+    Missing values are passed through unchanged.
+
+    Args:
+        steps (iterable, optional): Initial (func, args, kwargs) steps. Defaults to ().
+
+    Examples:
+        >>> clean = Pipeline().str_trim().str_to_lower().str_replace("-", " ").str_squish()
+        >>> clean("  Hello-World  ")
+        'hello world'
+        >>> pd.Series(["  A-B ", "c--d"]).pipe(clean)
+        0    a b
+        1    c d
+        dtype: object
+    """
+
+    def __init__(self, steps=()):
+        self.steps = tuple(steps)
+
+    def then(self, func, *args, **kwargs):
+        """
+        Return a new Pipeline with func appended as a step.
+
+        Args:
+            func (callable): tidystring function, or any function taking a string first
+            *args: Positional arguments for func, after the string
+            **kwargs: Keyword arguments for func
+
+        Returns:
+            Pipeline: Extended pipeline
+        """
+        return Pipeline(self.steps + ((func, args, kwargs),))
+
+    def __getattr__(self, name):
+        if name.startswith("_") or name in _EXCLUDED:
+            raise AttributeError(name)
+        func = getattr(methods, name, None)
+        if not callable(func) or not (name.startswith("str_") or name in _BUILDERS):
+            raise AttributeError(f"'Pipeline' object has no attribute '{name}'")
+        return partial(self.then, func)
+
+    def __len__(self):
+        return len(self.steps)
+
+    def __repr__(self):
+        names = [getattr(func, "__name__", repr(func)) for func, _, _ in self.steps]
+        return f"Pipeline({' -> '.join(names)})"
+
+    def kernel(self):
+        """
+        Build the fused per-string function for this pipeline.
+
+        Returns:
+            callable: Picklable function applying every step to one string
+
+        Raises:
+            ValueError: If a step needs the whole input, e.g. str_split(output="ragged")
+        """
+        return partial(_run_steps, tuple(_step_kernel(*step) for step in self.steps))
+
+    def __call__(self, string, dedupe=None, n_jobs=None):
+        """
+        Apply the pipeline in a single pass.
+
+        Args:
+            string (str, list, or pd.Series): Input string or collection
+            dedupe (bool, optional): Compute each unique value once and broadcast the results.
+                Defaults to None (decide from a sample of the input, see set_config).
+            n_jobs (int, optional): Number of worker processes for large inputs.
+                Defaults to None (use the "n_jobs" option, see set_config).
+
+        Returns:
+            Result of the last step, in the same type as the input
+        """
+        kernel = self.kernel()
+        if isinstance(string, str):
+            return kernel(string)
+        if isinstance(string, list):
+            return _native_apply(string, kernel, n_jobs)
+
+        if _categorical_intake(string):
+            return _categorical_apply(string, self)
+
+        string, str_type = _series_intake(string)
+        result = _series_apply(string, kernel, dedupe, n_jobs)
+        return _string_output(result, str_type)
+
+    def stream(self, iterable, chunksize=None, dedupe=None, n_jobs=None):
+        """
+        Apply the pipeline to an iterable of strings, yielding results lazily.
+
+        Args:
+            iterable (iterable): Strings to process, e.g. a generator or the lines of a file
+            chunksize (int, optional): Number of strings per chunk. Defaults to None
+                (use the "stream_chunksize" option, see set_config).
+            dedupe (bool, optional): Deduplicate each chunk. Defaults to None.
+            n_jobs (int, optional): Number of worker processes per chunk. Defaults to None.
+
+        Yields:
+            Result of the last step for each string, in input order
+
+        Examples:
+            >>> clean = Pipeline().str_trim().str_to_lower()
+            >>> list(clean.stream(iter([" A ", "B"]), chunksize=1))
+            ['a', 'b']
+        """
+        return stream(self, iterable, chunksize=chunksize, dedupe=dedupe, n_jobs=n_jobs)
+
+
+def chain(*steps):
+    """
+    Build a Pipeline from a sequence of steps.
+
+    Args:
+        *steps: Each step is a function, or a tuple (func, *args) whose last element
+            may be a dict of keyword arguments
+
+    Returns:
+        Pipeline: Pipeline running the steps in order
+
+    Examples:
+        >>> clean = chain(str_trim, str_to_lower, (str_replace, " - ", ": "), (str_pad, 8, {"side": "left"}))
+        >>> clean(["  A - 1 ", "B - 22"])
+        ['    a: 1', '   b: 22']
+    """
+    pipeline = Pipeline()
+    for step in steps:
+        if callable(step):
+            pipeline = pipeline.then(step)
+            continue
+
+        func, *args = step
+        kwargs = args.pop() if args and isinstance(args[-1], dict) else {}
+        pipeline = pipeline.then(func, *args, **kwargs)
+    return pipeline
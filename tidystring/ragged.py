@@ -0,0 +1,186 @@
+"""
+Ragged results for tidystring.
+
+Functions such as str_locate_all and str_split return a variable number of
+items per string. By default these come back as one Python list per string,
+which for large inputs means many small objects. A RaggedArray instead keeps
+all items in one flat array and marks where each row starts with offsets, in
+the layout of an Arrow ListArray.
+"""
+
+from array import array
+
+import numpy as np
+import pandas as pd
+
+
+class RaggedArray:
+    """
+    Variable-length rows stored as a flat values array and row offsets.
+
+    Row i holds values[offsets[i]:offsets[i + 1]]. Rows for missing input
+    values are empty and flagged in mask.
+
+    Args:
+        values (np.ndarray): Items of all rows, concatenated. Two-dimensional if each
+            item has several fields (e.g. start and end positions).
+        offsets (np.ndarray): int64 array of length n + 1 with the start of each row
+        mask (np.ndarray, optional): Boolean array, True for missing rows. Defaults to None.
+        index (pd.Index, optional): Row labels. Defaults to None (a RangeIndex).
+        name (str, optional): Name of the rows, as for a Series. Defaults to None.
+        columns (list, optional): Names of the item fields, used by explode(). Defaults
+            to None ("value", or "value_0", "value_1", ... for several fields).
+
+    Examples:
+        >>> ragged = str_locate_all(["aba", "b"], "a", output="ragged")
+        >>> ragged.offsets
+        array([0, 2, 2])
+        >>> ragged[0]
+        array([[0, 1],
+               [2, 3]], dtype=int32)
+        >>> ragged.tolist()
+        [[[0, 1], [2, 3]], []]
+    """
+
+    def __init__(self, values, offsets, mask=None, index=None, name=None, columns=None):
+        self.values = values
+        self.offsets = np.asarray(offsets, dtype=np.int64)
+        size = len(self.offsets) - 1
+        self.mask = np.zeros(size, dtype=bool) if mask is None else np.asarray(mask, dtype=bool)
+        self.index = pd.RangeIndex(size) if index is None else index
+        self.name = name
+        if columns is None:
+            width = values.shape[1] if values.ndim > 1 else 1
+            columns = ["value"] if width == 1 else [f"value_{i}" for i in range(width)]
+        self.columns = list(columns)
+
+    def __len__(self):
+        return len(self.offsets) - 1
+
+    def __getitem__(self, i):
+        """Return row i (a position, not an index label) as a view of values."""
+        size = len(self)
+        if not -size <= i < size:
+            raise IndexError(f"Row {i} is out of range for {size} rows")
+        i %= size
+        return self.values[self.offsets[i] : self.offsets[i + 1]]
+
+    def __iter__(self):
+        for i in range(len(self)):
+            yield self[i]
+
+    def __repr__(self):
+        return f"RaggedArray({len(self)} rows, {len(self.values)} values, dtype={self.values.dtype})"
+
+    @property
+    def lengths(self):
+        """np.ndarray: Number of items in each row."""
+        return np.diff(self.offsets)
+
+    @property
+    def nbytes(self):
+        """int: Memory used by the values, offsets and mask arrays."""
+        return self.values.nbytes + self.offsets.nbytes + self.mask.nbytes
+
+    def tolist(self):
+        """
+        Convert to one list per row, as returned with the default output.
+
+        Returns:
+            list: A list per row, or NaN for missing rows
+        """
+        flat = self.values.tolist()
+        bounds = self.offsets.tolist()
+        rows = [flat[start:end] for start, end in zip(bounds, bounds[1:])]
+        for i in np.flatnonzero(self.mask).tolist():
+            rows[i] = np.nan
+        return rows
+
+    def to_series(self):
+        """
+        Convert to a Series of lists, as returned with the default output.
+
+        Returns:
+            pd.Series: Lists of items, with the row index and name
+        """
+        return pd.Series(self.tolist(), index=self.index, name=self.name, dtype=object)
+
+    def explode(self):
+        """
+        Convert to a long DataFrame with one row per item.
+
+        The row index is repeated for each item; empty and missing rows are left out.
+
+        Returns:
+            pd.DataFrame: Item fields as columns, indexed by row label
+
+        Examples:
+            >>> str_locate_all(pd.Series(["aba", "b"]), "a", output="ragged").explode()
+               start  end
+            0      0    1
+            0      2    3
+        """
+        index = self.index.repeat(self.lengths)
+        values = self.values[self.offsets[0] : self.offsets[-1]]
+        if values.ndim == 1:
+            values = values.reshape(-1, 1)
+        return pd.DataFrame(values, index=index, columns=self.columns)
+
+
+def _ragged_output(output):
+    """Return True if a function's output argument asks for a RaggedArray.
+
+    Raises:
+        ValueError: If output is not "list" or "ragged"
+    """
+    if output not in ("list", "ragged"):
+        raise ValueError(f"output must be 'list' or 'ragged', got {output!r}")
+    return output == "ragged"
+
+
+def _ragged_apply(string, kernel, dtype=object, width=1, columns=None):
+    """Apply a kernel returning a flat sequence per string, into a RaggedArray.
+
+    Args:
+        string (str, list, or pd.Series): Input string or collection
+        kernel (callable): Function returning a list of items (width values each) per string
+        dtype (type, optional): numpy dtype of the values, int32 or object. Defaults to object.
+        width (int, optional): Number of values per item. Defaults to 1.
+        columns (list, optional): Names of the item fields. Defaults to None.
+
+    Returns:
+        RaggedArray: One row per input string
+    """
+    index = name = None
+    if isinstance(string, str):
+        string = [string]
+    elif isinstance(string, pd.Series):
+        index, name = string.index, string.name
+        string = string.tolist()
+
+    flat = array("i") if dtype == np.int32 else []
+    extend = flat.extend
+    ends = [0]
+    missing = []
+
+    for i, value in enumerate(string):
+        if isinstance(value, str):
+            extend(kernel(value))
+        else:
+            missing.append(i)
+        ends.append(len(flat))
+
+    offsets = np.array(ends, dtype=np.int64)
+    mask = np.zeros(len(string), dtype=bool)
+    mask[missing] = True
+
+    if dtype == np.int32:
+        values = np.frombuffer(flat, dtype=np.int32) if flat else np.zeros(0, dtype=np.int32)
+    else:
+        values = np.empty(len(flat), dtype=object)
+        values[:] = flat
+    if width > 1:
+        values = values.reshape(-1, width)
+        offsets //= width
+
+    return RaggedArray(values, offsets, mask, index, name, columns)
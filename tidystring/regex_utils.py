@@ -415,12 +415,57 @@ def re_ends_with(pattern):
     return f"{pattern}$"
 
 
-def re_word_list(words):
+def _word_trie(words):
+    """Build a character trie of words; the key "" marks the end of a word."""
+    root = {}
+    for word in words:
+        node = root
+        for char in word:
+            node = node.setdefault(char, {})
+        node[""] = True
+    return root
+
+
+def _trie_pattern(node):
+    """Convert a trie node into a regex matching the suffixes stored below it."""
+    optional = "" in node
+    singles = []
+    branches = []
+    for char in sorted(key for key in node if key):
+        child = node[char]
+        if len(child) == 1 and "" in child:
+            singles.append(re_literal(char))
+        else:
+            branches.append(re_literal(char) + _trie_pattern(child))
+
+    # Single-character leaves collapse into one character class
+    if len(singles) == 1:
+        branches.append(singles[0])
+    elif singles:
+        branches.append(f"[{''.join(singles)}]")
+
+    if not branches:
+        return ""
+
+    if len(branches) == 1 and not optional:
+        return branches[0]
+    if len(branches) == 1 and singles:
+        # A lone character or character class takes a quantifier directly
+        return f"{branches[0]}?"
+    return f"(?:{re_or(*branches)}){'?' if optional else ''}"
+
+
+def re_word_list(words, optimize=False):
     """
     Create a pattern matching any word from a list of words.
 
     Args:
         words (list): List of words to match
+        optimize (bool, optional): Factor the words into a prefix trie, producing nested
+            non-capturing groups and character classes instead of a flat alternation.
+            The pattern matches the same words but compiles and matches much faster for
+            long word lists. Where several words match at the same position, the longest
+            one is matched. Defaults to False.
 
     Returns:
         str: Pattern matching any of the provided words
@@ -428,7 +473,12 @@ def re_word_list(words):
     Examples:
         >>> re_word_list(['cat', 'dog', 'bird'])
         '\\b(cat|dog|bird)\\b'
+        >>> re_word_list(['cat', 'cats', 'car', 'dog'], optimize=True)
+        '\\b((?:ca(?:ts?|r)|dog))\\b'
     """
+    if optimize:
+        return f"\\b({_trie_pattern(_word_trie(words))})\\b"
+
     escaped_words = [re_literal(word) for word in words]
     return f"\\b({re_or(*escaped_words)})\\b"
 
@@ -0,0 +1,104 @@
+"""
+Streaming execution for tidystring.
+
+tidystring functions take a whole str, list or Series. To process inputs that
+do not fit in memory, such as the lines of a large file, the functions in this
+module read any iterable of strings in fixed-size chunks, run each chunk as a
+Series through the usual vectorized path, and yield the results lazily. Only
+one chunk and its result are held at a time.
+"""
+
+from itertools import islice
+
+import numpy as np
+import pandas as pd
+
+from .config import _config
+from .ragged import RaggedArray
+
+
+def _chunk_items(result):
+    """Split the result for one chunk into one item per input string."""
+    if isinstance(result, pd.Series):
+        return result.tolist()
+    if isinstance(result, pd.DataFrame):
+        return result.itertuples(index=False, name=None)
+    if isinstance(result, (np.ndarray, RaggedArray)):
+        return result.tolist()
+    return result
+
+
+def stream_chunks(func, iterable, *args, chunksize=None, **kwargs):
+    """
+    Apply a tidystring function to an iterable of strings, one chunk at a time.
+
+    Each chunk is passed to func as a Series whose index continues from the
+    previous chunk, so results can be told apart by position.
+
+    Args:
+        func (callable): tidystring function or Pipeline, taking a Series first
+        iterable (iterable): Strings to process, e.g. a generator or the lines of a file
+        *args: Positional arguments for func, after the strings
+        chunksize (int, optional): Number of strings per chunk. Defaults to None
+            (use the "stream_chunksize" option, see set_config).
+        **kwargs: Keyword arguments for func
+
+    Yields:
+        Result of func for each chunk (a Series, DataFrame, array, ...)
+
+    Raises:
+        ValueError: If chunksize is less than 1
+
+    Examples:
+        >>> for counts in stream_chunks(str_count, ["a", "aa", "b"], "a", chunksize=2):
+        ...     print(counts.tolist())
+        [1, 2]
+        [0]
+    """
+    chunksize = _config["stream_chunksize"] if chunksize is None else chunksize
+    if chunksize < 1:
+        raise ValueError(f"chunksize must be at least 1, got {chunksize}")
+
+    iterator = iter(iterable)
+    start = 0
+    while True:
+        values = list(islice(iterator, chunksize))
+        if not values:
+            return
+        chunk = pd.Series(values, index=pd.RangeIndex(start, start + len(values)))
+        start += len(values)
+        yield func(chunk, *args, **kwargs)
+
+
+def stream(func, iterable, *args, chunksize=None, **kwargs):
+    """
+    Apply a tidystring function to an iterable of strings, yielding one result per string.
+
+    The input is processed in chunks (see stream_chunks), so memory use is bounded
+    by the chunk size rather than the input size. Results are the elements of what
+    func returns for a Series: a value per string, or a tuple of column values for
+    functions returning a DataFrame.
+
+    Args:
+        func (callable): tidystring function or Pipeline, taking a Series first
+        iterable (iterable): Strings to process, e.g. a generator or the lines of a file
+        *args: Positional arguments for func, after the strings
+        chunksize (int, optional): Number of strings per chunk. Defaults to None
+            (use the "stream_chunksize" option, see set_config).
+        **kwargs: Keyword arguments for func
+
+    Yields:
+        Result of func for each string, in input order
+
+    Raises:
+        ValueError: If chunksize is less than 1
+
+    Examples:
+        >>> with open("app.log") as f:
+        ...     lines = (line.rstrip("\\n") for line in f)
+        ...     errors = sum(stream(str_detect, lines, "ERROR"))
+        >>> list(stream(str_split_fixed, ["a-b", "c"], "-", 2))
+        [('a', 'b'), ('c', nan)]
+    """
+    for result in stream_chunks(func, iterable, *args, chunksize=chunksize, **kwargs):
+        yield from _chunk_items(result)